@@ -33,6 +33,7 @@ setup(
     ],
     entry_points={"console_scripts": ["torque=torque.shell:main"]},
     install_requires=required,
+    extras_require={"brotli": ["brotli"], "http2": ["httpx[http2]"]},
     keywords="torque sandbox cloud cloudshell quali command-line cli",
     python_requires=">=3.6",
 )
@@ -0,0 +1,65 @@
+"""
+Compares transfer of a 20 MB blueprint catalog with and without response compression over a simulated slow link.
+
+Run with: python -m unittest discover -s tests/benchmarks -t . -p "bench_compression.py"
+"""
+
+import time
+import unittest
+
+from tests.helpers.local_server import LocalServer, create_client
+from torque.models.blueprints import BlueprintsManager
+
+CATALOG_SIZE = 20 * 1024 * 1024
+# 100 Mbit/s
+BANDWIDTH = 12_500_000
+
+
+def build_catalog(size: int) -> list:
+    description = "Blueprint of a development environment with several applications and services. " * 10
+    blueprint_size = len(description) + 200
+    return [
+        {
+            "blueprint_name": f"blueprint-{i}",
+            "url": f"https://example.com/blueprints/{i}",
+            "enabled": True,
+            "description": description,
+            "errors": [],
+        }
+        for i in range(size // blueprint_size)
+    ]
+
+
+class CompressionBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.catalog = build_catalog(CATALOG_SIZE)
+
+    def _fetch_catalog(self, gzip_responses: bool) -> float:
+        with LocalServer(self.catalog, gzip_responses=gzip_responses, bandwidth=BANDWIDTH) as server:
+            client = create_client(server.host)
+            manager = BlueprintsManager(client)
+
+            start = time.perf_counter()
+            result = manager.list_detailed()
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(result), len(self.catalog))
+        return elapsed
+
+    def test_compressed_catalog_transfer(self):
+        encoder = LocalServer(self.catalog)
+        plain_size = len(encoder.get_encoded_body(False))
+        gzip_size = len(encoder.get_encoded_body(True))
+        encoder.server_close()
+
+        plain = self._fetch_catalog(gzip_responses=False)
+        compressed = self._fetch_catalog(gzip_responses=True)
+
+        print(f"\nidentity: {plain_size} bytes in {plain:.2f} sec")
+        print(f"gzip:     {gzip_size} bytes in {compressed:.2f} sec ({plain / compressed:.1f}x faster)")
+        self.assertLess(compressed, plain)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Measures argument parsing latency per command with docopt and with the cached usage grammar, in a warm process and
+in a new process (grammar loaded from the pickle on disk).
+
+Run with: python -m unittest discover -s tests/benchmarks -t . -p "bench_docopt.py"
+"""
+
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import docopt as docopt_module
+
+from torque import shell
+from torque.commands.bp import BlueprintsCommand
+from torque.commands.configure import ConfigureCommand
+from torque.commands.sb import SandboxesCommand
+from torque.parsers.docopt_cache import GrammarCache, docopt
+
+ITERATIONS = 500
+
+COMMANDS = [
+    ("torque", shell.__doc__, ["--space=space", "sb", "list"], {"options_first": True}),
+    ("sb start", SandboxesCommand.__doc__, ["sb", "start", "bp", "-d", "10", "-i", "a=1", "-w"], {}),
+    ("sb list", SandboxesCommand.__doc__, ["sb", "list", "--filter=my", "--count=5"], {}),
+    ("bp validate", BlueprintsCommand.__doc__, ["bp", "validate", "bp1", "-b", "main"], {}),
+    ("configure list", ConfigureCommand.__doc__, ["configure", "list"], {}),
+]
+
+
+def measure(parse) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        parse()
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+class DocoptBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def test_parse_latency(self):
+        print()
+        for name, doc, argv, kwargs in COMMANDS:
+            plain = measure(lambda: docopt_module.docopt(doc, argv=argv, **kwargs))
+
+            GrammarCache(self.cache_dir).get(doc)
+            # every iteration starts with an empty memory cache, like a new CLI process
+            from_disk = measure(lambda: GrammarCache(self.cache_dir).get(doc))
+
+            with patch("torque.parsers.docopt_cache.grammar_cache", GrammarCache(self.cache_dir)):
+                cached = measure(lambda: docopt(doc, argv=argv, **kwargs))
+
+            self.assertLess(from_disk, plain)
+            print(
+                f"  {name:<15} docopt: {plain:.3f} ms, cached: {cached:.3f} ms, "
+                f"grammar from disk: {from_disk:.3f} ms"
+            )
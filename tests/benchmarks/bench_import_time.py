@@ -0,0 +1,29 @@
+"""
+Measures the time the CLI spends importing modules per command, from python -X importtime, against a budget.
+
+Budgets (in milliseconds) are a few times the measured time so they only catch regressions, e.g. a heavy
+dependency imported at module level again.
+
+Run with: python -m unittest discover -s tests/benchmarks -t . -p "bench_import_time.py"
+"""
+
+import unittest
+
+from tests.test_import_time import import_profile
+
+COMMANDS = [
+    (["-h"], 150),
+    (["configure", "-h"], 150),
+    (["sb", "-h"], 400),
+    (["bp", "-h"], 400),
+]
+
+
+class ImportTimeBenchmark(unittest.TestCase):
+    def test_import_time(self):
+        print()
+        for args, budget in COMMANDS:
+            profile = import_profile(*args)
+            total = sum(cumulative for cumulative, top_level in profile.values() if top_level) / 1000
+            print(f"  torque {' '.join(args):<15} imports: {total:.0f} ms, budget: {budget} ms")
+            self.assertLess(total, budget, f"'torque {' '.join(args)}' spent {total:.0f} ms importing modules")
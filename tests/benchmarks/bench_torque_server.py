@@ -0,0 +1,65 @@
+"""
+Measures sandbox listing and launch waiting against the local Torque stand-in server with added latency and
+injected 429/5xx responses.
+
+Run with: python -m unittest discover -s tests/benchmarks -t . -p "bench_torque_server.py"
+"""
+
+import asyncio
+import time
+import unittest
+
+from tests.helpers.local_server import create_client
+from tests.helpers.torque_server import TorqueServer
+from torque.async_client import AsyncSandboxesManager, AsyncTorqueClient
+from torque.retry import RetryPolicy
+from torque.sandboxes import SandboxesManager
+
+SANDBOXES_COUNT = 2000
+LATENCY = (0.02, 0.08)
+FAILURE_RATE = 0.05
+
+
+class TorqueServerBenchmark(unittest.TestCase):
+    sandboxes = [{"id": f"sb{i}", "name": f"sb{i}", "blueprint_name": "bp"} for i in range(SANDBOXES_COUNT)]
+
+    def test_list_all_sandboxes(self):
+        for prefetch in (0, 1, 4):
+            server = TorqueServer(sandboxes=self.sandboxes, latency=LATENCY, failure_rate=FAILURE_RATE, seed=1)
+            with server:
+                manager = SandboxesManager(
+                    create_client(server.host, retry_policy=RetryPolicy(max_retries=10, backoff_base=0.05))
+                )
+                start = time.perf_counter()
+                result = list(manager.paginate(page_size=100, prefetch=prefetch))
+                elapsed = time.perf_counter() - start
+
+            self.assertEqual(len(result), SANDBOXES_COUNT)
+            print(
+                f"\nlisted {SANDBOXES_COUNT} sandboxes with prefetch={prefetch} in {elapsed:.2f} sec "
+                f"({len(server.requests)} requests, {server.failures_count} injected failures)"
+            )
+
+    def test_wait_for_launch(self):
+        with TorqueServer(latency=LATENCY, phase_duration=0.5, seed=1) as server:
+            client = create_client(server.host, retry_policy=RetryPolicy(max_retries=10, backoff_base=0.05))
+            manager = SandboxesManager(client)
+            sandbox_ids = [manager.start(f"sb{i}", "bp") for i in range(20)]
+            # POST is not retried on 5xx, inject failures only into status polling
+            server.failure_rate = FAILURE_RATE
+
+            async def wait_all():
+                async with AsyncTorqueClient(client=client) as async_client:
+                    async_manager = AsyncSandboxesManager(async_client)
+                    return await asyncio.gather(
+                        *[async_manager.wait(sandbox_id, timeout=30, poll_interval=0.1) for sandbox_id in sandbox_ids]
+                    )
+
+            start = time.perf_counter()
+            sandboxes = asyncio.run(wait_all())
+            elapsed = time.perf_counter() - start
+
+        self.assertTrue(all(sb.sandbox_status == "Active" for sb in sandboxes))
+        print(
+            f"\nwaited for {len(sandbox_ids)} sandboxes to launch in {elapsed:.2f} sec ({len(server.requests)} requests)"
+        )
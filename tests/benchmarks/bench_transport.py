@@ -0,0 +1,56 @@
+"""
+Compares bulk sandbox status fan-out over a pool of HTTP/1.1 connections (requests) and over one multiplexed HTTP/2
+connection (httpx) against local stand-in servers with the same per-request latency.
+
+Run with: python -m unittest discover -s tests/benchmarks -t . -p "bench_transport.py"
+"""
+
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.helpers.h2_server import H2Server, h2, httpx
+from tests.helpers.local_server import create_client
+from tests.helpers.torque_server import TorqueServer
+from torque.constants import DEFAULT_POOL_SIZE
+from torque.sandboxes import SandboxesManager
+from torque.session import TorqueSession
+from torque.transport import Http2Transport
+
+SANDBOXES_COUNT = 500
+WORKERS = 50
+LATENCY = 0.05
+
+
+@unittest.skipIf(httpx is None or h2 is None, "httpx[http2] is not installed")
+class TransportBenchmark(unittest.TestCase):
+    sandbox = {"id": "sb", "name": "sb", "blueprint_name": "bp", "sandbox_status": "Active"}
+
+    def _fan_out(self, server, session) -> float:
+        client = create_client(server.host, session=session)
+        manager = SandboxesManager(client)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            sandboxes = list(executor.map(lambda i: manager.get(f"sb{i}"), range(SANDBOXES_COUNT)))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(sandboxes), SANDBOXES_COUNT)
+        return elapsed
+
+    def test_bulk_status(self):
+        sandboxes = [dict(self.sandbox, id=f"sb{i}") for i in range(SANDBOXES_COUNT)]
+        with TorqueServer(sandboxes=sandboxes, latency=LATENCY) as server:
+            http1 = self._fan_out(server, TorqueSession(pool_size=DEFAULT_POOL_SIZE))
+            http1_connections = server.connections_count
+
+        with H2Server(self.sandbox, latency=LATENCY) as server:
+            http2 = self._fan_out(server, Http2Transport(pool_size=DEFAULT_POOL_SIZE, http1=False))
+            http2_connections = server.connections_count
+
+        print(
+            f"\n{SANDBOXES_COUNT} status requests with {WORKERS} workers and {LATENCY * 1000:.0f} ms latency:"
+            f"\n  requests (HTTP/1.1): {http1:.2f} sec over {http1_connections} connections"
+            f"\n  httpx (HTTP/2):      {http2:.2f} sec over {http2_connections} connections"
+        )
+        self.assertLess(http2, http1)
@@ -0,0 +1,108 @@
+import json
+import socket
+import threading
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+except ImportError:
+    h2 = None
+
+try:
+    import httpx  # noqa: F401, availability is checked by the transport tests
+except ImportError:
+    httpx = None
+
+
+class H2Server(object):
+    """Cleartext HTTP/2 (h2c with prior knowledge) server on localhost returning the same JSON for every request
+
+    Responses are delayed by latency seconds each, without blocking other streams of the same connection.
+    """
+
+    def __init__(self, response_body=None, latency: float = 0):
+        self.body = json.dumps(response_body if response_body is not None else {}).encode()
+        self.latency = latency
+        self.connections_count = 0
+        self.requests = []
+        self._lock = threading.Lock()
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.listen()
+        self._stopped = threading.Event()
+
+    @property
+    def host(self) -> str:
+        return f"127.0.0.1:{self._socket.getsockname()[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self._accept, daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stopped.set()
+        self._socket.close()
+
+    def _accept(self):
+        while not self._stopped.is_set():
+            try:
+                sock, _ = self._socket.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                self.connections_count += 1
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _serve(self, sock: socket.socket):
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        send_lock = threading.Lock()
+        conn.initiate_connection()
+        sock.sendall(conn.data_to_send())
+        headers = {}
+
+        while not self._stopped.is_set():
+            try:
+                data = sock.recv(65535)
+            except OSError:
+                break
+            if not data:
+                break
+
+            with send_lock:
+                events = conn.receive_data(data)
+                for event in events:
+                    if isinstance(event, h2.events.RequestReceived):
+                        headers[event.stream_id] = dict((k.decode(), v.decode()) for k, v in event.headers)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        request_headers = headers.pop(event.stream_id, {})
+                        with self._lock:
+                            self.requests.append((request_headers.get(":method"), request_headers.get(":path")))
+                        timer = threading.Timer(self.latency, self._respond, (sock, conn, send_lock, event.stream_id))
+                        timer.daemon = True
+                        timer.start()
+                sock.sendall(conn.data_to_send())
+
+        sock.close()
+
+    def _respond(self, sock: socket.socket, conn, send_lock: threading.Lock, stream_id: int):
+        response_headers = [
+            (":status", "200"),
+            ("content-type", "application/json"),
+            ("content-length", str(len(self.body))),
+        ]
+        with send_lock:
+            # bodies are expected to fit the default flow control window of 64 KB
+            conn.send_headers(stream_id, response_headers)
+            frame_size = conn.max_outbound_frame_size
+            for offset in range(0, len(self.body), frame_size):
+                end = offset + frame_size >= len(self.body)
+                conn.send_data(stream_id, self.body[offset : offset + frame_size], end_stream=end)
+            if not self.body:
+                conn.end_stream(stream_id)
+            try:
+                sock.sendall(conn.data_to_send())
+            except OSError:
+                pass
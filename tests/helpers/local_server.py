@@ -0,0 +1,155 @@
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from torque.client import TorqueClient
+
+
+class LocalRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 is required for keep-alive connections to be reused by the client
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, avoid delayed ACK stalls on keep-alive connections
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.register_connection()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._reply()
+
+    def do_POST(self):
+        self._reply()
+
+    def do_PUT(self):
+        self._reply()
+
+    def do_DELETE(self):
+        self._reply()
+
+    def do_HEAD(self):
+        self.server.register_request(self.command, self.path, dict(self.headers))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+
+        self.server.register_request(self.command, self.path, dict(self.headers), body)
+        etag = self.server.etag
+
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        use_gzip = self.server.gzip_responses and "gzip" in self.headers.get("Accept-Encoding", "")
+        body = self.server.get_encoded_body(use_gzip, self.command, self.path)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self._write_throttled(body)
+
+    def _write_throttled(self, body: bytes):
+        bandwidth = self.server.bandwidth
+        if not bandwidth:
+            self.wfile.write(body)
+            return
+
+        # simulate a slow link by sending chunks no faster than the configured bytes per second
+        chunk_size = max(1, bandwidth // 100)
+        for offset in range(0, len(body), chunk_size):
+            self.wfile.write(body[offset : offset + chunk_size])
+            time.sleep(chunk_size / bandwidth)
+
+
+class LocalServer(ThreadingHTTPServer):
+    """Threaded HTTP server on localhost which counts accepted connections and received requests
+
+    response_body is either the JSON document returned for every request or a callable building it from the
+    request method and path.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        response_body=None,
+        etag: str = None,
+        gzip_responses: bool = False,
+        bandwidth: int = None,
+        handler_class=LocalRequestHandler,
+    ):
+        super().__init__(("127.0.0.1", 0), handler_class)
+        self.response_body = response_body if response_body is not None else {}
+        self.etag = etag
+        self.gzip_responses = gzip_responses
+        self.bandwidth = bandwidth
+        self.connections_count = 0
+        self.requests = []
+        self.request_bodies = []
+        self._encoded_bodies = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def host(self) -> str:
+        return f"127.0.0.1:{self.server_address[1]}"
+
+    def register_connection(self):
+        with self._lock:
+            self.connections_count += 1
+
+    def register_request(self, method: str, path: str, headers: dict, body: bytes = b""):
+        with self._lock:
+            self.requests.append((method, path, headers))
+            self.request_bodies.append(body)
+
+    def get_encoded_body(self, use_gzip: bool, method: str = "GET", path: str = "/") -> bytes:
+        if callable(self.response_body):
+            body = json.dumps(self.response_body(method, path)).encode()
+            return gzip.compress(body) if use_gzip else body
+
+        # encoding a large body is slow, keep it until response_body is replaced
+        key = (id(self.response_body), use_gzip)
+        with self._lock:
+            if key not in self._encoded_bodies:
+                body = json.dumps(self.response_body).encode()
+                self._encoded_bodies[key] = gzip.compress(body) if use_gzip else body
+            return self._encoded_bodies[key]
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        self.server_close()
+
+
+def create_client(host: str, client_class=TorqueClient, **kwargs):
+    """Client of the server listening on host (LocalServer.host), with test credentials unless given in kwargs
+
+    functools.partial(create_client, server.host) can replace torque.client.TorqueClient in command tests.
+    """
+    kwargs.setdefault("space", "space")
+    kwargs.setdefault("token", "token")
+    return client_class(torque_host_prefix="http://", torque_host=host, **kwargs)
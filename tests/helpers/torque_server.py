@@ -0,0 +1,179 @@
+import copy
+import json
+import random
+import re
+import time
+import uuid
+from urllib.parse import parse_qs, urlparse
+
+from tests.helpers.local_server import LocalRequestHandler, LocalServer
+from torque.constants import DONE_STATUS
+
+LAUNCHING_PHASES = ["preparing_artifacts", "creating_infrastructure", "deploying_applications"]
+
+_SPACE_PATH = re.compile(r"^/api/spaces/(?P<space>[^/]+)/(?P<resource>.*)$")
+
+
+class TorqueRequestHandler(LocalRequestHandler):
+    def _reply(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        self.server.register_request(self.command, self.path, dict(self.headers), body)
+
+        self.server.simulate_latency()
+
+        failure = self.server.pick_failure()
+        if failure:
+            headers = {"Retry-After": "0"} if failure == 429 else {}
+            self._send_json(failure, {"errors": [{"name": "Injected", "message": f"Injected {failure}"}]}, headers)
+            return
+
+        status, doc = self.server.dispatch(self.command, self.path, json.loads(body) if body else {})
+        self._send_json(status, doc)
+
+    def _send_json(self, status: int, doc, headers: dict = None):
+        body = json.dumps(doc).encode() if doc is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TorqueServer(LocalServer):
+    """Local stand-in for the Torque API used by the sandbox and blueprint managers
+
+    Implements sandbox list/get/start/delete, catalog, blueprints and blueprint validation on top of in-memory state.
+    latency is the delay in seconds added to every response (a (min, max) tuple picks a random delay and a callable
+    returns the delay of each request, e.g. to simulate a slow replica),
+    failure_rate is the share of requests answered with one of failure_statuses instead of being served, and
+    phase_duration is the number of seconds each launching_progress phase of a started sandbox takes.
+    """
+
+    def __init__(
+        self,
+        blueprints: list = None,
+        sandboxes: list = None,
+        latency=0,
+        failure_rate: float = 0.0,
+        failure_statuses: tuple = (429, 502, 503),
+        phase_duration: float = 0.0,
+        seed: int = None,
+    ):
+        super().__init__(handler_class=TorqueRequestHandler)
+        self.blueprints = blueprints if blueprints is not None else []
+        self.sandboxes = {sb["id"]: sb for sb in sandboxes or []}
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.failure_statuses = failure_statuses
+        self.phase_duration = phase_duration
+        self.failures_count = 0
+        self._started_at = {}
+        self._random = random.Random(seed)
+
+    def simulate_latency(self):
+        latency = self.latency
+        if callable(latency):
+            latency = latency()
+        elif isinstance(latency, tuple):
+            with self._lock:
+                latency = self._random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+
+    def pick_failure(self) -> int:
+        with self._lock:
+            if not self.failure_rate or self._random.random() >= self.failure_rate:
+                return 0
+            self.failures_count += 1
+            return self._random.choice(self.failure_statuses)
+
+    def dispatch(self, method: str, path: str, body: dict) -> (int, object):
+        url = urlparse(path)
+        match = _SPACE_PATH.match(url.path)
+        if not match:
+            return 404, {"errors": [{"name": "NotFound", "message": f"Unknown endpoint {url.path}"}]}
+
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        parts = match.group("resource").strip("/").split("/")
+
+        # the state is shared by all handler threads, copy it so serializing the response does not race with updates
+        with self._lock:
+            status, doc = self._route(method, parts, query, body)
+            return status, copy.deepcopy(doc)
+
+    def _route(self, method: str, parts: list, query: dict, body: dict) -> (int, object):
+        if parts == ["sandbox"] and method == "GET":
+            return 200, self._list_sandboxes(query)
+        if parts == ["sandbox"] and method == "POST":
+            return 200, self._start_sandbox(body)
+        if parts[0] == "sandbox" and len(parts) == 2 and method in ("GET", "DELETE"):
+            sandbox = self.sandboxes.get(parts[1])
+            if sandbox is None:
+                return 404, {"errors": [{"name": "NotFound", "message": f"Sandbox {parts[1]} not found"}]}
+            if method == "DELETE":
+                sandbox["sandbox_status"] = "Ended"
+                return 202, None
+            return 200, self._refresh_sandbox(sandbox)
+        if parts == ["blueprints"] and method == "GET":
+            return 200, self.blueprints
+        if parts[0] == "catalog" and len(parts) == 2 and method == "GET":
+            for blueprint in self.blueprints:
+                if blueprint["blueprint_name"] == parts[1]:
+                    return 200, blueprint
+            return 404, {"errors": [{"name": "NotFound", "message": f"Blueprint {parts[1]} not found"}]}
+        if parts == ["validations", "blueprints"] and method == "POST":
+            return 200, self._validate_blueprint(body)
+
+        path = "/".join(parts)
+        return 405, {"errors": [{"name": "MethodNotAllowed", "message": f"{method} {path} is not supported"}]}
+
+    def _list_sandboxes(self, query: dict) -> list:
+        sandboxes = [self._refresh_sandbox(sb) for sb in self.sandboxes.values()]
+        skip = int(query.get("skip", 0))
+        count = int(query.get("count", len(sandboxes)))
+        return sandboxes[skip : skip + count]
+
+    def _start_sandbox(self, body: dict) -> dict:
+        sandbox_id = uuid.uuid4().hex[:12]
+        self.sandboxes[sandbox_id] = {
+            "id": sandbox_id,
+            "name": body.get("sandbox_name"),
+            "blueprint_name": body.get("blueprint_name"),
+            "description": "",
+            "errors": [],
+            "sandbox_status": "Launching",
+            "launching_progress": {phase: {"status": "Pending"} for phase in LAUNCHING_PHASES},
+        }
+        self._started_at[sandbox_id] = time.monotonic()
+        return {"id": sandbox_id}
+
+    def _refresh_sandbox(self, sandbox: dict) -> dict:
+        """Moves a launching sandbox through its phases according to the time passed since it was started"""
+        started_at = self._started_at.get(sandbox["id"])
+        if started_at is None or sandbox["sandbox_status"] != "Launching":
+            return sandbox
+
+        elapsed = time.monotonic() - started_at
+        for index, phase in enumerate(LAUNCHING_PHASES):
+            if elapsed >= (index + 1) * self.phase_duration:
+                sandbox["launching_progress"][phase]["status"] = DONE_STATUS
+            elif elapsed >= index * self.phase_duration:
+                sandbox["launching_progress"][phase]["status"] = "InProgress"
+
+        if all(p["status"] == DONE_STATUS for p in sandbox["launching_progress"].values()):
+            sandbox["sandbox_status"] = "Active"
+        return sandbox
+
+    def _validate_blueprint(self, body: dict) -> dict:
+        name = body.get("blueprint_name")
+        for blueprint in self.blueprints:
+            if blueprint["blueprint_name"] == name:
+                return dict(blueprint, errors=[])
+        return {
+            "blueprint_name": name,
+            "url": "",
+            "errors": [{"name": "BlueprintNotFound", "message": f"Blueprint {name} not found"}],
+        }
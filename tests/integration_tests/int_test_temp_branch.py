@@ -47,7 +47,7 @@ class GitMagicTests(unittest.TestCase):
     @patch.object(branch_utils, "create_remote_branch")
     @patch("torque.models.blueprints.BlueprintsManager.validate")
     @patch.object(branch_context, "delete_temp_remote_branch")
-    @patch("pkg_resources.get_distribution")
+    @patch("torque.shell.get_version")
     @patch("torque.shell.BootstrapHelper.get_connection_params")
     @patch("torque.branch.branch_utils.debug_output_about_repo_examination")
     @patch("torque.shell.exit")
@@ -76,7 +76,7 @@ class GitMagicTests(unittest.TestCase):
     @patch.object(branch_utils, "create_remote_branch")
     @patch("torque.models.blueprints.BlueprintsManager.validate")
     @patch.object(branch_context, "delete_temp_remote_branch")
-    @patch("pkg_resources.get_distribution")
+    @patch("torque.shell.get_version")
     @patch("torque.shell.BootstrapHelper.get_connection_params")
     @patch("torque.branch.branch_utils.debug_output_about_repo_examination")
     @patch("torque.shell.exit")
@@ -105,7 +105,7 @@ class GitMagicTests(unittest.TestCase):
     @patch.object(branch_utils, "create_remote_branch")
     @patch("torque.models.blueprints.BlueprintsManager.validate")
     @patch.object(branch_context, "delete_temp_remote_branch")
-    @patch("pkg_resources.get_distribution")
+    @patch("torque.shell.get_version")
     @patch("torque.shell.BootstrapHelper.get_connection_params")
     @patch("torque.branch.branch_utils.debug_output_about_repo_examination")
     @patch("torque.shell.exit")
@@ -134,7 +134,7 @@ class GitMagicTests(unittest.TestCase):
     @patch.object(branch_utils, "create_remote_branch")
     @patch("torque.models.blueprints.BlueprintsManager.validate")
     @patch.object(branch_context, "delete_temp_remote_branch")
-    @patch("pkg_resources.get_distribution")
+    @patch("torque.shell.get_version")
     @patch("torque.shell.BootstrapHelper.get_connection_params")
     @patch("torque.branch.branch_utils.debug_output_about_repo_examination")
     @patch("torque.shell.exit")
@@ -0,0 +1,153 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import CancelledError
+from unittest.mock import patch
+
+from tests.helpers.local_server import create_client
+from tests.helpers.torque_server import TorqueServer
+from torque.api import Torque
+from torque.exceptions import (
+    BadBlueprintRepo,
+    BlueprintValidationError,
+    ConfigError,
+    NotFoundError,
+    SandboxLaunchError,
+    TorqueApiError,
+    WaitTimeoutError,
+)
+from torque.models.blueprints import Blueprint
+from torque.sandboxes import Sandbox
+
+
+class TestTorqueApi(unittest.TestCase):
+    sandbox = {"id": "sb1", "name": "sb1", "blueprint_name": "bp1", "sandbox_status": "Active"}
+    blueprints = [{"blueprint_name": "bp1", "url": "http://example.com/bp1", "enabled": True}]
+
+    def setUp(self):
+        self.server = TorqueServer(blueprints=self.blueprints, sandboxes=[dict(self.sandbox)], phase_duration=0.05)
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+
+        client = create_client(self.server.host)
+        self.torque = Torque(client=client)
+        self.addCleanup(self.torque.close)
+
+    def test_get_and_list(self):
+        self.assertIsInstance(self.torque.get_sandbox("sb1"), Sandbox)
+        self.assertEqual([sandbox.sandbox_id for sandbox in self.torque.list_sandboxes()], ["sb1"])
+        self.assertEqual([blueprint.name for blueprint in self.torque.list_blueprints()], ["bp1"])
+
+    def test_not_found(self):
+        with self.assertRaises(NotFoundError) as ctx:
+            self.torque.get_sandbox("missing")
+
+        self.assertIsInstance(ctx.exception, TorqueApiError)
+        self.assertEqual(ctx.exception.status_code, 404)
+
+    def test_start_wait_and_end(self):
+        sandbox_id = self.torque.start_sandbox("bp1", sandbox_name="sb", branch="dev")
+        launch = self.torque.wait_for_sandbox(sandbox_id, timeout=5, poll_interval=0.05)
+
+        self.assertFalse(launch.done())
+        self.assertEqual(launch.result().sandbox_status, "Active")
+
+        self.torque.end_sandbox(sandbox_id)
+        self.assertEqual(self.server.sandboxes[sandbox_id]["sandbox_status"], "Ended")
+
+    def test_wait_for_failed_sandbox(self):
+        self.server.sandboxes["sb1"]["sandbox_status"] = "ActiveWithError"
+
+        with self.assertRaises(SandboxLaunchError) as ctx:
+            self.torque.wait_for_sandbox("sb1", timeout=1, poll_interval=0.05).result()
+
+        self.assertEqual(ctx.exception.sandbox.sandbox_status, "ActiveWithError")
+
+    def test_wait_timeout(self):
+        self.server.sandboxes["sb1"]["sandbox_status"] = "Launching"
+
+        with self.assertRaises(WaitTimeoutError):
+            self.torque.wait_for_sandbox("sb1", timeout=0.1, poll_interval=0.05).result()
+
+    def test_close_cancels_waits(self):
+        self.server.sandboxes["sb1"]["sandbox_status"] = "Launching"
+        launch = self.torque.wait_for_sandbox("sb1", timeout=60, poll_interval=10)
+
+        self.torque.close()
+
+        with self.assertRaises(CancelledError):
+            launch.result(timeout=1)
+
+    def test_validate_blueprint(self):
+        self.assertIsInstance(self.torque.validate_blueprint("bp1", branch="dev"), Blueprint)
+
+        with self.assertRaises(BlueprintValidationError) as ctx:
+            self.torque.validate_blueprint("missing", branch="dev")
+        self.assertEqual(ctx.exception.errors[0]["name"], "BlueprintNotFound")
+
+    @patch("torque.branch.branch_context.ContextBranch")
+    @patch("torque.branch.branch_utils.get_and_check_folder_based_repo")
+    def test_temp_branch_of_local_repo(self, get_repo, context_branch_class):
+        context_branch = context_branch_class.return_value.__enter__.return_value
+        context_branch.validation_branch = "tmp-torque-dev-abc"
+
+        with self.torque.temp_branch("bp1") as branch:
+            self.assertEqual(branch.validation_branch, "tmp-torque-dev-abc")
+
+        context_branch_class.assert_called_once_with(get_repo.return_value, None)
+        context_branch_class.return_value.__exit__.assert_called_once()
+
+    @patch("torque.branch.branch_context.ContextBranch")
+    @patch("torque.branch.branch_utils.get_and_check_folder_based_repo")
+    def test_temp_branch_failure(self, get_repo, context_branch_class):
+        context_branch_class.return_value.__enter__.return_value = None
+
+        with self.assertRaises(BadBlueprintRepo):
+            self.torque.validate_blueprint("bp1")
+        self.assertEqual(self.server.requests, [])
+
+    def test_commit_requires_branch(self):
+        with self.assertRaises(ValueError):
+            self.torque.validate_blueprint("bp1", commit="abc")
+
+
+class TestTorqueApiCredentials(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.config_path = os.path.join(self.temp_dir.name, "config")
+        environ = {name: value for name, value in os.environ.items() if not name.startswith("TORQUE_")}
+        environ["TORQUE_CONFIG_PATH"] = self.config_path
+
+        patcher = patch.dict(os.environ, environ, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_arguments(self):
+        torque = Torque(token="token", space="space", account="account", pool_size=2)
+        self.addCleanup(torque.close)
+
+        self.assertEqual(torque.client.space, "space")
+        self.assertEqual(torque.client.account, "account")
+
+    def test_profile(self):
+        with open(self.config_path, "w") as f:
+            f.write("[dev]\ntoken = token\nspace = dev-space\n")
+
+        torque = Torque(profile="dev")
+        self.addCleanup(torque.close)
+
+        self.assertEqual(torque.client.space, "dev-space")
+
+    def test_missing_config(self):
+        with self.assertRaises(ConfigError):
+            Torque(profile="dev")
+
+    def test_invalid_pool_size(self):
+        with self.assertRaises(ConfigError) as ctx:
+            Torque(token="token", space="space", pool_size=0)
+        self.assertEqual(str(ctx.exception), "Pool size must be positive")
+
+        with patch.dict(os.environ, {"TORQUE_POOL_SIZE": "many"}):
+            with self.assertRaises(ConfigError):
+                Torque(token="token", space="space")
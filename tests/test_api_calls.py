@@ -0,0 +1,83 @@
+import functools
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from tests.helpers.local_server import create_client
+from tests.helpers.torque_server import TorqueServer
+from torque.commands.bp import BlueprintsCommand
+from torque.commands.sb import SandboxesCommand
+from torque.models.connection import TorqueConnection
+
+
+class TestCommandApiCalls(unittest.TestCase):
+    """Guards the number of API calls each command makes against the local stand-in server"""
+
+    sandbox = {"id": "sb1", "name": "sb1", "blueprint_name": "bp1", "sandbox_status": "Active"}
+    blueprints = [{"blueprint_name": "bp1", "url": "http://example.com/bp1", "enabled": True}]
+
+    def setUp(self):
+        self.server = TorqueServer(blueprints=self.blueprints, sandboxes=[dict(self.sandbox)])
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+
+        client_class = functools.partial(create_client, self.server.host)
+        patcher = patch("torque.client.TorqueClient", client_class)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, command_class, argv: list) -> list:
+        command = command_class(argv, TorqueConnection(space="space", token="token", account="account"))
+        with redirect_stdout(io.StringIO()):
+            self.assertTrue(command.execute())
+        return [(method, path.split("?")[0]) for method, path, _ in self.server.requests]
+
+    def test_sb_status(self):
+        self.assertEqual(
+            self._run(SandboxesCommand, ["sb", "status", "sb1"]), [("GET", "/api/spaces/space/sandbox/sb1")]
+        )
+
+    def test_sb_get(self):
+        self.assertEqual(self._run(SandboxesCommand, ["sb", "get", "sb1"]), [("GET", "/api/spaces/space/sandbox/sb1")])
+
+    def test_sb_end(self):
+        self.assertEqual(
+            self._run(SandboxesCommand, ["sb", "end", "sb1"]),
+            [("GET", "/api/spaces/space/sandbox/sb1"), ("DELETE", "/api/spaces/space/sandbox/sb1")],
+        )
+
+    def test_sb_end_no_verify(self):
+        self.assertEqual(
+            self._run(SandboxesCommand, ["sb", "end", "sb1", "--no-verify"]),
+            [("DELETE", "/api/spaces/space/sandbox/sb1")],
+        )
+
+    def test_sb_end_many(self):
+        self.server.sandboxes["sb2"] = dict(self.sandbox, id="sb2")
+
+        calls = self._run(SandboxesCommand, ["sb", "end", "sb1", "sb2", "--no-verify"])
+
+        self.assertEqual(
+            sorted(calls), [("DELETE", "/api/spaces/space/sandbox/sb1"), ("DELETE", "/api/spaces/space/sandbox/sb2")]
+        )
+
+    def test_sb_end_filter(self):
+        self.server.sandboxes["sb2"] = dict(self.sandbox, id="sb2", sandbox_status="Ended")
+
+        calls = self._run(SandboxesCommand, ["sb", "end", "--filter=my", "--no-verify"])
+
+        self.assertEqual(calls, [("GET", "/api/spaces/space/sandbox"), ("DELETE", "/api/spaces/space/sandbox/sb1")])
+
+    def test_sb_list(self):
+        self.assertEqual(self._run(SandboxesCommand, ["sb", "list"]), [("GET", "/api/spaces/space/sandbox")])
+
+    def test_sb_start_and_wait(self):
+        calls = self._run(SandboxesCommand, ["sb", "start", "bp1", "--branch", "main", "--wait", "--output=json"])
+
+        self.assertEqual(calls[0], ("POST", "/api/spaces/space/sandbox"))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[1][0], "GET")
+
+    def test_bp_list(self):
+        self.assertEqual(self._run(BlueprintsCommand, ["bp", "list"]), [("GET", "/api/spaces/space/blueprints")])
@@ -0,0 +1,84 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import Mock
+
+from tests.helpers.local_server import LocalServer, create_client
+from torque.async_client import AsyncBlueprintsManager, AsyncSandboxesManager, AsyncTorqueClient
+from torque.models.blueprints import Blueprint
+from torque.sandboxes import Sandbox
+
+
+class TestAsyncClient(unittest.TestCase):
+    sandbox_json = {"id": "sb1", "name": "sandbox", "blueprint_name": "bp", "sandbox_status": "Active"}
+
+    def test_concurrent_polls_share_bounded_pool(self):
+        async def poll_all(server):
+            async with create_client(server.host, AsyncTorqueClient, max_concurrency=4) as client:
+                manager = AsyncSandboxesManager(client)
+                return await asyncio.gather(*[manager.get(f"sb{i}") for i in range(50)])
+
+        with LocalServer(self.sandbox_json) as server:
+            sandboxes = asyncio.run(poll_all(server))
+
+        self.assertEqual(len(sandboxes), 50)
+        self.assertTrue(all(isinstance(sb, Sandbox) for sb in sandboxes))
+        self.assertEqual(len(server.requests), 50)
+        self.assertLessEqual(server.connections_count, 4)
+
+    def test_start_wait_and_end(self):
+        async def lifecycle(server):
+            async with create_client(server.host, AsyncTorqueClient, max_concurrency=2) as client:
+                manager = AsyncSandboxesManager(client)
+                sandbox_id = await manager.start("sandbox", "bp")
+                sandbox = await manager.wait(sandbox_id, timeout=1)
+                await manager.end(sandbox_id)
+                return sandbox_id, sandbox
+
+        with LocalServer(self.sandbox_json) as server:
+            sandbox_id, sandbox = asyncio.run(lifecycle(server))
+
+        self.assertEqual(sandbox_id, "sb1")
+        self.assertEqual(sandbox.sandbox_status, "Active")
+        # end() reuses the sandbox fetched by the last poll
+        self.assertEqual([method for method, _, _ in server.requests], ["POST", "GET", "DELETE"])
+
+    def test_wait_timeout(self):
+        async def wait(server):
+            async with create_client(server.host, AsyncTorqueClient, max_concurrency=1) as client:
+                await AsyncSandboxesManager(client).wait("sb1", timeout=0.1, poll_interval=0.05)
+
+        with LocalServer(dict(self.sandbox_json, sandbox_status="Launching")) as server:
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(wait(server))
+
+    def test_blueprints_validate(self):
+        async def validate(server):
+            async with create_client(server.host, AsyncTorqueClient, max_concurrency=1) as client:
+                return await AsyncBlueprintsManager(client).validate("bp", branch="dev")
+
+        with LocalServer({"blueprint_name": "bp", "url": "", "errors": []}) as server:
+            blueprint = asyncio.run(validate(server))
+
+        self.assertIsInstance(blueprint, Blueprint)
+        self.assertEqual(blueprint.name, "bp")
+
+    def test_close_does_not_block_event_loop(self):
+        async def close_while_running():
+            client = AsyncTorqueClient(client=Mock(), max_concurrency=1)
+            request = asyncio.ensure_future(client.run(time.sleep, 0.3))
+            await asyncio.sleep(0.05)
+
+            closed = asyncio.ensure_future(client.close())
+            # other coroutines keep running while close waits for the request in flight
+            await asyncio.sleep(0.05)
+            self.assertFalse(closed.done())
+            await closed
+            self.assertTrue(request.done())
+            client.client.session.close.assert_called_once()
+
+        asyncio.run(close_while_running())
+
+
+if __name__ == "__main__":
+    unittest.main()
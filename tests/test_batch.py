@@ -0,0 +1,146 @@
+import functools
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+from docopt import DocoptExit
+
+from tests.helpers.local_server import create_client
+from tests.helpers.torque_server import TorqueServer
+from torque.commands.batch import BatchCommand
+from torque.models.connection import TorqueConnection
+from torque.services.batch import ThreadOutput, parse_script
+
+
+class TestParseScript(unittest.TestCase):
+    def test_lines(self):
+        script = "sb status sb1\n\n# teardown\ntorque sb end sb1\nbp validate 'my bp'\n"
+
+        self.assertEqual(
+            parse_script(script),
+            [(1, ["sb", "status", "sb1"]), (4, ["sb", "end", "sb1"]), (5, ["bp", "validate", "my bp"])],
+        )
+
+    def test_yaml_list(self):
+        script = "# teardown\n- sb end sb1\n- [sb, end, sb2]\n"
+
+        self.assertEqual(parse_script(script), [(1, ["sb", "end", "sb1"]), (2, ["sb", "end", "sb2"])])
+
+    def test_empty(self):
+        self.assertEqual(parse_script("\n# nothing\n"), [])
+
+
+class TestThreadOutput(unittest.TestCase):
+    def test_threads_write_to_own_buffers(self):
+        fallback = io.StringIO()
+        output = ThreadOutput(fallback)
+        results = {}
+
+        def job(name):
+            output.capture()
+            for _ in range(100):
+                output.write(name)
+            results[name] = output.release()
+
+        threads = [threading.Thread(target=job, args=(name,)) for name in "ab"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        output.write("spinner")
+
+        self.assertEqual(results, {"a": "a" * 100, "b": "b" * 100})
+        self.assertEqual(fallback.getvalue(), "spinner")
+
+
+class TestBatchCommand(unittest.TestCase):
+    sandboxes = [
+        {"id": f"sb{i}", "name": f"sb{i}", "blueprint_name": "bp1", "sandbox_status": "Active"} for i in range(4)
+    ]
+    blueprints = [{"blueprint_name": "bp1", "url": "http://example.com/bp1", "enabled": True}]
+
+    def setUp(self):
+        self.server = TorqueServer(blueprints=self.blueprints, sandboxes=[dict(sb) for sb in self.sandboxes])
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+
+        client_class = functools.partial(create_client, self.server.host)
+        patcher = patch("torque.client.TorqueClient", client_class)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _run(self, script: str, options: list = None) -> (bool, list, str):
+        path = os.path.join(self.temp_dir.name, "batch.txt")
+        with open(path, "w") as f:
+            f.write(script)
+
+        command = BatchCommand(
+            ["batch", path] + (options or []), TorqueConnection(space="space", token="token", account="account")
+        )
+        stdout, stderr = io.StringIO(), io.StringIO()
+        # like the handler of logging.basicConfig in torque.shell.main
+        handler = logging.StreamHandler(stderr)
+        logging.getLogger().addHandler(handler)
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                success = command.execute()
+        finally:
+            logging.getLogger().removeHandler(handler)
+        return success, [json.loads(line) for line in stdout.getvalue().splitlines()], stderr.getvalue()
+
+    def test_results_per_line(self):
+        success, results, stderr = self._run("sb status sb1\nbp list\n")
+
+        self.assertTrue(success)
+        self.assertEqual([result["line"] for result in results], [1, 2])
+        self.assertEqual(results[0]["command"], "sb status sb1")
+        self.assertEqual(results[0]["stdout"], "Active\n")
+        self.assertTrue(all(result["exit_code"] == 0 for result in results))
+        self.assertIn("2 of 2 commands succeeded", stderr)
+
+    def test_failures_are_reported_per_line(self):
+        success, results, stderr = self._run("sb status missing\nsb status\nunknown\nsb status sb1\n")
+
+        self.assertFalse(success)
+        self.assertEqual([result["success"] for result in results], [False, False, False, True])
+        self.assertIn("not found", results[0]["stderr"])
+        self.assertIn("usage:", results[1]["stderr"])
+        self.assertIn("unknown", results[2]["stderr"])
+        self.assertNotIn("not found", stderr)
+
+    def test_client_is_shared(self):
+        self._run("".join(f"sb end sb{i}\n" for i in range(4)))
+
+        self.assertEqual(self.server.connections_count, 1)
+        self.assertTrue(all(sb["sandbox_status"] == "Ended" for sb in self.server.sandboxes.values()))
+
+    def test_jobs_run_concurrently_in_order(self):
+        self.server.latency = 0.2
+        started_at = time.monotonic()
+        success, results, _ = self._run("".join(f"sb status sb{i}\n" for i in range(4)), ["--jobs=4"])
+
+        self.assertTrue(success)
+        self.assertEqual([result["line"] for result in results], [1, 2, 3, 4])
+        self.assertLess(time.monotonic() - started_at, 0.2 * 4)
+
+    def test_wrong_jobs(self):
+        with self.assertRaises(DocoptExit):
+            self._run("sb status sb1\n", ["--jobs=0"])
+
+    def test_missing_file(self):
+        command = BatchCommand(["batch", os.path.join(self.temp_dir.name, "missing.txt")])
+
+        success, message = command.do_batch()
+
+        self.assertFalse(success)
+        self.assertIn("Unable to read batch file", message)
@@ -0,0 +1,112 @@
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from tests.helpers.local_server import LocalServer, create_client
+from torque.cache import CacheEntry, ResponseCache
+from torque.models.blueprints import BlueprintsManager
+from torque.sandboxes import SandboxesManager
+
+
+def build_response(body: bytes, etag: str = None, last_modified: str = None):
+    headers = {}
+    if etag:
+        headers["ETag"] = etag
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return Mock(content=body, headers=headers)
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_create_by_mode(self):
+        self.assertIsNone(ResponseCache.create(None))
+        self.assertIsNone(ResponseCache.create("memory").cache_dir)
+        self.assertIsNotNone(ResponseCache.create("disk").cache_dir)
+
+    def test_key_depends_on_token_and_params(self):
+        key = ResponseCache.make_key("url", {"count": 1}, "token1")
+        self.assertEqual(key, ResponseCache.make_key("url", {"count": 1}, "token1"))
+        self.assertNotEqual(key, ResponseCache.make_key("url", {"count": 1}, "token2"))
+        self.assertNotEqual(key, ResponseCache.make_key("url", {"count": 2}, "token1"))
+
+    def test_entry_validators(self):
+        entry = CacheEntry(b"{}", etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        self.assertEqual(
+            entry.validators(),
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+
+    def test_response_without_validators_not_stored(self):
+        cache = ResponseCache()
+        cache.store("key", build_response(b"{}"))
+        self.assertIsNone(cache.get("key"))
+
+    def test_lru_eviction_by_size(self):
+        cache = ResponseCache(max_size=10)
+        cache.store("a", build_response(b"aaaa", etag="a"))
+        cache.store("b", build_response(b"bbbb", etag="b"))
+        cache.get("a")
+        cache.store("c", build_response(b"cccc", etag="c"))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.stats["size"], 8)
+
+    def test_disk_cache_survives_new_instance(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+
+        ResponseCache(cache_dir=cache_dir).store("key", build_response(b'{"id": 1}', etag="v1"))
+        entry = ResponseCache(cache_dir=cache_dir).get("key")
+
+        self.assertEqual(entry.json(), {"id": 1})
+        self.assertEqual(entry.etag, "v1")
+
+    def test_hit_rate(self):
+        cache = ResponseCache()
+        self.assertEqual(cache.hit_rate, 0)
+        cache.record_hit()
+        cache.record_hit()
+        cache.record_hit()
+        cache.record_miss()
+        self.assertEqual(cache.hit_rate, 0.75)
+
+
+class TestConditionalRequests(unittest.TestCase):
+    sandbox_json = {"id": "sb1", "name": "sandbox", "blueprint_name": "bp", "sandbox_status": "Active"}
+
+    def test_not_modified_served_from_cache(self):
+        cache = ResponseCache()
+        with LocalServer(self.sandbox_json, etag='"v1"') as server:
+            manager = SandboxesManager(create_client(server.host), cache=cache)
+            sandboxes = [manager.get("sb1", refresh=True) for _ in range(4)]
+
+        self.assertTrue(all(sb.sandbox_status == "Active" for sb in sandboxes))
+        self.assertNotIn("If-None-Match", server.requests[0][2])
+        for _, _, headers in server.requests[1:]:
+            self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual(cache.stats["hits"], 3)
+        self.assertEqual(cache.stats["misses"], 1)
+
+    def test_list_cached_per_params(self):
+        cache = ResponseCache()
+        with LocalServer([{"blueprint_name": "bp", "url": ""}], etag='"v1"') as server:
+            manager = BlueprintsManager(create_client(server.host), cache=cache)
+            manager.list()
+            manager.list()
+
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_no_cache_sends_plain_requests(self):
+        with LocalServer(self.sandbox_json, etag='"v1"') as server:
+            manager = SandboxesManager(create_client(server.host))
+            manager.get("sb1", refresh=True)
+            manager.get("sb1", refresh=True)
+
+        self.assertTrue(all("If-None-Match" not in headers for _, _, headers in server.requests))
+
+
+if __name__ == "__main__":
+    unittest.main()
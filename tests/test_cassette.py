@@ -0,0 +1,103 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from tests.helpers.local_server import LocalServer, create_client
+from tests.helpers.torque_server import TorqueServer
+from torque.cassette import REDACTED, RecordingTransport, ReplayTransport
+from torque.exceptions import CassetteMismatchError
+from torque.models.blueprints import BlueprintsManager
+from torque.sandboxes import SandboxesManager
+from torque.session import TorqueSession
+
+
+class TestCassette(unittest.TestCase):
+    blueprints = [{"blueprint_name": f"bp{i}", "url": f"http://example.com/{i}", "enabled": True} for i in range(3)]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.path = os.path.join(self.tmp_dir, "cassette.jsonl")
+
+    def _record(self):
+        with TorqueServer(blueprints=self.blueprints, phase_duration=0.1, latency=0.02) as server:
+            with patch.dict(os.environ, {"TORQUE_RECORD": self.path}):
+                client = create_client(server.host, token="secret")
+            self.assertIsInstance(client.session, RecordingTransport)
+
+            sb_manager = SandboxesManager(client)
+            sandbox_id = sb_manager.start("sb", "bp1")
+            statuses = [sb_manager.get(sandbox_id, refresh=True).sandbox_status]
+            while statuses[-1] != "Active":
+                time.sleep(0.05)
+                statuses.append(sb_manager.get(sandbox_id, refresh=True).sandbox_status)
+            BlueprintsManager(client).list()
+            client.session.close()
+
+        return sandbox_id, statuses
+
+    def test_record_and_replay(self):
+        sandbox_id, statuses = self._record()
+
+        with patch.dict(os.environ, {"TORQUE_REPLAY": self.path, "TORQUE_REPLAY_SPEED": "fast"}):
+            client = create_client("replay.invalid", token="secret")
+        self.assertIsInstance(client.session, ReplayTransport)
+
+        sb_manager = SandboxesManager(client)
+        self.assertEqual(sb_manager.start("sb", "bp1"), sandbox_id)
+        replayed = [sb_manager.get(sandbox_id, refresh=True).sandbox_status for _ in statuses]
+        self.assertEqual(replayed, statuses)
+        # the last recorded response is repeated once the recorded ones are used up
+        self.assertEqual(sb_manager.get(sandbox_id, refresh=True).sandbox_status, "Active")
+        self.assertEqual([bp.name for bp in BlueprintsManager(client).list()], ["bp0", "bp1", "bp2"])
+
+    def test_interactions_have_timing_metadata(self):
+        self._record()
+
+        with open(self.path) as cassette:
+            interactions = [json.loads(line) for line in cassette]
+
+        self.assertEqual(interactions[0]["method"], "POST")
+        self.assertEqual(interactions[0]["path"], "/api/spaces/space/sandbox")
+        self.assertTrue(all(interaction["elapsed"] >= 0.02 for interaction in interactions))
+        offsets = [interaction["started_at"] for interaction in interactions]
+        self.assertEqual(offsets, sorted(offsets))
+
+    def test_credentials_redacted(self):
+        with LocalServer({"access_token": "long-lived-token"}) as server:
+            session = RecordingTransport(TorqueSession(), self.path)
+            client = create_client(server.host, token="secret", session=session)
+            client.login("account", "email", "password123")
+            client.session.close()
+
+        self.assertEqual(server.requests[0][2]["Authorization"], "Bearer secret")
+        with open(self.path) as cassette:
+            content = cassette.read()
+        self.assertNotIn("secret", content)
+        self.assertNotIn("password123", content)
+        self.assertNotIn("long-lived-token", content)
+        self.assertIn(REDACTED, content)
+
+    def test_replay_at_recorded_speed(self):
+        self._record()
+        client = create_client("replay.invalid", token="secret", session=ReplayTransport(self.path, speed="recorded"))
+
+        start = time.perf_counter()
+        BlueprintsManager(client).list()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.02)
+
+    def test_unknown_request(self):
+        self._record()
+        client = create_client("replay.invalid", token="secret", session=ReplayTransport(self.path, speed="fast"))
+
+        with self.assertRaises(CassetteMismatchError):
+            SandboxesManager(client).get("unknown")
+
+    def test_invalid_speed(self):
+        self._record()
+        with self.assertRaises(ValueError):
+            ReplayTransport(self.path, speed="slow-motion")
@@ -1,8 +1,14 @@
 import os
 import unittest
 from unittest import mock
+from unittest.mock import Mock, patch
+
+from requests import ConnectionError
 
 from torque.client import TorqueClient
+from torque.exceptions import TorqueApiError
+from torque.rate_limiter import TokenBucket
+from torque.retry import RetryPolicy
 
 
 class TestClient(unittest.TestCase):
@@ -30,5 +36,68 @@ class TestClient(unittest.TestCase):
         self.assertEqual(self.client_with_account.base_url, "https://qtorque.io/api/")
 
 
+@patch("torque.client.time.sleep")
+class TestClientRetries(unittest.TestCase):
+    def setUp(self) -> None:
+        self.session = Mock()
+        self.client = TorqueClient(session=self.session, retry_policy=RetryPolicy(max_retries=2))
+
+    @staticmethod
+    def _response(status_code: int, headers: dict = None, json: dict = None):
+        return Mock(status_code=status_code, headers=headers or {}, reason="", json=Mock(return_value=json or {}))
+
+    def test_get_retried_until_success(self, sleep_mock):
+        ok = self._response(200)
+        self.session.request.side_effect = [self._response(503), ConnectionError(), ok]
+
+        response = self.client.request("sandbox", "GET")
+
+        self.assertIs(response, ok)
+        self.assertEqual(self.session.request.call_count, 3)
+        self.assertEqual(sleep_mock.call_count, 2)
+
+    def test_retry_after_header_honored(self, sleep_mock):
+        self.session.request.side_effect = [self._response(429, {"Retry-After": "4"}), self._response(200)]
+
+        self.client.request("sandbox", "POST")
+
+        sleep_mock.assert_called_once_with(4.0)
+
+    def test_post_not_retried_on_server_error(self, sleep_mock):
+        self.session.request.return_value = self._response(503)
+
+        with self.assertRaises(TorqueApiError) as ctx:
+            self.client.request("sandbox", "POST")
+
+        self.assertEqual(ctx.exception.status_code, 503)
+        self.session.request.assert_called_once()
+        sleep_mock.assert_not_called()
+
+    def test_error_raised_when_retries_exhausted(self, sleep_mock):
+        errors = {"errors": [{"name": "Throttled", "message": "too many requests"}]}
+        self.session.request.return_value = self._response(429, json=errors)
+
+        with self.assertRaises(TorqueApiError) as ctx:
+            self.client.request("sandbox", "GET")
+
+        self.assertEqual(str(ctx.exception), "Throttled: too many requests")
+        self.assertEqual(self.session.request.call_count, 3)
+
+    def test_throttling_pauses_rate_limiter(self, sleep_mock):
+        rate_limiter = Mock(spec=TokenBucket)
+        client = TorqueClient(session=self.session, rate_limiter=rate_limiter)
+        self.session.request.side_effect = [self._response(429, {"Retry-After": "2"}), self._response(200)]
+
+        client.request("sandbox", "GET")
+
+        self.assertEqual(rate_limiter.acquire.call_count, 2)
+        rate_limiter.pause.assert_called_once_with(2.0)
+
+    @mock.patch.dict(os.environ, {"TORQUE_RATE_LIMIT": "5"})
+    def test_rate_limit_from_env(self, sleep_mock):
+        client = TorqueClient(session=self.session)
+        self.assertEqual(client.rate_limiter.rate, 5)
+
+
 if __name__ == "__main__":
     unittest.main()
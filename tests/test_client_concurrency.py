@@ -0,0 +1,49 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.helpers.local_server import LocalServer, create_client
+from torque.client import TorqueClient
+
+
+class TestClientThreadSafety(unittest.TestCase):
+    THREADS = 32
+    REQUESTS_PER_THREAD = 10
+
+    def _fire_requests(self, client: TorqueClient, thread_index: int) -> None:
+        for i in range(self.REQUESTS_PER_THREAD):
+            marker = f"t{thread_index}-r{i}"
+            if i % 3 == 0:
+                client.request(f"sandbox/{marker}", "POST", {"name": marker}, {"X-Marker": marker})
+            elif i % 3 == 1:
+                client.request(f"sandbox/{marker}", "GET", headers={"X-Marker": marker})
+            else:
+                client.request(f"sandbox/{marker}", "GET")
+
+    def test_headers_do_not_bleed_between_threads(self):
+        with LocalServer({"id": "sb"}) as server:
+            client = create_client(server.host)
+            session_headers = dict(client.session.headers)
+
+            with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+                futures = [executor.submit(self._fire_requests, client, i) for i in range(self.THREADS)]
+                for future in futures:
+                    future.result()
+
+        self.assertEqual(len(server.requests), self.THREADS * self.REQUESTS_PER_THREAD)
+        self.assertEqual(dict(client.session.headers), session_headers)
+
+        for method, path, headers in server.requests:
+            marker = path.split("/")[-1]
+            index = int(marker.split("-r")[-1])
+
+            self.assertEqual(headers.get("Authorization"), "Bearer token")
+            if method == "POST":
+                self.assertEqual(headers.get("Content-Type"), "application/json")
+                self.assertEqual(headers.get("X-Marker"), marker)
+            else:
+                self.assertNotIn("Content-Type", headers)
+                self.assertEqual(headers.get("X-Marker"), marker if index % 3 == 1 else None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,7 @@
+import io
+import json
 import unittest
+from contextlib import redirect_stdout
 from unittest import mock
 from unittest.mock import Mock, patch
 
@@ -9,6 +12,7 @@ from torque.commands.bp import BlueprintsCommand
 from torque.commands.configure import ConfigureCommand
 from torque.commands.sb import SandboxesCommand
 from torque.exceptions import ConfigFileMissingError
+from torque.sandboxes import SandboxEndResult
 
 
 class TestBaseCommand(unittest.TestCase):
@@ -72,8 +76,10 @@ class TestSandboxCommand(unittest.TestCase):
         torque (sb | sandbox) start <blueprint_name> [options] [--output=json]
         torque (sb | sandbox) status <sandbox_id> [--output=json]
         torque (sb | sandbox) get <sandbox_id> [--output=json | --output=json --detail]
-        torque (sb | sandbox) end <sandbox_id>
-        torque (sb | sandbox) list [--filter={all|my|auto}] [--show-ended] [--count=<N>] [--output=json]
+        torque (sb | sandbox) end (<sandbox_ids>... | --filter=<filter> [--yes]) [--jobs=<N>] [--no-verify]
+                                  [--output=json]
+        torque (sb | sandbox) list [--filter={all|my|auto}] [--show-ended] [--count=<N>] [--page-size=<N>]
+                                   [--prefetch=<N>] [--output=json]
         torque (sb | sandbox) [--help]"""
 
         with self.assertRaises(DocoptExit) as ctx:
@@ -88,6 +94,15 @@ class TestSandboxCommand(unittest.TestCase):
         for action in command.get_actions_table():
             self.assertIn(action, expected_actions)
 
+    def test_should_warm_up(self):
+        connection = Mock(space="space", token="token", account=None, pool_size=None)
+
+        self.assertTrue(SandboxesCommand("sb start test".split(), connection).should_warm_up())
+        self.assertFalse(SandboxesCommand("sb status sb1".split(), connection).should_warm_up())
+        self.assertFalse(SandboxesCommand("sb start test".split()).should_warm_up())
+        self.assertTrue(BlueprintsCommand("bp validate test".split(), connection).should_warm_up())
+        self.assertFalse(BlueprintsCommand("bp list".split(), connection).should_warm_up())
+
     def validate_command_input(self, input_line: str, func: str) -> None:
         args = input_line.split()
         try:
@@ -124,6 +139,87 @@ class TestSandboxCommand(unittest.TestCase):
         func = "do_start"
         self.validate_command_input(line, func)
 
+    def test_list_all_walks_pages(self):
+        command = SandboxesCommand(command_args="sb list --count=all --page-size=50 --prefetch=2".split())
+        command.manager = Mock()
+        command.manager.paginate.return_value = iter([Mock(sandbox_status="Active"), Mock(sandbox_status="Ended")])
+
+        success, sandboxes = command.do_list()
+
+        self.assertTrue(success)
+        self.assertEqual(len(sandboxes), 1)
+        command.manager.paginate.assert_called_once_with(filter_opt="my", page_size=50, prefetch=2)
+        command.manager.list.assert_not_called()
+
+    def test_list_wrong_count(self):
+        line = "sb list --count=many"
+        func = "do_list"
+        self.validate_command_input(line, func)
+
+    def test_end_many_reports_results(self):
+        command = SandboxesCommand(command_args="sb end sb1 sb2 sb1 --jobs=2 --output=json".split())
+        command.manager = Mock()
+        command.manager.end_many.return_value = iter(
+            [SandboxEndResult("sb1", 0.1), SandboxEndResult("sb2", 0.3, "Sandbox sb2 not found")]
+        )
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            success, output = command.do_end()
+
+        # results are printed on stdout even when a sandbox failed
+        self.assertFalse(success)
+        self.assertIsNone(output)
+        command.manager.end_many.assert_called_once_with(["sb1", "sb2"], jobs=2, verify=True)
+        report = json.loads(stdout.getvalue())
+        self.assertEqual([result["id"] for result in report["results"]], ["sb1", "sb2"])
+        self.assertEqual(report["summary"]["ended"], 1)
+        self.assertEqual(report["summary"]["failed"], 1)
+        self.assertEqual(report["summary"]["latency_max"], 0.3)
+
+    @patch("sys.stdin", io.StringIO("sb1\nsb2 sb3\n"))
+    def test_end_ids_from_stdin(self):
+        command = SandboxesCommand(command_args="sb end - --no-verify".split())
+        command.manager = Mock()
+        command.manager.end_many.return_value = iter([])
+
+        with redirect_stdout(io.StringIO()):
+            command.do_end()
+
+        command.manager.end_many.assert_called_once_with(["sb1", "sb2", "sb3"], jobs=10, verify=False)
+
+    def test_end_other_users_sandboxes_requires_confirmation(self):
+        sandboxes = [Mock(sandbox_id="sb1", sandbox_status="Active"), Mock(sandbox_id="sb2", sandbox_status="Ended")]
+        command = SandboxesCommand(command_args="sb end --filter=all".split())
+        command.manager = Mock()
+        command.manager.paginate.return_value = iter(sandboxes)
+
+        success, message = command.do_end()
+
+        self.assertFalse(success)
+        self.assertIn("Add --yes", message)
+        command.manager.end_many.assert_not_called()
+
+        command = SandboxesCommand(command_args="sb end --filter=all --yes --output=json".split())
+        command.manager = Mock()
+        command.manager.paginate.return_value = iter(sandboxes)
+        command.manager.end_many.return_value = iter([SandboxEndResult("sb1", 0.1)])
+        with redirect_stdout(io.StringIO()):
+            success, _ = command.do_end()
+
+        self.assertTrue(success)
+        command.manager.end_many.assert_called_once_with(["sb1"], jobs=10, verify=True)
+
+    def test_end_wrong_jobs(self):
+        line = "sb end sb1 sb2 --jobs=0"
+        func = "do_end"
+        self.validate_command_input(line, func)
+
+    def test_end_wrong_filter(self):
+        line = "sb end --filter=everything"
+        func = "do_end"
+        self.validate_command_input(line, func)
+
 
 class TestConfigureCommand(unittest.TestCase):
     def test_base_help_usage_line(self):
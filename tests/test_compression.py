@@ -0,0 +1,49 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+from tests.helpers.local_server import LocalServer, create_client
+from torque.client import TorqueClient
+from torque.constants import COMPRESSION_MIN_SIZE
+from torque.models.blueprints import BlueprintsManager
+from torque.sandboxes import SandboxesManager
+
+
+class TestCompression(unittest.TestCase):
+    catalog = [{"blueprint_name": f"bp{i}", "url": f"http://example.com/{i}", "enabled": True} for i in range(500)]
+
+    def test_gzip_response_negotiated_and_decoded(self):
+        with LocalServer(self.catalog, gzip_responses=True) as server:
+            result = BlueprintsManager(create_client(server.host)).list_detailed()
+
+        self.assertEqual(result, self.catalog)
+        self.assertIn("gzip", server.requests[0][2]["Accept-Encoding"])
+
+    def test_large_request_body_compressed(self):
+        inputs = {f"input{i}": "x" * 100 for i in range(COMPRESSION_MIN_SIZE // 100)}
+        with LocalServer({"id": "sb1"}) as server:
+            SandboxesManager(create_client(server.host, compress_requests=True)).start("sb", "bp", inputs=inputs)
+
+        self.assertEqual(server.requests[0][2]["Content-Encoding"], "gzip")
+        self.assertLess(int(server.requests[0][2]["Content-Length"]), COMPRESSION_MIN_SIZE)
+        self.assertEqual(json.loads(server.request_bodies[0])["inputs"], inputs)
+
+    def test_small_request_body_not_compressed(self):
+        with LocalServer({"id": "sb1"}) as server:
+            SandboxesManager(create_client(server.host, compress_requests=True)).start("sb", "bp", inputs={"a": "b"})
+
+        self.assertNotIn("Content-Encoding", server.requests[0][2])
+        self.assertEqual(server.requests[0][2]["Content-Type"], "application/json")
+        self.assertEqual(json.loads(server.request_bodies[0])["inputs"], {"a": "b"})
+
+    def test_request_compression_disabled_by_default(self):
+        self.assertFalse(TorqueClient().compress_requests)
+
+    @mock.patch.dict(os.environ, {"TORQUE_COMPRESS_REQUESTS": "true"})
+    def test_request_compression_enabled_from_env(self):
+        self.assertTrue(TorqueClient().compress_requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import functools
+import io
+import os
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+from docopt import docopt
+
+from tests.helpers.local_server import create_client
+from tests.helpers.torque_server import TorqueServer
+from torque import daemon, shell
+from torque.daemon import DaemonClient, DaemonServer
+from torque.parsers.global_input_parser import GlobalInputParser
+
+
+@unittest.skipUnless(hasattr(daemon.socket, "AF_UNIX"), "Unix sockets are not supported")
+class TestDaemon(unittest.TestCase):
+    sandbox = {"id": "sb1", "name": "sb1", "blueprint_name": "bp1", "sandbox_status": "Active"}
+    credentials = ["--token=token", "--space=space", "--disable-version-check"]
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.socket_path = os.path.join(self.temp_dir.name, "daemon.sock")
+
+        self.server = TorqueServer(sandboxes=[dict(self.sandbox)])
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+
+        client_class = functools.partial(create_client, self.server.host)
+        patcher = patch("torque.client.TorqueClient", client_class)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.daemon = DaemonServer(self.socket_path)
+        thread = threading.Thread(target=self.daemon.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+        self.addCleanup(self.daemon.server_close)
+        self.addCleanup(self.daemon.shutdown)
+
+    def _run(self, argv: list) -> (int, str, str):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            exit_code = DaemonClient(self.socket_path).run(argv)
+        return exit_code, stdout.getvalue(), stderr.getvalue()
+
+    def test_run_command(self):
+        exit_code, stdout, _ = self._run(self.credentials + ["sb", "status", "sb1"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn("Active", stdout)
+
+    def test_connection_is_reused_between_commands(self):
+        for _ in range(3):
+            self.assertEqual(self._run(self.credentials + ["sb", "status", "sb1"])[0], 0)
+
+        self.assertEqual(self.server.connections_count, 1)
+        self.assertEqual(self.daemon.state.stats["clients"], 1)
+        self.assertEqual(self.daemon.state.stats["commands"], 3)
+
+    def test_failed_command(self):
+        exit_code, _, stderr = self._run(self.credentials + ["sb", "status"])
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("usage:", stderr)
+
+    def test_help(self):
+        exit_code, stdout, _ = self._run(["sb", "--help"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn("torque (sb | sandbox) start", stdout)
+
+    def test_environment_is_restored(self):
+        with patch.dict(os.environ, {"TORQUE_SPACE": "space"}):
+            self._run(["--token=token", "sb", "status", "sb1"])
+            self.assertEqual(os.environ["TORQUE_SPACE"], "space")
+        self.assertEqual(self.server.requests[-1][1], "/api/spaces/space/sandbox/sb1")
+
+    def test_busy_daemon(self):
+        started, finished = threading.Event(), threading.Event()
+
+        def run(argv: list, env: dict) -> int:
+            started.set()
+            finished.wait(5)
+            return 0
+
+        with patch.object(self.daemon.state, "run", side_effect=run):
+            client = DaemonClient(self.socket_path)
+            thread = threading.Thread(target=client.run, args=(["sb", "start", "bp1", "--wait=30"],))
+            thread.start()
+            started.wait(1)
+
+            # the CLI runs the command in-process instead of waiting for the running one
+            self.assertIsNone(client.run(["sb", "status", "sb1"]))
+            self.assertIsNotNone(client.status())
+
+            finished.set()
+            thread.join()
+
+        self.assertEqual(self._run(self.credentials + ["sb", "status", "sb1"])[0], 0)
+
+    def test_stop_waits_for_running_command(self):
+        started, finished = threading.Event(), threading.Event()
+
+        def run(argv: list, env: dict) -> int:
+            started.set()
+            finished.wait(5)
+            return 0
+
+        with patch.object(self.daemon.state, "run", side_effect=run):
+            client = DaemonClient(self.socket_path)
+            thread = threading.Thread(target=client.run, args=(["sb", "start", "bp1"],))
+            thread.start()
+            started.wait(1)
+
+            self.assertTrue(client.stop())
+            self.assertIsNotNone(client.status())
+            finished.set()
+            thread.join()
+
+    def test_status_and_stop(self):
+        client = DaemonClient(self.socket_path)
+
+        self.assertEqual(client.status()["pid"], os.getpid())
+        self.assertTrue(client.stop())
+
+    def test_no_daemon(self):
+        client = DaemonClient(os.path.join(self.temp_dir.name, "missing.sock"))
+
+        self.assertIsNone(client.run(["sb", "status", "sb1"]))
+        self.assertIsNone(client.status())
+        self.assertFalse(client.stop())
+
+
+class TestShouldForward(unittest.TestCase):
+    def _parse(self, argv: list) -> GlobalInputParser:
+        return GlobalInputParser(docopt(shell.__doc__, argv=argv, options_first=True))
+
+    @unittest.skipUnless(hasattr(daemon.socket, "AF_UNIX"), "Unix sockets are not supported")
+    def test_sandbox_commands_are_forwarded(self):
+        self.assertTrue(daemon.should_forward(self._parse(["sb", "status", "sb1"])))
+        self.assertTrue(daemon.should_forward(self._parse(["bp", "validate", "bp1"])))
+
+    def test_local_commands(self):
+        self.assertFalse(daemon.should_forward(self._parse(["configure", "list"])))
+        self.assertFalse(daemon.should_forward(self._parse(["daemon", "stop"])))
+
+    @unittest.skipUnless(hasattr(daemon.socket, "AF_UNIX"), "Unix sockets are not supported")
+    def test_commands_reading_stdin_run_in_process(self):
+        self.assertFalse(daemon.should_forward(self._parse(["sb", "end", "-"])))
+        self.assertFalse(daemon.should_forward(self._parse(["--space=space", "sb", "end", "-", "--no-verify"])))
+
+    def test_process_wide_options_run_in_process(self):
+        self.assertFalse(daemon.should_forward(self._parse(["--timings", "sb", "list"])))
+        self.assertFalse(daemon.should_forward(self._parse(["--deadline=60", "sb", "list"])))
+        self.assertFalse(daemon.should_forward(self._parse(["--profiler=cpu", "sb", "list"])))
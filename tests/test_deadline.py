@@ -0,0 +1,162 @@
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from tests.helpers.local_server import create_client
+from tests.helpers.torque_server import TorqueServer
+from torque.branch.branch_utils import create_remote_branch, delete_temp_remote_branch, switch_to_temp_branch
+from torque.deadline import Deadline
+from torque.exceptions import DeadlineExceededError
+from torque.retry import RetryPolicy
+from torque.sandboxes import SandboxesManager
+from torque.services.waiter import Waiter
+
+
+class TestDeadline(unittest.TestCase):
+    def test_disabled(self):
+        deadline = Deadline()
+        with deadline.stage("http"):
+            pass
+
+        self.assertIsNone(deadline.remaining())
+        self.assertEqual(deadline.cap(5, "http"), 5)
+        self.assertFalse(deadline.expired)
+        self.assertEqual(deadline.stages, {})
+
+    def test_cap_to_remaining(self):
+        deadline = Deadline()
+        deadline.start(10)
+
+        self.assertEqual(deadline.cap(1, "http"), 1)
+        self.assertLessEqual(deadline.cap(60, "http"), 10)
+        self.assertLessEqual(deadline.cap(None, "git"), 10)
+
+    def test_exceeded(self):
+        deadline = Deadline()
+        deadline.start(0.05)
+        time.sleep(0.06)
+
+        with self.assertRaises(DeadlineExceededError):
+            deadline.cap(5, "wait")
+        with self.assertRaises(DeadlineExceededError):
+            with deadline.stage("http"):
+                pass
+
+        self.assertEqual(deadline.exceeded_stage, "wait")
+        self.assertIn("exceeded during wait", deadline.format_report())
+
+    def test_cleanup_stage_runs_after_deadline(self):
+        deadline = Deadline()
+        deadline.start(0.01)
+        time.sleep(0.02)
+
+        with deadline.stage("git", check=False):
+            cleaned_up = True
+
+        self.assertTrue(cleaned_up)
+        self.assertIsNone(deadline.exceeded_stage)
+
+    def test_nested_stages_not_counted_twice(self):
+        deadline = Deadline()
+        deadline.start(10)
+        with deadline.stage("wait"):
+            time.sleep(0.05)
+            with deadline.stage("http"):
+                time.sleep(0.1)
+            time.sleep(0.05)
+
+        self.assertAlmostEqual(deadline.stages["wait"], 0.1, delta=0.04)
+        self.assertAlmostEqual(deadline.stages["http"], 0.1, delta=0.04)
+
+    def test_stage_spending_budget_is_reported(self):
+        deadline = Deadline()
+        deadline.start(0.05)
+        with deadline.stage("git"):
+            time.sleep(0.06)
+
+        self.assertEqual(deadline.exceeded_stage, "git")
+        report = deadline.format_report()
+        self.assertIn("git", report)
+        self.assertIn("other", report)
+
+
+class TestDeadlinePropagation(unittest.TestCase):
+    def setUp(self):
+        self.deadline = Deadline()
+        for module in ["torque.client", "torque.services.waiter", "torque.branch.branch_utils"]:
+            patcher = patch(f"{module}.deadline", self.deadline)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_http_timeout_limited_by_deadline(self):
+        with TorqueServer(latency=2) as server:
+            client = create_client(server.host, retry_policy=RetryPolicy(backoff_base=0.01))
+            self.deadline.start(0.3)
+
+            start = time.perf_counter()
+            with self.assertRaises((DeadlineExceededError, requests.Timeout)):
+                SandboxesManager(client).list()
+
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(self.deadline.exceeded_stage, "http")
+
+    def test_wait_limited_by_deadline(self):
+        sandbox = {"id": "sb1", "name": "sb1", "blueprint_name": "bp", "sandbox_status": "Launching"}
+        with TorqueServer(sandboxes=[sandbox]) as server:
+            client = create_client(server.host)
+            command = Mock()
+            command.global_input_parser.output_json = True
+            context_branch = Mock(temp_branch_exists=False)
+            self.deadline.start(0.3)
+
+            start = time.perf_counter()
+            with self.assertRaises(DeadlineExceededError):
+                Waiter.wait_for_sandbox_to_launch(command, SandboxesManager(client), "sb1", 30, context_branch, True)
+
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertIn("wait", self.deadline.stages)
+        self.assertEqual(self.deadline.exceeded_stage, "wait")
+
+    def test_git_push_killed_after_remaining_time(self):
+        repo = Mock()
+        self.deadline.start(30)
+
+        create_remote_branch(repo, "tmp-branch")
+        delete_temp_remote_branch(repo, "tmp-branch")
+
+        push_timeout = repo.git.push.call_args_list[0][1]["kill_after_timeout"]
+        self.assertTrue(0 < push_timeout <= 30)
+        self.assertGreaterEqual(repo.git.push.call_args_list[1][1]["kill_after_timeout"], 10)
+
+    def test_git_without_deadline(self):
+        repo = Mock()
+        create_remote_branch(repo, "tmp-branch")
+
+        repo.git.push.assert_called_once_with("origin", "tmp-branch")
+
+    def test_git_push_on_windows(self):
+        repo = Mock()
+        self.deadline.start(30)
+
+        with patch("torque.branch.branch_utils.sys.platform", "win32"):
+            create_remote_branch(repo, "tmp-branch")
+            delete_temp_remote_branch(repo, "tmp-branch")
+
+        for call in repo.git.push.call_args_list:
+            self.assertNotIn("kill_after_timeout", call[1])
+
+    def test_late_git_push_cleaned_up(self):
+        repo = Mock(is_dirty=Mock(return_value=False), untracked_files=[])
+        repo.git.stash.return_value = ""
+        repo.git.push.side_effect = lambda *args, **kwargs: time.sleep(0.2)
+        self.deadline.start(0.1)
+
+        with patch("torque.branch.branch_utils.sys.platform", "win32"), patch(
+            "torque.branch.branch_utils.revert_from_local_temp_branch"
+        ), self.assertRaises(DeadlineExceededError):
+            switch_to_temp_branch(repo, "main")
+
+        self.assertEqual(self.deadline.exceeded_stage, "git")
+        self.assertEqual(repo.git.push.call_args_list[1][0][:2], ("origin", "--delete"))
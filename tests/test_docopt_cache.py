@@ -0,0 +1,113 @@
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import docopt as docopt_module
+from docopt import DocoptExit
+
+from torque import shell
+from torque.commands.bp import BlueprintsCommand
+from torque.commands.configure import ConfigureCommand
+from torque.commands.sb import SandboxesCommand
+from torque.parsers import docopt_cache
+from torque.parsers.docopt_cache import GrammarCache, UsageGrammar, docopt
+
+
+class TestGrammarCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def test_grammar_is_stored_on_disk(self):
+        GrammarCache(self.cache_dir).get(SandboxesCommand.__doc__)
+
+        # a new process only reads the pickle
+        with patch.object(docopt_module, "parse_pattern", side_effect=AssertionError):
+            grammar = GrammarCache(self.cache_dir).get(SandboxesCommand.__doc__)
+
+        self.assertIsInstance(grammar, UsageGrammar)
+        self.assertEqual(grammar.usage, docopt_module.printable_usage(SandboxesCommand.__doc__))
+
+    def test_grammar_is_kept_in_memory(self):
+        cache = GrammarCache(self.cache_dir)
+        self.assertIs(cache.get(BlueprintsCommand.__doc__), cache.get(BlueprintsCommand.__doc__))
+
+    def test_key_depends_on_doc(self):
+        self.assertNotEqual(GrammarCache.make_key(BlueprintsCommand.__doc__), GrammarCache.make_key("usage: torque"))
+
+    def test_broken_cache_file_is_rebuilt(self):
+        cache = GrammarCache(self.cache_dir)
+        with open(cache._get_path(cache.make_key(BlueprintsCommand.__doc__)), "wb") as cache_file:
+            cache_file.write(b"not a pickle")
+
+        grammar = GrammarCache(self.cache_dir).get(BlueprintsCommand.__doc__)
+        self.assertEqual(grammar.usage, docopt_module.printable_usage(BlueprintsCommand.__doc__))
+
+    def test_read_only_cache_dir(self):
+        with patch("torque.parsers.docopt_cache.open", side_effect=PermissionError, create=True):
+            grammar = GrammarCache(self.cache_dir).get(BlueprintsCommand.__doc__)
+        self.assertIsInstance(grammar, UsageGrammar)
+
+
+class TestCachedDocopt(unittest.TestCase):
+    """The cached parser must give the same results as docopt.docopt"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        patcher = patch.object(docopt_cache, "grammar_cache", GrammarCache(self.cache_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_same_result(self, doc: str, argv: list, **kwargs):
+        expected = docopt_module.docopt(doc, argv=argv, **kwargs)
+        # twice, the second run uses the cached grammar
+        self.assertEqual(docopt(doc, argv=argv, **kwargs), expected)
+        self.assertEqual(docopt(doc, argv=argv, **kwargs), expected)
+
+    def test_commands(self):
+        self.assert_same_result(SandboxesCommand.__doc__, ["sb", "list", "--filter=my", "--count=5"])
+        self.assert_same_result(SandboxesCommand.__doc__, ["sb", "start", "bp", "-d", "10", "-i", "a=1", "-w"])
+        self.assert_same_result(SandboxesCommand.__doc__, ["sandbox", "get", "sb1", "--output=json", "--detail"])
+        self.assert_same_result(BlueprintsCommand.__doc__, ["bp", "validate", "bp1", "-b", "main"])
+        self.assert_same_result(ConfigureCommand.__doc__, ["configure", "set", "--login"])
+
+    def test_global_options(self):
+        argv = ["--space=s", "--timings", "sb", "list", "--count=5"]
+        self.assert_same_result(shell.__doc__, argv, options_first=True, version="1.0")
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(DocoptExit) as ctx:
+            docopt(SandboxesCommand.__doc__, argv=["sb", "status"])
+        self.assertEqual(DocoptExit.usage, docopt_module.printable_usage(SandboxesCommand.__doc__))
+        self.assertTrue(str(ctx.exception).startswith("usage:"))
+
+    def test_defaults_not_shared_between_calls(self):
+        docopt(SandboxesCommand.__doc__, argv=["sb", "end", "--filter=all"])["<sandbox_ids>"].append("sb1")
+
+        self.assertEqual(docopt(SandboxesCommand.__doc__, argv=["sb", "end", "--filter=my"])["<sandbox_ids>"], [])
+
+    def test_usage_per_thread(self):
+        parsed = threading.Barrier(2)
+        messages = {}
+
+        def validate(doc: str, argv: list) -> None:
+            docopt(doc, argv=argv)
+            # the other thread parsed its own usage meanwhile
+            parsed.wait()
+            messages[argv[0]] = str(DocoptExit("invalid value"))
+
+        threads = [
+            threading.Thread(target=validate, args=(SandboxesCommand.__doc__, ["sb", "status", "sb1"])),
+            threading.Thread(target=validate, args=(BlueprintsCommand.__doc__, ["bp", "list"])),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertIn("torque (sb | sandbox) status", messages["sb"])
+        self.assertIn("torque (bp | blueprint) list", messages["bp"])
+        self.assertNotIn("torque (sb | sandbox)", messages["bp"])
@@ -0,0 +1,135 @@
+import itertools
+import time
+import unittest
+from unittest.mock import Mock
+
+from requests import ConnectionError
+
+from tests.helpers.local_server import create_client
+from tests.helpers.torque_server import TorqueServer
+from torque.hedging import HedgingPolicy
+from torque.sandboxes import SandboxesManager
+
+
+def make_send(delays: list):
+    """Returns a send callable sleeping for the next delay in the list, None raises a connection error"""
+    delays = iter(delays)
+    responses = []
+
+    def send():
+        delay = next(delays)
+        if delay is None:
+            raise ConnectionError("connection reset")
+        time.sleep(delay)
+        response = Mock()
+        response.elapsed.total_seconds.return_value = delay
+        response.delay = delay
+        responses.append(response)
+        return response
+
+    return send, responses
+
+
+class TestHedgingPolicy(unittest.TestCase):
+    def _create_policy(self) -> HedgingPolicy:
+        return HedgingPolicy(initial_delay=0.05, max_extra_load=1)
+
+    def test_fast_request_not_hedged(self):
+        policy = self._create_policy()
+        send, _ = make_send([0])
+
+        self.assertEqual(policy.execute(send).delay, 0)
+        self.assertEqual(policy.stats, {"requests": 1, "hedges": 0, "hits": 0, "wasted": 0})
+
+    def test_hedge_wins_over_slow_request(self):
+        policy = self._create_policy()
+        send, responses = make_send([1, 0])
+
+        start = time.perf_counter()
+        response = policy.execute(send)
+
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(response.delay, 0)
+        self.assertEqual(policy.stats, {"requests": 1, "hedges": 1, "hits": 1, "wasted": 0})
+
+        # the losing response is closed once it arrives
+        time.sleep(1.1)
+        self.assertTrue(responses[1].close.called)
+
+    def test_wasted_hedge(self):
+        policy = self._create_policy()
+        send, _ = make_send([0.1, 0.5])
+
+        self.assertEqual(policy.execute(send).delay, 0.1)
+        self.assertEqual(policy.stats, {"requests": 1, "hedges": 1, "hits": 0, "wasted": 1})
+
+    def test_failed_request_falls_back_to_hedge(self):
+        policy = self._create_policy()
+        send, _ = make_send([None, 0])
+
+        # the primary fails before the hedge delay, so the error is returned without hedging
+        with self.assertRaises(ConnectionError):
+            policy.execute(send)
+
+        send, _ = make_send([0.1, None])
+        self.assertEqual(policy.execute(send).delay, 0.1)
+
+    def test_extra_load_capped(self):
+        policy = HedgingPolicy(initial_delay=0.01, max_extra_load=0.25)
+        send, _ = make_send(itertools.repeat(0.03))
+
+        for _ in range(20):
+            policy.execute(send)
+
+        self.assertEqual(policy.hedges, 5)
+
+    def test_delay_follows_percentile(self):
+        policy = HedgingPolicy(percent=90, initial_delay=1, min_delay=0.01)
+        self.assertEqual(policy.get_delay(), 1)
+
+        for latency in range(1, 101):
+            policy.record_latency(latency / 1000)
+
+        self.assertAlmostEqual(policy.get_delay(), 0.09)
+
+
+class TestClientHedging(unittest.TestCase):
+    def test_slow_replica_hedged(self):
+        # every tenth request hits a slow replica
+        delays = itertools.cycle([0.5] + [0.01] * 9)
+        sandbox = {"id": "sb1", "name": "sb1", "blueprint_name": "bp"}
+
+        with TorqueServer(sandboxes=[sandbox], latency=lambda: next(delays)) as server:
+            policy = HedgingPolicy(initial_delay=0.1, max_extra_load=0.2)
+            client = create_client(server.host, hedging_policy=policy)
+            manager = SandboxesManager(client)
+
+            start = time.perf_counter()
+            for _ in range(30):
+                self.assertEqual(manager.get("sb1", refresh=True).sandbox_id, "sb1")
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(policy.requests, 30)
+        self.assertGreater(policy.hits, 0)
+        self.assertLess(elapsed, 1.5)
+
+    def test_hedge_takes_rate_limit_token(self):
+        sandbox = {"id": "sb1", "name": "sb1", "blueprint_name": "bp"}
+        delays = iter([0.3, 0.01])
+
+        with TorqueServer(sandboxes=[sandbox], latency=lambda: next(delays, 0.01)) as server:
+            policy = HedgingPolicy(initial_delay=0.05, max_extra_load=1)
+            rate_limiter = Mock()
+            client = create_client(server.host, hedging_policy=policy, rate_limiter=rate_limiter)
+            SandboxesManager(client).get("sb1")
+
+        self.assertEqual(policy.hedges, 1)
+        self.assertEqual(rate_limiter.acquire.call_count, 2)
+
+    def test_post_not_hedged(self):
+        with TorqueServer() as server:
+            policy = HedgingPolicy(initial_delay=0)
+            client = create_client(server.host, hedging_policy=policy)
+            SandboxesManager(client).start("sb", "bp")
+
+        self.assertEqual(policy.requests, 0)
@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# runs the real entry point, help output exits before any config is read or request is sent
+MAIN = "import sys; from torque import shell; sys.argv = ['torque', '--disable-version-check'] + sys.argv[1:]; shell.main()"
+
+HEAVY_MODULES = ["git", "yaml", "requests", "yaspin", "tabulate", "httpx", "pkg_resources"]
+
+
+def import_profile(*args) -> dict:
+    """Cumulative import time in microseconds of every module imported by the CLI, from python -X importtime"""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("TORQUE_")}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", MAIN] + list(args),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        env=env,
+    )
+
+    profile = {}
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if started:
+            profile[name.strip()] = (int(cumulative), not name.startswith("  "))
+        # interpreter startup ends with site, everything after is imported by the CLI
+        started = started or name.strip() == "site"
+    return profile
+
+
+class TestImportTime(unittest.TestCase):
+    """Guards CLI cold start: commands must not import modules they do not use
+
+    Import time budgets depend on the machine, they are checked in tests/benchmarks/bench_import_time.py.
+    """
+
+    def assert_imports(self, args: list, allowed: list = None):
+        profile = import_profile(*args)
+        self.assertIn("torque.shell", profile)
+
+        unexpected = [m for m in HEAVY_MODULES if m in profile and m not in (allowed or [])]
+        self.assertEqual(unexpected, [], f"'torque {' '.join(args)}' imported {unexpected}")
+
+    def test_help(self):
+        self.assert_imports(["-h"])
+
+    def test_configure(self):
+        self.assert_imports(["configure", "-h"])
+
+    def test_sandbox(self):
+        self.assert_imports(["sb", "-h"], allowed=["requests"])
+
+    def test_blueprint(self):
+        self.assert_imports(["bp", "-h"], allowed=["requests"])
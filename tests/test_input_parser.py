@@ -3,6 +3,8 @@ import unittest
 from unittest import mock
 from unittest.mock import Mock
 
+from docopt import DocoptExit
+
 from torque.parsers.global_input_parser import GlobalInputParser
 
 
@@ -249,3 +251,35 @@ class TestGlobalInputParser(unittest.TestCase):
 
         # assert
         self.assertIsNone(config_path)
+
+    def test_get_deadline_from_args(self):
+        # arrange
+        args = {"--deadline": "90.5"}
+        input_parser = GlobalInputParser(args)
+
+        # act
+        deadline = input_parser.deadline
+
+        # assert
+        self.assertEqual(deadline, 90.5)
+
+    def test_get_deadline_invalid(self):
+        for value in ["soon", "0", "-5"]:
+            input_parser = GlobalInputParser({"--deadline": value})
+            with self.assertRaises(DocoptExit):
+                _ = input_parser.deadline
+
+    def test_get_profiler_from_args(self):
+        self.assertEqual(GlobalInputParser({"--profiler": "startup"}).profiler, "startup")
+        self.assertIsNone(GlobalInputParser({}).profiler)
+
+    def test_profiler_summary_profiles_cpu(self):
+        input_parser = GlobalInputParser({"--profiler-summary": True})
+
+        self.assertTrue(input_parser.profiler_summary)
+        self.assertEqual(input_parser.profiler, "cpu")
+
+    def test_get_profiler_invalid(self):
+        input_parser = GlobalInputParser({"--profiler": "memory"})
+        with self.assertRaises(DocoptExit):
+            _ = input_parser.profiler
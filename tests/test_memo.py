@@ -0,0 +1,155 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from torque.memo import RequestMemo
+
+
+class TestRequestMemo(unittest.TestCase):
+    def setUp(self):
+        self.memo = RequestMemo(ttl=10)
+        self.fetches = 0
+
+    def _fetch(self, result=None, delay: float = 0):
+        def fetch():
+            self.fetches += 1
+            time.sleep(delay)
+            return result if result is not None else {"fetch": self.fetches}
+
+        return fetch
+
+    def test_result_reused_within_ttl(self):
+        key = self.memo.make_key("http://host/api/sandbox/sb1")
+        first = self.memo.get_or_fetch(key, self._fetch())
+        second = self.memo.get_or_fetch(key, self._fetch())
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.fetches, 1)
+        self.assertEqual(self.memo.stats, {"calls": 2, "hits": 1, "coalesced": 0})
+
+    def test_result_expires(self):
+        memo = RequestMemo(ttl=0)
+        key = memo.make_key("http://host/api/sandbox/sb1")
+        memo.get_or_fetch(key, self._fetch())
+        memo.get_or_fetch(key, self._fetch())
+
+        self.assertEqual(self.fetches, 2)
+
+    def test_results_are_copies(self):
+        key = self.memo.make_key("http://host/api/sandbox/sb1")
+        self.memo.get_or_fetch(key, self._fetch({"errors": []}))["errors"].append("changed")
+
+        self.assertEqual(self.memo.get_or_fetch(key, self._fetch()), {"errors": []})
+
+    def test_key_includes_params(self):
+        self.memo.get_or_fetch(self.memo.make_key("http://host/api/sandbox", {"count": 1}), self._fetch())
+        self.memo.get_or_fetch(self.memo.make_key("http://host/api/sandbox", {"count": 2}), self._fetch())
+
+        self.assertEqual(self.fetches, 2)
+
+    def test_concurrent_calls_coalesced(self):
+        key = self.memo.make_key("http://host/api/sandbox/sb1")
+        fetch = self._fetch(delay=0.2)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: self.memo.get_or_fetch(key, fetch), range(8)))
+
+        self.assertEqual(self.fetches, 1)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(self.memo.coalesced, 7)
+
+    def test_errors_not_memoized(self):
+        key = self.memo.make_key("http://host/api/sandbox/sb1")
+
+        def fail():
+            raise ValueError("failed")
+
+        with self.assertRaises(ValueError):
+            self.memo.get_or_fetch(key, fail)
+
+        self.assertEqual(self.memo.get_or_fetch(key, self._fetch()), {"fetch": 1})
+
+    def test_invalidate_url_and_below(self):
+        keys = [self.memo.make_key(url) for url in ["http://h/sandbox", "http://h/sandbox/sb1", "http://h/sandboxes"]]
+        for key in keys:
+            self.memo.get_or_fetch(key, self._fetch())
+
+        self.memo.invalidate("http://h/sandbox")
+        for key in keys:
+            self.memo.get_or_fetch(key, self._fetch())
+
+        self.assertEqual(self.fetches, 5)
+
+    def test_invalidated_in_flight_result_not_stored(self):
+        key = self.memo.make_key("http://host/api/sandbox/sb1")
+        started = threading.Event()
+
+        def fetch():
+            started.set()
+            time.sleep(0.1)
+            return {"status": "stale"}
+
+        thread = threading.Thread(target=self.memo.get_or_fetch, args=(key, fetch))
+        thread.start()
+        started.wait()
+        self.memo.invalidate("http://host/api/sandbox/sb1")
+        thread.join()
+
+        self.assertEqual(self.memo.get_or_fetch(key, self._fetch({"status": "fresh"})), {"status": "fresh"})
+
+    def test_invalidated_in_flight_failure_releases_waiters(self):
+        key = self.memo.make_key("http://host/api/sandbox/sb1")
+        started = threading.Event()
+        invalidated = threading.Event()
+        errors = []
+
+        def fail():
+            started.set()
+            invalidated.wait()
+            raise ValueError("failed")
+
+        def get_or_fetch(fetch):
+            try:
+                self.memo.get_or_fetch(key, fetch)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=get_or_fetch, args=(fail,), daemon=True)]
+        threads[0].start()
+        started.wait()
+        threads.append(threading.Thread(target=get_or_fetch, args=(self._fetch(),), daemon=True))
+        threads[1].start()
+        while not self.memo.coalesced:
+            time.sleep(0.01)
+        self.memo.invalidate("http://host/api/sandbox")
+        invalidated.set()
+        for thread in threads:
+            thread.join(timeout=1)
+
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual([type(e) for e in errors], [ValueError, ValueError])
+
+    def test_invalidated_in_flight_request_keeps_newer_one(self):
+        key = self.memo.make_key("http://host/api/sandbox/sb1")
+        started = threading.Event()
+        invalidated = threading.Event()
+
+        def fetch():
+            started.set()
+            invalidated.wait()
+            return {"status": "stale"}
+
+        thread = threading.Thread(target=self.memo.get_or_fetch, args=(key, fetch))
+        thread.start()
+        started.wait()
+        self.memo.invalidate("http://host/api/sandbox/sb1")
+
+        newer = threading.Thread(target=self.memo.get_or_fetch, args=(key, self._fetch({"status": "fresh"}, 0.2)))
+        newer.start()
+        time.sleep(0.05)
+        invalidated.set()
+        thread.join()
+        newer.join()
+
+        self.assertEqual(self.memo.get_or_fetch(key, self._fetch()), {"status": "fresh"})
+        self.assertEqual(self.fetches, 1)
@@ -0,0 +1,87 @@
+import threading
+import time
+import unittest
+from urllib.parse import parse_qs, urlparse
+
+from tests.helpers.local_server import LocalServer, create_client
+from torque.paging import PrefetchingPager
+from torque.sandboxes import SandboxesManager
+
+
+class TestPrefetchingPager(unittest.TestCase):
+    def setUp(self) -> None:
+        self.items = list(range(95))
+        self.calls = []
+
+    def fetch_page(self, offset: int, limit: int) -> list:
+        self.calls.append((offset, limit))
+        return self.items[offset : offset + limit]
+
+    def test_walks_all_pages(self):
+        for prefetch in [0, 1, 3]:
+            self.calls = []
+            self.assertEqual(list(PrefetchingPager(self.fetch_page, page_size=10, prefetch=prefetch)), self.items)
+            self.assertEqual(self.calls, [(offset, 10) for offset in range(0, 100, 10)])
+
+    def test_exact_multiple_of_page_size_ends_with_empty_page(self):
+        self.items = list(range(20))
+        self.assertEqual(list(PrefetchingPager(self.fetch_page, page_size=10)), self.items)
+        self.assertEqual(self.calls, [(0, 10), (10, 10), (20, 10)])
+
+    def test_next_page_fetched_while_current_is_consumed(self):
+        second_page_requested = threading.Event()
+
+        def fetch_page(offset, limit):
+            if offset == 10:
+                second_page_requested.set()
+            return self.fetch_page(offset, limit)
+
+        iterator = iter(PrefetchingPager(fetch_page, page_size=10, prefetch=1))
+        self.assertEqual(next(iterator), 0)
+        self.assertTrue(second_page_requested.wait(timeout=1))
+
+    def test_prefetch_depth_bounds_fetched_pages(self):
+        iterator = iter(PrefetchingPager(self.fetch_page, page_size=10, prefetch=2))
+        next(iterator)
+        time.sleep(0.2)
+        # the page being consumed, two queued pages and one blocked in put
+        self.assertLessEqual(len(self.calls), 4)
+        iterator.close()
+
+    def test_fetch_error_raised_to_consumer(self):
+        def fetch_page(offset, limit):
+            if offset:
+                raise RuntimeError("boom")
+            return self.fetch_page(offset, limit)
+
+        iterator = iter(PrefetchingPager(fetch_page, page_size=10, prefetch=1))
+        with self.assertRaises(RuntimeError):
+            list(iterator)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            PrefetchingPager(self.fetch_page, page_size=0)
+        with self.assertRaises(ValueError):
+            PrefetchingPager(self.fetch_page, prefetch=-1)
+
+
+class TestSandboxesPagination(unittest.TestCase):
+    history = [{"id": f"sb{i}", "name": f"sb{i}", "blueprint_name": "bp", "sandbox_status": "Ended"} for i in range(57)]
+
+    def respond(self, method: str, path: str) -> list:
+        query = parse_qs(urlparse(path).query)
+        skip, count = int(query["skip"][0]), int(query["count"][0])
+        return self.history[skip : skip + count]
+
+    def test_paginate_walks_full_history(self):
+        with LocalServer(self.respond) as server:
+            client = create_client(server.host)
+            sandboxes = list(SandboxesManager(client).paginate(filter_opt="all", page_size=20, prefetch=2))
+
+        self.assertEqual([sb.sandbox_id for sb in sandboxes], [sb["id"] for sb in self.history])
+        self.assertEqual(len(server.requests), 3)
+        self.assertTrue(all("filter=all" in path for _, path, _ in server.requests))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import pstats
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from tests.helpers.local_server import LocalServer, create_client
+from torque.profiler import Profiler
+
+
+def busy_function():
+    return sum(range(1000))
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profile_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.profile_dir)
+
+    def test_disabled(self):
+        profiler = Profiler()
+        with profiler.phase("api"):
+            pass
+
+        self.assertFalse(profiler.enabled)
+        self.assertEqual(profiler.phases, {})
+
+    def test_time_goes_to_innermost_phase(self):
+        profiler = Profiler()
+        profiler.start("cpu")
+        with profiler.phase("wait"):
+            time.sleep(0.05)
+            with profiler.phase("api"):
+                time.sleep(0.1)
+        profiler.stop()
+
+        self.assertGreaterEqual(profiler.phases["api"], 0.1)
+        self.assertGreaterEqual(profiler.phases["wait"], 0.05)
+        self.assertLess(profiler.phases["wait"], 0.1)
+        self.assertIn("api", profiler.format_phases())
+        self.assertIn("total", profiler.format_phases())
+
+    def test_save(self):
+        profiler = Profiler()
+        profiler.start("cpu")
+        busy_function()
+        profiler.stop()
+
+        path = profiler.save(self.profile_dir)
+
+        functions = [name for _, _, name in pstats.Stats(f"{path}.pstats").stats]
+        self.assertIn("busy_function", functions)
+        with open(f"{path}.phases.txt") as phases_file:
+            self.assertIn("Time spent per phase", phases_file.read())
+        self.assertEqual(len(os.listdir(self.profile_dir)), 2)
+
+    def test_startup_mode(self):
+        profiler = Profiler()
+        profiler.start("startup")
+        profiler.startup_finished()
+        busy_function()
+        profiler.stop()
+
+        functions = [name for _, _, name in pstats.Stats(f"{profiler.save(self.profile_dir)}.pstats").stats]
+        self.assertNotIn("busy_function", functions)
+
+    def test_summary(self):
+        profiler = Profiler()
+        profiler.start("cpu")
+        busy_function()
+        profiler.stop()
+
+        summary = profiler.format_summary(limit=5)
+        self.assertIn("Time spent per phase", summary)
+        self.assertIn("Top 5 functions by cumulative time", summary)
+
+    def test_api_phase(self):
+        profiler = Profiler()
+        profiler.start("cpu")
+        with patch("torque.client.profiler", profiler), LocalServer() as server:
+            create_client(server.host).request("x")
+        profiler.stop()
+
+        self.assertIn("api", profiler.phases)
@@ -0,0 +1,125 @@
+import functools
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import Mock, patch
+
+from tests.helpers.local_server import create_client
+from tests.helpers.torque_server import TorqueServer
+from torque.commands.bp import BlueprintsCommand
+from torque.commands.repl import ReplCommand
+from torque.commands.sb import SandboxesCommand
+from torque.models.connection import TorqueConnection
+from torque.services.completion import CompletionCache, ReplCompleter
+
+
+class TestReplCommand(unittest.TestCase):
+    sandbox = {"id": "sb1", "name": "sb1", "blueprint_name": "bp1", "sandbox_status": "Active"}
+    blueprints = [{"blueprint_name": "bp1", "url": "http://example.com/bp1", "enabled": True}]
+
+    def setUp(self):
+        self.server = TorqueServer(blueprints=self.blueprints, sandboxes=[dict(self.sandbox)])
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+
+        client_class = functools.partial(create_client, self.server.host)
+        patcher = patch("torque.client.TorqueClient", client_class)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # keep the readline state and history of the test process untouched
+        patcher = patch("torque.commands.repl.readline", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # completions are refreshed in the background, requests made by the tests stay deterministic without it
+        patcher = patch("torque.services.completion.CompletionCache.start")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, lines: list) -> str:
+        command = ReplCommand(["shell"], TorqueConnection(space="space", token="token", account="account"))
+        stdout = io.StringIO()
+        with patch("builtins.input", side_effect=lines + [EOFError]), redirect_stdout(stdout):
+            self.assertTrue(command.execute())
+        return stdout.getvalue()
+
+    def test_run_commands(self):
+        output = self._run(["sb status sb1", "bp list"])
+
+        self.assertIn("Active", output)
+        self.assertIn("bp1", output)
+
+    def test_connection_is_reused_between_commands(self):
+        self._run(["sb status sb1"] * 3)
+
+        self.assertEqual(self.server.connections_count, 1)
+
+    def test_errors_do_not_end_the_shell(self):
+        output = self._run(["sb status", "sb status missing", "unknown", "sb --help", "sb status sb1"])
+
+        self.assertIn("usage:", output)
+        self.assertIn("Unknown command 'unknown'", output)
+        self.assertIn("Active", output)
+
+    def test_exit(self):
+        with patch("torque.commands.sb.SandboxesCommand.execute") as execute:
+            self._run(["exit", "sb status sb1"])
+
+        execute.assert_not_called()
+
+    def test_excluded_commands(self):
+        output = self._run(["shell", "daemon status", "batch commands.txt", "help"])
+
+        self.assertIn("Unknown command 'shell'", output)
+        self.assertIn("Unknown command 'daemon'", output)
+        self.assertIn("Unknown command 'batch'", output)
+        self.assertNotIn("    daemon", output)
+        self.assertIn("    sb", output)
+
+
+class TestReplCompleter(unittest.TestCase):
+    def setUp(self):
+        cache = CompletionCache(client=Mock())
+        cache.sandbox_ids = ["abc123", "abd456"]
+        cache.blueprint_names = ["web-app", "db"]
+        commands = {"sb": SandboxesCommand, "sandbox": SandboxesCommand, "bp": BlueprintsCommand}
+        self.completer = ReplCompleter(commands, cache, ["exit"])
+
+    def test_commands(self):
+        self.assertEqual(self.completer.get_completions("", ""), ["bp", "exit", "sandbox", "sb"])
+        self.assertEqual(self.completer.get_completions("s", "s"), ["sandbox", "sb"])
+
+    def test_actions(self):
+        self.assertEqual(self.completer.get_completions("sb ", ""), ["end", "get", "list", "start", "status"])
+        self.assertEqual(self.completer.get_completions("bp v", "v"), ["validate"])
+        self.assertEqual(self.completer.get_completions("unknown ", ""), [])
+
+    def test_sandbox_ids_and_blueprint_names(self):
+        self.assertEqual(self.completer.get_completions("sb end ab", "ab"), ["abc123", "abd456"])
+        self.assertEqual(self.completer.get_completions("sb status abc", "abc"), ["abc123"])
+        self.assertEqual(self.completer.get_completions("sb start w", "w"), ["web-app"])
+        self.assertEqual(self.completer.get_completions("sb list ", ""), [])
+
+
+class TestCompletionCache(unittest.TestCase):
+    def test_refresh(self):
+        blueprints = [{"blueprint_name": "bp1", "url": "http://example.com/bp1", "enabled": True}]
+        sandbox = {"id": "sb1", "name": "sb1", "blueprint_name": "bp1", "sandbox_status": "Active"}
+        with TorqueServer(blueprints=blueprints, sandboxes=[sandbox]) as server:
+            client = create_client(server.host)
+            cache = CompletionCache(client)
+            cache.refresh()
+
+        self.assertEqual(cache.sandbox_ids, ["sb1"])
+        self.assertEqual(cache.blueprint_names, ["bp1"])
+
+    def test_refresh_failure_keeps_previous_values(self):
+        client = Mock()
+        cache = CompletionCache(client)
+        cache.sandbox_ids = ["sb1"]
+
+        with patch("torque.sandboxes.SandboxesManager.list", side_effect=OSError("no network")):
+            cache.refresh()
+
+        self.assertEqual(cache.sandbox_ids, ["sb1"])
@@ -0,0 +1,97 @@
+import email.utils
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from requests import ConnectionError, ConnectTimeout
+
+from torque.rate_limiter import TokenBucket
+from torque.retry import RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self) -> None:
+        self.policy = RetryPolicy(max_retries=3, backoff_base=1, backoff_max=10)
+
+    def test_idempotent_methods_retried_on_server_errors(self):
+        for method in ["GET", "PUT", "DELETE"]:
+            for status in [429, 502, 503, 504]:
+                self.assertTrue(self.policy.should_retry(method, 0, status_code=status))
+
+    def test_post_retried_only_when_not_processed(self):
+        self.assertTrue(self.policy.should_retry("POST", 0, status_code=429))
+        self.assertTrue(self.policy.should_retry("POST", 0, error=ConnectTimeout()))
+        self.assertFalse(self.policy.should_retry("POST", 0, status_code=503))
+        self.assertFalse(self.policy.should_retry("POST", 0, error=ConnectionError()))
+
+    def test_client_errors_not_retried(self):
+        for status in [400, 401, 404, 500]:
+            self.assertFalse(self.policy.should_retry("GET", 0, status_code=status))
+
+    def test_no_retry_after_max_retries(self):
+        self.assertFalse(self.policy.should_retry("GET", 3, status_code=503))
+
+    def test_backoff_delay_is_jittered_and_capped(self):
+        for attempt in range(10):
+            delay = self.policy.get_delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(10, 2**attempt))
+
+    def test_retry_after_seconds_honored(self):
+        response = Mock(headers={"Retry-After": "7"})
+        self.assertEqual(self.policy.get_delay(0, response), 7)
+
+    def test_retry_after_is_capped(self):
+        response = Mock(headers={"Retry-After": "120"})
+        self.assertEqual(self.policy.get_delay(0, response), 10)
+
+    def test_retry_after_http_date(self):
+        retry_date = email.utils.formatdate(time.time() + 5, usegmt=True)
+        delay = RetryPolicy.parse_retry_after(retry_date)
+        self.assertTrue(3 <= delay <= 5)
+
+    def test_retry_after_invalid_value(self):
+        self.assertIsNone(RetryPolicy.parse_retry_after("soon"))
+        self.assertIsNone(RetryPolicy.parse_retry_after(None))
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_rate_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_burst_up_to_capacity_without_waiting(self):
+        bucket = TokenBucket(rate=1, capacity=5)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_rate_is_shared_between_threads(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)]) for _ in range(4)]
+
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 20 tokens at 50 tokens/sec with a single token burst
+        self.assertGreaterEqual(time.monotonic() - start, 19 / 50 - 0.05)
+
+    @patch("torque.rate_limiter.time.sleep")
+    def test_pause_blocks_acquire(self, sleep_mock):
+        bucket = TokenBucket(rate=100, capacity=10)
+        bucket.pause(3)
+
+        sleep_mock.side_effect = lambda seconds: bucket.__dict__.update(_paused_until=0, _updated_at=0)
+        bucket.acquire()
+
+        waited = sleep_mock.call_args[0][0]
+        self.assertTrue(2.5 <= waited <= 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
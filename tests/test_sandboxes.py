@@ -1,5 +1,8 @@
+import time
 import unittest
 
+from tests.helpers.local_server import create_client
+from tests.helpers.torque_server import TorqueServer
 from torque.client import TorqueClient
 from torque.sandboxes import SandboxesManager
 
@@ -22,5 +25,42 @@ class TestSandboxes(unittest.TestCase):
         )
 
 
+class TestEndMany(unittest.TestCase):
+    sandboxes = [
+        {"id": f"sb{i}", "name": f"sb{i}", "blueprint_name": "bp1", "sandbox_status": "Active"} for i in range(8)
+    ]
+
+    def _end_many(self, server: TorqueServer, sandbox_ids: list, **kwargs) -> list:
+        client = create_client(server.host)
+        return list(SandboxesManager(client).end_many(sandbox_ids, **kwargs))
+
+    def test_results_in_order(self):
+        with TorqueServer(sandboxes=[dict(sb) for sb in self.sandboxes]) as server:
+            results = self._end_many(server, ["sb1", "missing", "sb2"])
+
+        self.assertEqual([result.sandbox_id for result in results], ["sb1", "missing", "sb2"])
+        self.assertEqual([result.success for result in results], [True, False, True])
+        self.assertIn("Sandbox missing not found", results[1].error)
+        self.assertEqual(server.sandboxes["sb1"]["sandbox_status"], "Ended")
+
+    def test_no_verify_skips_get(self):
+        with TorqueServer(sandboxes=[dict(sb) for sb in self.sandboxes]) as server:
+            self._end_many(server, ["sb1", "sb2"], verify=False)
+
+        self.assertEqual(sorted(method for method, _, _ in server.requests), ["DELETE", "DELETE"])
+
+    def test_bounded_concurrency(self):
+        with TorqueServer(sandboxes=[dict(sb) for sb in self.sandboxes], latency=0.1) as server:
+            started_at = time.monotonic()
+            results = self._end_many(server, [sb["id"] for sb in self.sandboxes], jobs=4, verify=False)
+            duration = time.monotonic() - started_at
+
+        self.assertTrue(all(result.success for result in results))
+        # 8 deletes on 4 workers take two rounds
+        self.assertGreaterEqual(duration, 0.2)
+        self.assertLess(duration, 0.8)
+        self.assertLessEqual(server.connections_count, 4)
+
+
 if __name__ == "__main__":
     unittest.main()
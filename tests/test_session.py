@@ -0,0 +1,78 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.helpers.local_server import LocalServer, create_client
+from torque.client import TorqueClient
+from torque.constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_POOL_SIZE, DEFAULT_READ_TIMEOUT
+from torque.sandboxes import SandboxesManager
+from torque.session import TorqueSession
+
+
+class TestTorqueSession(unittest.TestCase):
+    def test_default_timeouts(self):
+        session = TorqueSession()
+        self.assertEqual(session.timeout, (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT))
+
+    def test_adapter_pool_size(self):
+        session = TorqueSession(pool_size=3)
+        adapter = session.get_adapter("https://qtorque.io/api/")
+        self.assertEqual(adapter._pool_maxsize, 3)
+        self.assertTrue(adapter._pool_block)
+
+    def test_client_owns_pooled_session(self):
+        client = TorqueClient(space="space", token="token")
+        other_client = TorqueClient(space="space", token="token")
+        self.assertIsNot(client.session, other_client.session)
+        self.assertEqual(client.session.get_adapter(client.base_url)._pool_maxsize, DEFAULT_POOL_SIZE)
+
+
+class TestConnectionReuse(unittest.TestCase):
+    sandbox_json = {"id": "sb1", "name": "sandbox", "blueprint_name": "bp", "sandbox_status": "Active"}
+
+    def test_sequential_requests_reuse_single_connection(self):
+        with LocalServer(self.sandbox_json) as server:
+            manager = SandboxesManager(create_client(server.host))
+            for i in range(20):
+                manager.get(f"sb{i}")
+
+        self.assertEqual(len(server.requests), 20)
+        self.assertEqual(server.connections_count, 1)
+
+    def test_login_and_longtoken_reuse_client_connection(self):
+        with LocalServer({"access_token": "token"}) as server:
+            client = create_client(server.host)
+            client.login("account", "email", "password")
+            client.longtoken()
+            SandboxesManager(client).get_detailed("sb1")
+
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(server.connections_count, 1)
+
+    def test_warm_up_connection_reused(self):
+        with LocalServer(self.sandbox_json) as server:
+            client = create_client(server.host)
+            client.warm_up().join()
+            SandboxesManager(client).get("sb1")
+
+        self.assertEqual([method for method, _, _ in server.requests], ["HEAD", "GET"])
+        self.assertEqual(server.connections_count, 1)
+
+    def test_warm_up_failure_ignored(self):
+        client = create_client("127.0.0.1:1")
+        thread = client.warm_up()
+        thread.join()
+
+        self.assertFalse(thread.is_alive())
+
+    def test_concurrent_requests_bounded_by_pool_size(self):
+        with LocalServer(self.sandbox_json) as server:
+            manager = SandboxesManager(create_client(server.host, pool_size=2))
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda i: manager.get(f"sb{i}"), range(40)))
+
+        self.assertEqual(len(server.requests), 40)
+        self.assertLessEqual(server.connections_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
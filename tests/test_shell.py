@@ -12,7 +12,8 @@ class MainShellTest(unittest.TestCase):
     def setUp(self) -> None:
         self.main_doc = shell.__doc__
         self.base_usage = """Usage: torque [--space=<space>] [--token=<token>] [--account=<account>] [--profile=<profile>] [--help] [--debug]
-               [--disable-version-check] <command> [<args>...]"""
+               [--disable-version-check] [--pool-size=<size>] [--timings] [--deadline=<seconds>]
+               [--profiler=<mode>] [--profiler-summary] <command> [<args>...]"""
 
     def test_show_base_usage_line(self):
         with self.assertRaises(DocoptExit) as ctx:
@@ -32,6 +33,12 @@ class MainShellTest(unittest.TestCase):
         input_parser = GlobalInputParser(args)
         self.assertTrue(shell.BootstrapHelper.is_help_message_requested(input_parser))
 
+    def test_help_not_needed_with_shell_command(self):
+        args = docopt(doc=self.main_doc, options_first=True, argv=["shell"])
+        input_parser = GlobalInputParser(args)
+        self.assertFalse(shell.BootstrapHelper.is_help_message_requested(input_parser))
+        self.assertTrue(shell.BootstrapHelper.should_get_connection_params(input_parser))
+
     def test_help_not_needed_with_command(self):
         user_input = ["sb", "start", "some_blueprint"]
         args = docopt(doc=self.main_doc, options_first=True, argv=user_input)
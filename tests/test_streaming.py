@@ -0,0 +1,88 @@
+import json
+import tracemalloc
+import unittest
+
+from tests.helpers.local_server import LocalServer, create_client
+from torque.models.blueprints import Blueprint, BlueprintsManager
+from torque.sandboxes import Sandbox, SandboxesManager
+from torque.streaming import iter_json_array
+
+
+def split(data: bytes, chunk_size: int) -> list:
+    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+class TestIterJsonArray(unittest.TestCase):
+    documents = [
+        [],
+        [1, 22, 333, -1.5e3, True, False, None],
+        [{"a": "],[,\\"}, [1, [2]], 'x"y', {}],
+        [{"id": i, "name": "é" * i} for i in range(30)],
+    ]
+
+    def test_any_chunk_boundary(self):
+        for document in self.documents:
+            for indent in (None, 2):
+                data = json.dumps(document, ensure_ascii=False, indent=indent).encode("utf-8")
+                for chunk_size in range(1, len(data) + 1):
+                    self.assertEqual(list(iter_json_array(split(data, chunk_size))), document)
+
+    def test_malformed_documents(self):
+        for data in [b'{"a": 1}', b"[1, 2", b"[1 2]", b"[1,]", b"[,1]", b""]:
+            with self.assertRaises(ValueError):
+                list(iter_json_array([data]))
+
+    def test_elements_yielded_before_end_of_stream(self):
+        def chunks():
+            yield b'[{"id": 1}, '
+            raise AssertionError("next chunk must not be requested before the first element is yielded")
+
+        self.assertEqual(next(iter_json_array(chunks())), {"id": 1})
+
+
+class TestStreamingManagers(unittest.TestCase):
+    def test_iter_sandboxes(self):
+        sandboxes_json = [{"id": f"sb{i}", "name": f"sb{i}", "blueprint_name": "bp"} for i in range(100)]
+        with LocalServer(sandboxes_json, gzip_responses=True) as server:
+            sandboxes = list(SandboxesManager(create_client(server.host)).iter_sandboxes(count=100, filter_opt="all"))
+
+        self.assertTrue(all(isinstance(sb, Sandbox) for sb in sandboxes))
+        self.assertEqual([sb.sandbox_id for sb in sandboxes], [sb["id"] for sb in sandboxes_json])
+        self.assertIn("count=100", server.requests[0][1])
+
+    def test_connection_released_when_iteration_stopped_early(self):
+        blueprints_json = [{"blueprint_name": f"bp{i}", "url": ""} for i in range(1000)]
+        with LocalServer(blueprints_json) as server:
+            manager = BlueprintsManager(create_client(server.host))
+            iterator = manager.iter_blueprints()
+            self.assertIsInstance(next(iterator), Blueprint)
+            iterator.close()
+
+            # the single pooled connection must be available again
+            self.assertEqual(len(manager.list()), 1000)
+
+    def test_streaming_keeps_memory_flat(self):
+        blueprints_json = [
+            {"blueprint_name": f"bp{i}", "url": "u" * 200, "description": "d" * 200} for i in range(5000)
+        ]
+        with LocalServer(blueprints_json) as server:
+            manager = BlueprintsManager(create_client(server.host))
+            # encode the body upfront so server allocations are not traced
+            server.get_encoded_body(False)
+
+            tracemalloc.start()
+            for _ in manager.iter_blueprints():
+                pass
+            _, streaming_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            tracemalloc.start()
+            manager.list()
+            _, list_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        self.assertLess(streaming_peak * 4, list_peak)
+
+
+if __name__ == "__main__":
+    unittest.main()
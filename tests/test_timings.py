@@ -0,0 +1,101 @@
+import unittest
+from unittest.mock import patch
+
+from tests.helpers.local_server import LocalServer, create_client
+from torque import timings
+from torque.sandboxes import SandboxesManager
+
+
+class TestEndpointTemplate(unittest.TestCase):
+    def test_identifiers_replaced(self):
+        self.assertEqual(
+            timings.endpoint_template("https://qtorque.io/api/spaces/my-space/sandbox/abc123?x=1"),
+            "/api/spaces/{space}/sandbox/{sandbox_id}",
+        )
+        self.assertEqual(
+            timings.endpoint_template("https://qtorque.io/api/spaces/my-space/catalog/bp1"),
+            "/api/spaces/{space}/catalog/{blueprint_name}",
+        )
+        self.assertEqual(
+            timings.endpoint_template("https://qtorque.io/api/accounts/acc/login"), "/api/accounts/{account}/login"
+        )
+
+    def test_collection_endpoint_kept(self):
+        self.assertEqual(
+            timings.endpoint_template("https://qtorque.io/api/spaces/my-space/sandbox"), "/api/spaces/{space}/sandbox"
+        )
+
+
+class TestPercentile(unittest.TestCase):
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(timings.percentile(values, 50), 50)
+        self.assertEqual(timings.percentile(values, 95), 95)
+        self.assertEqual(timings.percentile([3.0], 95), 3.0)
+        self.assertEqual(timings.percentile([], 50), 0.0)
+
+
+class TestStageTimer(unittest.TestCase):
+    def test_time_attributed_to_innermost_stage(self):
+        now = [0.0]
+        timer = timings.StageTimer(clock=lambda: now[0])
+
+        with timer.stage("wait"):
+            now[0] += 1
+            with timer.stage("http"):
+                now[0] += 2
+            now[0] += 3
+
+        self.assertEqual(timer.items(), [("wait", 4.0), ("http", 2.0)])
+
+
+class TestTimingsRecorder(unittest.TestCase):
+    def setUp(self):
+        self.recorder = timings.TimingsRecorder()
+        self.recorder.enable()
+        patcher = patch.object(timings, "recorder", self.recorder)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_requests_recorded_per_endpoint(self):
+        with LocalServer({"id": "sb1"}) as server:
+            manager = SandboxesManager(create_client(server.host))
+            manager.get_detailed("sb1")
+            manager.get_detailed("sb2")
+
+        summary = self.recorder.summary()
+        self.assertEqual(len(summary), 1)
+        self.assertEqual(summary[0]["method"], "GET")
+        self.assertEqual(summary[0]["endpoint"], "/api/spaces/{space}/sandbox/{sandbox_id}")
+        self.assertEqual(summary[0]["calls"], 2)
+        self.assertEqual(summary[0]["status"], "200x2")
+        self.assertEqual(summary[0]["bytes"], 2 * len(b'{"id": "sb1"}'))
+
+    def test_connect_time_recorded_for_new_connections_only(self):
+        with LocalServer({"id": "sb1"}) as server:
+            manager = SandboxesManager(create_client(server.host))
+            manager.get_detailed("sb1")
+            manager.get_detailed("sb2")
+
+        first, second = self.recorder.records
+        self.assertGreater(first.connect_time, 0)
+        self.assertEqual(second.connect_time, 0)
+
+    def test_failed_request_recorded(self):
+        client = create_client("127.0.0.1:1")
+        client.retry_policy.max_retries = 0
+
+        with self.assertRaises(Exception):
+            SandboxesManager(client).get_detailed("sb1")
+
+        self.assertEqual(len(self.recorder.records), 1)
+        self.assertIsNone(self.recorder.records[0].status)
+        self.assertIn("errorx1", self.recorder.format_summary())
+
+    def test_disabled_recorder_records_nothing(self):
+        self.recorder.enabled = False
+        with LocalServer({"id": "sb1"}) as server:
+            SandboxesManager(create_client(server.host)).get_detailed("sb1")
+
+        self.assertEqual(self.recorder.records, [])
+        self.assertEqual(self.recorder.format_summary(), "No HTTP requests were made")
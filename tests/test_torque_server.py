@@ -0,0 +1,90 @@
+import asyncio
+import time
+import unittest
+
+from tests.helpers.local_server import create_client
+from tests.helpers.torque_server import LAUNCHING_PHASES, TorqueServer
+from torque.async_client import AsyncSandboxesManager, AsyncTorqueClient
+from torque.branch.branch_utils import can_temp_branch_be_deleted
+from torque.exceptions import TorqueApiError
+from torque.models.blueprints import BlueprintsManager
+from torque.retry import RetryPolicy
+from torque.sandboxes import SandboxesManager
+
+
+class TestTorqueServer(unittest.TestCase):
+    blueprints = [{"blueprint_name": f"bp{i}", "url": f"http://example.com/{i}", "enabled": True} for i in range(3)]
+
+    def test_sandbox_lifecycle(self):
+        with TorqueServer(blueprints=self.blueprints) as server:
+            manager = SandboxesManager(create_client(server.host))
+            sandbox_id = manager.start("sb", "bp1")
+
+            sandbox = manager.get(sandbox_id)
+            self.assertEqual(sandbox.name, "sb")
+            self.assertEqual(sandbox.sandbox_status, "Active")
+            self.assertEqual([sb.sandbox_id for sb in manager.list()], [sandbox_id])
+
+            manager.end(sandbox_id)
+            self.assertEqual(manager.get(sandbox_id).sandbox_status, "Ended")
+
+    def test_unknown_sandbox(self):
+        with TorqueServer() as server:
+            with self.assertRaises(TorqueApiError) as ctx:
+                SandboxesManager(create_client(server.host)).get("missing")
+
+        self.assertEqual(ctx.exception.status_code, 404)
+
+    def test_list_pages(self):
+        sandboxes = [{"id": f"sb{i}", "name": f"sb{i}", "blueprint_name": "bp"} for i in range(25)]
+        with TorqueServer(sandboxes=sandboxes) as server:
+            result = list(SandboxesManager(create_client(server.host)).paginate(page_size=10))
+
+        self.assertEqual([sb.sandbox_id for sb in result], [sb["id"] for sb in sandboxes])
+
+    def test_blueprints(self):
+        with TorqueServer(blueprints=self.blueprints) as server:
+            manager = BlueprintsManager(create_client(server.host))
+
+            self.assertEqual([bp.name for bp in manager.list()], ["bp0", "bp1", "bp2"])
+            self.assertEqual(manager.get("bp2").url, "http://example.com/2")
+            self.assertEqual(manager.validate("bp1").errors, [])
+            self.assertEqual(manager.validate("other").errors[0]["name"], "BlueprintNotFound")
+
+    def test_launching_phases(self):
+        with TorqueServer(blueprints=self.blueprints, phase_duration=0.2) as server:
+            manager = SandboxesManager(create_client(server.host))
+            sandbox_id = manager.start("sb", "bp1")
+
+            sandbox = manager.get(sandbox_id)
+            self.assertEqual(sandbox.sandbox_status, "Launching")
+            self.assertEqual(sandbox.launching_progress[LAUNCHING_PHASES[0]]["status"], "InProgress")
+            self.assertFalse(can_temp_branch_be_deleted(sandbox))
+
+            async def wait():
+                async with AsyncTorqueClient(client=manager.client) as client:
+                    return await AsyncSandboxesManager(client).wait(sandbox_id, timeout=5, poll_interval=0.05)
+
+            sandbox = asyncio.run(wait())
+
+        self.assertEqual(sandbox.sandbox_status, "Active")
+        self.assertTrue(can_temp_branch_be_deleted(sandbox))
+
+    def test_injected_failures_retried(self):
+        retry_policy = RetryPolicy(max_retries=10, backoff_base=0.001)
+        with TorqueServer(blueprints=self.blueprints, failure_rate=0.5, seed=1) as server:
+            manager = BlueprintsManager(create_client(server.host, retry_policy=retry_policy))
+            for _ in range(10):
+                self.assertEqual(len(manager.list()), 3)
+
+        self.assertGreater(server.failures_count, 0)
+        self.assertEqual(len(server.requests), 10 + server.failures_count)
+
+    def test_latency(self):
+        with TorqueServer(latency=0.1) as server:
+            manager = SandboxesManager(create_client(server.host))
+            start = time.perf_counter()
+            manager.list()
+            elapsed = time.perf_counter() - start
+
+        self.assertGreaterEqual(elapsed, 0.1)
@@ -0,0 +1,89 @@
+import json
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import requests
+
+from tests.helpers.h2_server import H2Server, h2, httpx
+from tests.helpers.local_server import LocalServer, create_client
+from tests.helpers.torque_server import TorqueServer
+from torque.client import TorqueClient
+from torque.exceptions import TorqueApiError
+from torque.models.blueprints import BlueprintsManager
+from torque.retry import RetryPolicy
+from torque.sandboxes import SandboxesManager
+from torque.session import TorqueSession
+from torque.transport import Http2Transport, create_transport
+
+
+class TestCreateTransport(unittest.TestCase):
+    def test_requests_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsInstance(create_transport(), TorqueSession)
+
+    def test_unknown_transport(self):
+        with self.assertRaises(ValueError):
+            create_transport("carrier-pigeon")
+
+    @unittest.skipIf(httpx is None, "httpx is not installed")
+    def test_selected_with_env(self):
+        with patch.dict(os.environ, {"TORQUE_TRANSPORT": "http2"}):
+            client = TorqueClient(space="space", token="token")
+
+        self.assertIsInstance(client.session, Http2Transport)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestHttp2Transport(unittest.TestCase):
+    sandbox_json = {"id": "sb1", "name": "sandbox", "blueprint_name": "bp", "sandbox_status": "Active"}
+
+    def test_json_response(self):
+        with LocalServer(self.sandbox_json) as server:
+            sandbox = SandboxesManager(create_client(server.host, session=Http2Transport())).get("sb1")
+
+        self.assertEqual(sandbox.sandbox_status, "Active")
+        self.assertEqual(server.requests[0][2]["Authorization"], "Bearer token")
+
+    def test_gzip_response_decoded(self):
+        catalog = [{"blueprint_name": f"bp{i}", "url": ""} for i in range(100)]
+        with LocalServer(catalog, gzip_responses=True) as server:
+            client = create_client(server.host, session=Http2Transport())
+            self.assertEqual(BlueprintsManager(client).list_detailed(), catalog)
+            self.assertEqual(len(list(BlueprintsManager(client).iter_blueprints())), 100)
+
+    def test_post_body(self):
+        with LocalServer({"id": "sb1"}) as server:
+            SandboxesManager(create_client(server.host, session=Http2Transport())).start("sb", "bp", inputs={"a": "b"})
+
+        self.assertEqual(json.loads(server.request_bodies[0])["inputs"], {"a": "b"})
+
+    def test_error_status(self):
+        with TorqueServer() as server:
+            with self.assertRaises(TorqueApiError) as ctx:
+                SandboxesManager(create_client(server.host, session=Http2Transport())).get("missing")
+
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertIn("Sandbox missing not found", str(ctx.exception))
+
+    def test_connection_error_mapped(self):
+        client = create_client(
+            "127.0.0.1:1",
+            session=Http2Transport(),
+            retry_policy=RetryPolicy(max_retries=0),
+        )
+
+        with self.assertRaises(requests.ConnectionError):
+            SandboxesManager(client).get("sb1")
+
+    @unittest.skipIf(h2 is None, "h2 is not installed")
+    def test_requests_multiplexed_over_one_connection(self):
+        with H2Server(self.sandbox_json, latency=0.05) as server:
+            manager = SandboxesManager(create_client(server.host, session=Http2Transport(http1=False)))
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                sandboxes = list(executor.map(lambda i: manager.get(f"sb{i}"), range(64)))
+
+        self.assertTrue(all(sb.sandbox_status == "Active" for sb in sandboxes))
+        self.assertEqual(len(server.requests), 64)
+        self.assertEqual(server.connections_count, 1)
@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+from unittest.mock import Mock, patch
 
 from torque import utils
 
@@ -32,3 +35,33 @@ class TestParseParamString(unittest.TestCase):
         line = "key1:val1, key2:val2"
         with self.assertRaises(ValueError):
             self.parse_fun(line)
+
+
+class TestBlueprintRepoCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.bp_dir = os.path.join(self.temp_dir.name, "blueprints")
+        os.mkdir(self.bp_dir)
+
+        patcher = patch("torque.utils.BlueprintRepo")
+        self.repo_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.repo_class.side_effect = lambda path: Mock(working_dir=path, bp_dir="blueprints")
+
+    def test_repo_is_reused(self):
+        cache = utils.BlueprintRepoCache()
+
+        self.assertIs(cache.get(self.temp_dir.name), cache.get(self.temp_dir.name))
+        self.assertEqual(self.repo_class.call_count, 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_repo_is_reopened_when_blueprints_change(self):
+        cache = utils.BlueprintRepoCache()
+        repo = cache.get(self.temp_dir.name)
+
+        mtime = os.stat(self.bp_dir).st_mtime
+        os.utime(self.bp_dir, (mtime + 10, mtime + 10))
+
+        self.assertIsNot(cache.get(self.temp_dir.name), repo)
+        self.assertEqual(self.repo_class.call_count, 2)
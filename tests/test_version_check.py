@@ -1,3 +1,8 @@
+import json
+import os
+import subprocess
+import tempfile
+import time
 import unittest
 from unittest.mock import Mock, patch
 
@@ -6,69 +11,89 @@ from torque.services.version import VersionCheckService
 
 
 class VersionCheckServiceTests(unittest.TestCase):
-    @patch("torque.services.version.requests")
-    def test_no_newer_version_in_info(self, requests_mock):
-        # arrange
-        versions_checker = VersionCheckService("1.0.0")
-        versions_checker._show_new_version_message = Mock()
-        project_info = PyPiProjectInfoBuilder().with_version("1.0.0").build()
-        requests_mock.get.return_value = Mock(json=Mock(return_value=project_info))
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache_path = os.path.join(self.temp_dir.name, "version.json")
 
-        # act
-        versions_checker.check_for_new_version_safely()
+        self.versions_checker = VersionCheckService("1.0.0", cache_path=self.cache_path)
+        self.versions_checker._show_new_version_message = Mock()
+        self.versions_checker._start_refresh = Mock()
 
-        # assert
-        versions_checker._show_new_version_message.assert_not_called()
+    def _write_cache(self, latest_version: str, checked_at: float):
+        with open(self.cache_path, "w") as cache_file:
+            json.dump({"latest_version": latest_version, "checked_at": checked_at}, cache_file)
 
-    @patch("torque.services.version.requests")
-    def test_newer_version_detected_in_info(self, requests_mock):
-        # arrange
-        versions_checker = VersionCheckService("1.0.0")
-        versions_checker._show_new_version_message = Mock()
-        project_info = PyPiProjectInfoBuilder().with_version("1.1.0").build()
-        requests_mock.get.return_value = Mock(json=Mock(return_value=project_info))
+    def _read_cache(self) -> dict:
+        with open(self.cache_path) as cache_file:
+            return json.load(cache_file)
 
-        # act
-        versions_checker.check_for_new_version_safely()
+    def test_newer_version_in_cache(self):
+        self._write_cache("1.1.0", time.time())
 
-        # assert
-        versions_checker._show_new_version_message.assert_called_once()
+        self.versions_checker.check_for_new_version_safely()
 
-    @patch("torque.services.version.requests")
-    def test_newer_version_detected_in_releases(self, requests_mock):
-        # arrange
-        versions_checker = VersionCheckService("1.0.0")
-        versions_checker._show_new_version_message = Mock()
-        versions_checker._find_latest_release = Mock(return_value="1.2.0")
-        project_info = PyPiProjectInfoBuilder().with_version("1.1.0b1").build()  # project info is pre-release
-        requests_mock.get.return_value = Mock(json=Mock(return_value=project_info))
+        self.versions_checker._show_new_version_message.assert_called_once_with("1.1.0")
+        self.versions_checker._start_refresh.assert_not_called()
 
-        # act
-        versions_checker.check_for_new_version_safely()
+    def test_no_newer_version_in_cache(self):
+        self._write_cache("1.0.0", time.time())
 
-        # assert
-        versions_checker._find_latest_release.assert_called_once()
-        versions_checker._show_new_version_message.assert_called_once()
+        self.versions_checker.check_for_new_version_safely()
 
-    @patch("torque.services.version.requests")
-    def test_prerelease_in_info_and_no_new_version_in_releases(self, requests_mock):
-        # arrange
-        versions_checker = VersionCheckService("1.0.0")
-        versions_checker._show_new_version_message = Mock()
-        versions_checker._find_latest_release = Mock(return_value="1.0.0")
-        project_info = PyPiProjectInfoBuilder().with_version("1.1.0b1").build()  # project info is pre-release
-        requests_mock.get.return_value = Mock(json=Mock(return_value=project_info))
+        self.versions_checker._show_new_version_message.assert_not_called()
+        self.versions_checker._start_refresh.assert_not_called()
 
-        # act
-        versions_checker.check_for_new_version_safely()
+    def test_missing_cache_is_refreshed_in_background(self):
+        self.versions_checker.check_for_new_version_safely()
 
-        # assert
-        versions_checker._find_latest_release.assert_called_once()
-        versions_checker._show_new_version_message.assert_not_called()
+        self.versions_checker._show_new_version_message.assert_not_called()
+        self.versions_checker._start_refresh.assert_called_once()
+
+    def test_stale_cache_is_refreshed_once(self):
+        self._write_cache("1.1.0", time.time() - self.versions_checker.ttl - 1)
+
+        self.versions_checker.check_for_new_version_safely()
+        self.versions_checker.check_for_new_version_safely()
+
+        # the cached version is still shown while it is refreshed
+        self.assertEqual(self.versions_checker._show_new_version_message.call_count, 2)
+        self.versions_checker._start_refresh.assert_called_once()
+        self.assertEqual(self._read_cache()["latest_version"], "1.1.0")
+
+    @patch("torque.session.TorqueSession")
+    def test_refresh_cache(self, session_class_mock):
+        session_mock = session_class_mock.return_value.__enter__.return_value
+        project_info = PyPiProjectInfoBuilder().with_version("1.1.0").build()
+        session_mock.get.return_value = Mock(json=Mock(return_value=project_info))
+
+        self.versions_checker.refresh_cache()
+
+        self.assertEqual(self._read_cache()["latest_version"], "1.1.0")
+        self.versions_checker.check_for_new_version_safely()
+        self.versions_checker._show_new_version_message.assert_called_once_with("1.1.0")
+
+    @patch("torque.session.TorqueSession")
+    def test_latest_version_in_info(self, session_class_mock):
+        session_mock = session_class_mock.return_value.__enter__.return_value
+        project_info = PyPiProjectInfoBuilder().with_version("1.1.0").build()
+        session_mock.get.return_value = Mock(json=Mock(return_value=project_info))
+
+        self.assertEqual(self.versions_checker.get_latest_version(), "1.1.0")
+
+    @patch("torque.session.TorqueSession")
+    def test_latest_version_in_releases(self, session_class_mock):
+        session_mock = session_class_mock.return_value.__enter__.return_value
+        self.versions_checker._find_latest_release = Mock(return_value="1.2.0")
+        project_info = PyPiProjectInfoBuilder().with_version("1.1.0b1").build()  # project info is pre-release
+        session_mock.get.return_value = Mock(json=Mock(return_value=project_info))
+
+        self.assertEqual(self.versions_checker.get_latest_version(), "1.2.0")
+        self.versions_checker._find_latest_release.assert_called_once()
 
     def test_find_latest_release(self):
         # arrange
-        versions_checker = VersionCheckService("1.0.0")
+        versions_checker = self.versions_checker
 
         project_info = (
             PyPiProjectInfoBuilder()
@@ -86,34 +111,23 @@ class VersionCheckServiceTests(unittest.TestCase):
         # assert
         self.assertEqual("1.0.1", latest_version)
 
-    # @patch("torque.services.version.BaseCommand")
-    # def test_show_new_version_message(self, base_command_mock):
-    #     # arrange
-    #     versions_checker = VersionCheckService("1.0.0")
-    #     latest_version = Mock()
-    #
-    #     # act
-    #     versions_checker._show_new_version_message(latest_version)
-    #
-    #     # assert
-    #     base_command_mock.message.assert_called_once_with(AnyStringWith(latest_version))
-
-    @patch("torque.services.version.requests")
-    def test_check_for_new_version_is_safe(self, requests_mock):
-        # arrange 1
-        versions_checker = VersionCheckService("1.0.0")
-        versions_checker._show_new_version_message = Mock()
-        requests_mock.get = Mock(side_effect=Exception())
-
-        # act 1
-        versions_checker.check_for_new_version_safely()
-        versions_checker._show_new_version_message.assert_not_called()
-
-        # arrange 2
-        project_info = PyPiProjectInfoBuilder().with_version("BAD_VERSION").build()
-        requests_mock.get.side_effect = None
-        requests_mock.get.return_value = Mock(json=Mock(return_value=project_info))
-        versions_checker._find_latest_release = Mock(side_effect=Exception())
-
-        # act 2
-        versions_checker.check_for_new_version_safely()
+    def test_check_for_new_version_is_safe(self):
+        with open(self.cache_path, "w") as cache_file:
+            cache_file.write("{not json")
+
+        self.versions_checker.check_for_new_version_safely()
+        self.versions_checker._start_refresh.assert_called_once()
+
+        self._write_cache("BAD_VERSION", time.time())
+        self.versions_checker.check_for_new_version_safely()
+        self.versions_checker._show_new_version_message.assert_not_called()
+
+    def test_detached_refresh_does_not_block(self):
+        versions_checker = VersionCheckService("1.0.0", cache_path=self.cache_path)
+
+        with patch("torque.services.version.subprocess.Popen") as popen:
+            versions_checker.check_for_new_version_safely()
+
+        args = popen.call_args[0][0]
+        self.assertEqual(args[-3:], ["torque.services.version", self.cache_path, "1.0.0"])
+        self.assertEqual(popen.call_args[1]["stdout"], subprocess.DEVNULL)
@@ -0,0 +1,246 @@
+"""Python API of Torque
+
+    from torque.api import Torque
+
+    with Torque(profile="dev") as torque:
+        torque.validate_blueprint("my-blueprint")
+        sandbox_id = torque.start_sandbox("my-blueprint")
+        launch = torque.wait_for_sandbox(sandbox_id)
+        ...
+        sandbox = launch.result()
+
+Unlike the CLI commands it never prints or exits, results are the models of the resource managers (Sandbox,
+Blueprint) and failures raise the exceptions of torque.exceptions.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, List
+
+from torque.constants import DEFAULT_END_JOBS, DEFAULT_TIMEOUT, FINAL_SB_STATUSES
+from torque.exceptions import (
+    BadBlueprintRepo,
+    BlueprintValidationError,
+    ConfigError,
+    SandboxLaunchError,
+    WaitTimeoutError,
+)
+from torque.models.blueprints import Blueprint, BlueprintsManager
+from torque.sandboxes import Sandbox, SandboxEndResult, SandboxesManager
+
+logger = logging.getLogger(__name__)
+
+# seconds between two status requests while waiting for a sandbox
+DEFAULT_POLL_INTERVAL = 5
+# maximum number of sandboxes waited for at the same time, the rest of the waits are queued
+MAX_CONCURRENT_WAITS = 10
+
+
+class Torque(object):
+    """Connection to a Torque space
+
+    Credentials are resolved like in the CLI: token, space and account arguments, then the TORQUE_TOKEN,
+    TORQUE_SPACE and TORQUE_ACCOUNT environment variables, then the profile of the config file (TORQUE_CONFIG_PATH or
+    ~/.torque/config). Raises ConfigError when they can't be found or are invalid (e.g. pool_size or
+    TORQUE_POOL_SIZE). An existing TorqueClient can be passed instead.
+    """
+
+    def __init__(
+        self,
+        profile: str = None,
+        token: str = None,
+        space: str = None,
+        account: str = None,
+        pool_size: int = None,
+        client=None,
+    ):
+        if client is None:
+            from docopt import DocoptExit
+
+            from torque.client import TorqueClient
+            from torque.parsers.global_input_parser import GlobalInputParser
+            from torque.services.connection import TorqueConnectionProvider
+
+            args = {"--profile": profile, "--token": token, "--space": space, "--account": account}
+            args["--pool-size"] = str(pool_size) if pool_size is not None else None
+            try:
+                connection = TorqueConnectionProvider(GlobalInputParser(args)).load_connection()
+            except DocoptExit as e:
+                # the validators of the CLI exit with the usage appended to the message
+                raise ConfigError(str(e).splitlines()[0])
+            client = TorqueClient(
+                space=connection.space,
+                token=connection.token,
+                account=connection.account,
+                pool_size=connection.pool_size,
+            )
+
+        self.client = client
+        self.sandboxes = SandboxesManager(client=client)
+        self.blueprints = BlueprintsManager(client=client)
+        self._repo_cache = None
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._closed = threading.Event()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Cancels pending waits and closes the connections to Torque"""
+        self._closed.set()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+        self.client.session.close()
+
+    def get_sandbox(self, sandbox_id: str) -> Sandbox:
+        """Raises NotFoundError when there is no such sandbox"""
+        return self.sandboxes.get(sandbox_id, refresh=True)
+
+    def list_sandboxes(self, count: int = 25, filter_opt: str = "my", show_ended: bool = False) -> List[Sandbox]:
+        sandboxes = self.sandboxes.list(count=count, filter_opt=filter_opt)
+        if not show_ended:
+            sandboxes = [sandbox for sandbox in sandboxes if sandbox.sandbox_status != "Ended"]
+        return sandboxes
+
+    def start_sandbox(
+        self,
+        blueprint_name: str,
+        sandbox_name: str = None,
+        duration: int = 120,
+        branch: str = None,
+        commit: str = None,
+        inputs: dict = None,
+        artifacts: dict = None,
+        timeout: float = DEFAULT_TIMEOUT * 60,
+    ) -> str:
+        """Starts a sandbox and returns its id, use wait_for_sandbox to wait until it is active
+
+        Without branch the blueprint comes from the git repo of the current directory, local changes are pushed to a
+        temp branch which is deleted once Torque created the infrastructure, so the call blocks until then.
+        """
+        with self.temp_branch(blueprint_name, branch) as context_branch:
+            if sandbox_name is None:
+                from torque.services.sb_naming import generate_sandbox_name
+
+                sandbox_name = generate_sandbox_name(
+                    blueprint_name, context_branch.temp_working_branch, context_branch.working_branch
+                )
+
+            sandbox_id = self.sandboxes.start(
+                sandbox_name,
+                blueprint_name,
+                duration,
+                context_branch.validation_branch,
+                commit,
+                artifacts or {},
+                inputs or {},
+            )
+
+            if context_branch.temp_branch_exists:
+                from torque.branch.branch_utils import can_temp_branch_be_deleted
+
+                context_branch.revert_from_local_temp_branch()
+                self._poll(
+                    sandbox_id,
+                    lambda sandbox: sandbox.sandbox_status in FINAL_SB_STATUSES or can_temp_branch_be_deleted(sandbox),
+                    timeout,
+                    DEFAULT_POLL_INTERVAL,
+                )
+
+        return sandbox_id
+
+    def end_sandbox(self, sandbox_id: str, verify: bool = True) -> None:
+        """Raises NotFoundError when there is no such sandbox, unless verify is off and the check is skipped"""
+        if verify:
+            self.sandboxes.get(sandbox_id)
+        self.sandboxes.end(sandbox_id, verify=False)
+
+    def end_sandboxes(
+        self, sandbox_ids: List[str], jobs: int = DEFAULT_END_JOBS, verify: bool = True
+    ) -> List[SandboxEndResult]:
+        """Ends sandboxes concurrently, failures are reported in the results instead of being raised"""
+        return list(self.sandboxes.end_many(sandbox_ids, jobs=jobs, verify=verify))
+
+    def wait_for_sandbox(
+        self, sandbox_id: str, timeout: float = DEFAULT_TIMEOUT * 60, poll_interval: float = DEFAULT_POLL_INTERVAL
+    ) -> Future:
+        """Waits in the background until the sandbox is launched and returns right away
+
+        The result of the future is the Active sandbox. It raises SandboxLaunchError when the sandbox ends up in
+        another final status (e.g. ActiveWithError), WaitTimeoutError after timeout seconds and CancelledError when
+        Torque is closed meanwhile.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_WAITS)
+        return self._executor.submit(self._wait_for_sandbox, sandbox_id, timeout, poll_interval)
+
+    def list_blueprints(self) -> List[Blueprint]:
+        return self.blueprints.list()
+
+    def validate_blueprint(self, blueprint_name: str, branch: str = None, commit: str = None) -> Blueprint:
+        """Raises BlueprintValidationError with the errors reported by Torque when the blueprint is not valid
+
+        Without branch the blueprint comes from the git repo of the current directory, including local changes.
+        """
+        if commit and not branch:
+            raise ValueError("Since commit is specified, branch is required")
+
+        with self.temp_branch(blueprint_name, branch) as context_branch:
+            blueprint = self.blueprints.validate(
+                blueprint=blueprint_name, branch=context_branch.validation_branch, commit=commit
+            )
+
+        if blueprint.errors:
+            raise BlueprintValidationError(f"Blueprint {blueprint_name} is not valid", blueprint.errors)
+        return blueprint
+
+    @contextmanager
+    def temp_branch(self, blueprint_name: str, branch: str = None) -> Iterator:
+        """Yields a ContextBranch whose validation_branch holds the blueprint to use
+
+        When branch is not set, uncommitted or unpushed changes of the git repo in the current directory are pushed
+        to a temp branch, which is deleted and the local changes restored on exit. Raises BadBlueprintRepo when the
+        current directory is not a usable blueprint repo.
+        """
+        from torque.branch.branch_context import ContextBranch
+
+        repo = None
+        if not branch:
+            from torque.branch.branch_utils import get_and_check_folder_based_repo
+            from torque.utils import BlueprintRepoCache
+
+            self._repo_cache = self._repo_cache or BlueprintRepoCache()
+            repo = get_and_check_folder_based_repo(blueprint_name, self._repo_cache)
+
+        with ContextBranch(repo, branch) as context_branch:
+            if context_branch is None:
+                raise BadBlueprintRepo("Unable to push local changes to a temp branch")
+            yield context_branch
+
+    def _wait_for_sandbox(self, sandbox_id: str, timeout: float, poll_interval: float) -> Sandbox:
+        sandbox = self._poll(
+            sandbox_id, lambda sandbox: sandbox.sandbox_status in FINAL_SB_STATUSES, timeout, poll_interval
+        )
+        if sandbox.sandbox_status != "Active":
+            raise SandboxLaunchError(f"Sandbox {sandbox_id} is {sandbox.sandbox_status}", sandbox)
+        return sandbox
+
+    def _poll(self, sandbox_id: str, condition: Callable[[Sandbox], bool], timeout: float, interval: float) -> Sandbox:
+        deadline = time.monotonic() + timeout
+        while True:
+            sandbox = self.sandboxes.get(sandbox_id, refresh=True)
+            if condition(sandbox):
+                return sandbox
+
+            if time.monotonic() + interval > deadline:
+                raise WaitTimeoutError(f"Sandbox {sandbox_id} was not launched after {timeout} sec")
+            if self._closed.wait(interval):
+                raise CancelledError()
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, List
+
+from requests import Response
+
+from torque.client import TorqueClient
+from torque.constants import DEFAULT_POOL_SIZE, FINAL_SB_STATUSES
+from torque.models.blueprints import Blueprint, BlueprintsManager
+from torque.sandboxes import Sandbox, SandboxesManager
+
+
+class AsyncTorqueClient(object):
+    """asyncio front-end for TorqueClient
+
+    Blocking requests run on a worker pool which is sized like the client connection pool, so any number of
+    coroutines can share one client while at most max_concurrency requests (and sockets) are in flight.
+    """
+
+    def __init__(self, *args, max_concurrency: int = DEFAULT_POOL_SIZE, client: TorqueClient = None, **kwargs):
+        self.client = client or TorqueClient(*args, pool_size=max_concurrency, **kwargs)
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    @property
+    def base_url(self) -> str:
+        return self.client.base_url
+
+    @property
+    def space(self) -> str:
+        return self.client.space
+
+    @property
+    def account(self) -> str:
+        return self.client.account
+
+    async def run(self, func, *args, **kwargs) -> Any:
+        """Runs blocking callable on the client worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def request(self, endpoint: str, method: str = "GET", params: dict = None, headers: dict = None) -> Response:
+        return await self.run(self.client.request, endpoint, method, params, headers)
+
+    async def close(self) -> None:
+        """Waits for the requests in flight on a thread, the event loop keeps running meanwhile"""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown, True)
+        self.client.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncResourceManager(object):
+    """Awaitable counterpart of ResourceManager which delegates to the synchronous manager
+
+    Request building, models and serialization are shared with the synchronous managers.
+    """
+
+    MANAGER = None
+
+    def __init__(self, client: AsyncTorqueClient):
+        self.client = client
+        self.manager = self.MANAGER(client=client.client)
+
+    async def _get(self, path: str, headers: dict = None):
+        return await self.client.run(self.manager._get, path, headers)
+
+    async def _delete(self, path: str):
+        return await self.client.run(self.manager._delete, path)
+
+    async def _list(self, path: str, filter_params: dict = None):
+        return await self.client.run(self.manager._list, path, filter_params)
+
+    async def _post(self, path: str, params: dict = None, headers: dict = None):
+        return await self.client.run(self.manager._post, path, params, headers)
+
+
+class AsyncSandboxesManager(AsyncResourceManager):
+    MANAGER = SandboxesManager
+
+    def get_sandbox_url(self, sandbox_id: str) -> str:
+        return self.manager.get_sandbox_url(sandbox_id)
+
+    def get_sandbox_ui_link(self, sandbox_id: str) -> str:
+        return self.manager.get_sandbox_ui_link(sandbox_id)
+
+    async def get(self, sandbox_id: str) -> Sandbox:
+        return await self.client.run(self.manager.get, sandbox_id)
+
+    async def get_detailed(self, sandbox_id: str) -> dict:
+        return await self.client.run(self.manager.get_detailed, sandbox_id)
+
+    async def list(self, count: int = 25, filter_opt: str = "my") -> List[Sandbox]:
+        return await self.client.run(self.manager.list, count, filter_opt)
+
+    async def start(
+        self,
+        sandbox_name: str,
+        blueprint_name: str,
+        duration: int = 120,
+        branch: str = None,
+        commit: str = None,
+        artifacts: dict = None,
+        inputs: dict = None,
+    ) -> str:
+        return await self.client.run(
+            self.manager.start, sandbox_name, blueprint_name, duration, branch, commit, artifacts, inputs
+        )
+
+    async def end(self, sandbox_id: str, verify: bool = True):
+        return await self.client.run(self.manager.end, sandbox_id, verify)
+
+    async def wait(self, sandbox_id: str, timeout: float, poll_interval: float = 5) -> Sandbox:
+        """Polls sandbox until it reaches one of the final statuses. Raises asyncio.TimeoutError on timeout"""
+        deadline = time.monotonic() + timeout
+        while True:
+            sandbox = await self.client.run(self.manager.get, sandbox_id, True)
+            if sandbox.sandbox_status in FINAL_SB_STATUSES:
+                return sandbox
+
+            if time.monotonic() + poll_interval > deadline:
+                raise asyncio.TimeoutError(f"Sandbox {sandbox_id} did not reach final status in {timeout} sec")
+
+            await asyncio.sleep(poll_interval)
+
+
+class AsyncBlueprintsManager(AsyncResourceManager):
+    MANAGER = BlueprintsManager
+
+    async def get(self, blueprint_name: str) -> Blueprint:
+        return await self.client.run(self.manager.get, blueprint_name)
+
+    async def list(self) -> List[Blueprint]:
+        return await self.client.run(self.manager.list)
+
+    async def list_detailed(self) -> Any:
+        return await self.client.run(self.manager.list_detailed)
+
+    async def validate(
+        self, blueprint: str, env_type: str = "sandbox", branch: str = None, commit: str = None
+    ) -> Blueprint:
+        return await self.client.run(self.manager.validate, blueprint, env_type, branch, commit)
@@ -1,6 +1,10 @@
+from typing import Iterator
 from urllib.parse import urljoin
 
+from torque.cache import ResponseCache
 from torque.client import TorqueClient
+from torque.memo import RequestMemo
+from torque.streaming import DEFAULT_CHUNK_SIZE, iter_json_array
 
 # TODO(ddovbii): Make classes abstract
 
@@ -10,8 +14,11 @@ from torque.client import TorqueClient
 class ResourceManager(object):
     resource_obj = None
 
-    def __init__(self, client: TorqueClient):
+    def __init__(self, client: TorqueClient, cache: ResponseCache = None, memo: RequestMemo = None):
         self.client = client
+        self.cache = cache
+        # managers live for a single command run, so memoized results never outlive it
+        self.memo = memo if memo is not None else RequestMemo()
         self.endpoint = urljoin(self.client.base_url, f"spaces/{self.client.space}/")
 
     def _get_full_url(self, path: str):
@@ -23,14 +30,15 @@ class ResourceManager(object):
             headers = {}
 
         url = urljoin(self.endpoint, path)
+        key = self.memo.make_key(url, headers=headers)
 
-        result = self.client.request(url, "GET", headers)
-        return result.json()
+        return self.memo.get_or_fetch(key, lambda: self._get_json(url, headers=headers))
 
     def _delete(self, path: str):
         url = urljoin(self.endpoint, path)
 
         result = self.client.request(url, "DELETE")
+        self.memo.invalidate(url)
         return result
 
     def _list(self, path: str, filter_params: dict = None):
@@ -40,9 +48,19 @@ class ResourceManager(object):
         # if filter is not None:
         params = filter_params.copy() if filter_params else None
 
-        result = self.client.request(url, "GET", params=params)
+        return self._get_json(url, params=params)
 
-        return result.json()
+    def _iter_list(self, path: str, filter_params: dict = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator:
+        """Streams list response and yields its elements one by one without loading the whole body"""
+        url = urljoin(self.endpoint, path)
+        params = filter_params.copy() if filter_params else None
+
+        result = self.client.request(url, "GET", params=params, stream=True)
+        try:
+            yield from iter_json_array(result.iter_content(chunk_size=chunk_size))
+        finally:
+            # returns the connection to the pool even if the caller stops iterating early
+            result.close()
 
     def _post(self, path: str, params: dict = None, headers: dict = None):
         if headers is None:
@@ -53,6 +71,28 @@ class ResourceManager(object):
 
         url = urljoin(self.endpoint, path)
         result = self.client.request(url, "POST", params, headers)
+        self.memo.invalidate(url)
+        return result.json()
+
+    def _get_json(self, url: str, params: dict = None, headers: dict = None):
+        if self.cache is None:
+            return self.client.request(url, "GET", params, headers).json()
+
+        key = self.cache.make_key(url, params, self.client.token)
+        entry = self.cache.get(key)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.validators())
+
+        result = self.client.request(url, "GET", params, request_headers)
+
+        if result.status_code == 304 and entry is not None:
+            self.cache.record_hit()
+            return entry.json()
+
+        self.cache.record_miss()
+        self.cache.store(key, result)
         return result.json()
 
 
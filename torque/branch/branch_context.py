@@ -6,6 +6,8 @@ from torque.branch.branch_utils import (
     get_blueprint_working_branch,
     revert_from_local_temp_branch,
 )
+from torque.deadline import deadline
+from torque.profiler import profiler
 from torque.utils import BlueprintRepo
 
 
@@ -19,7 +21,10 @@ class ContextBranch(object):
         self.temp_branch_reverted = False
 
     def __enter__(self):
+        with deadline.stage("git"), profiler.phase("temp branch"):
+            return self._enter()
 
+    def _enter(self):
         items_in_stack_before_temp_branch_check = count_stashed_items(self.repo)
 
         if self.branch or self.repo is None:
@@ -47,11 +52,14 @@ class ContextBranch(object):
             self.revert_from_local_temp_branch()
 
         if self.temp_branch_exists:
-            delete_temp_local_branch(self.repo, self.temp_working_branch)
-            delete_temp_remote_branch(self.repo, self.temp_working_branch)
+            # cleanup runs even when the deadline is exceeded
+            with deadline.stage("git", check=False), profiler.phase("temp branch"):
+                delete_temp_local_branch(self.repo, self.temp_working_branch)
+                delete_temp_remote_branch(self.repo, self.temp_working_branch)
             self.temp_branch_exists = False
 
     def revert_from_local_temp_branch(self) -> None:
         if not self.temp_branch_reverted:
-            revert_from_local_temp_branch(self.repo, self.working_branch, self.stashed_flag)
+            with deadline.stage("git", check=False), profiler.phase("temp branch"):
+                revert_from_local_temp_branch(self.repo, self.working_branch, self.stashed_flag)
         self.temp_branch_reverted = True
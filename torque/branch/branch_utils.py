@@ -2,11 +2,15 @@ import logging
 import os
 import random
 import string
+import sys
+from typing import Optional
 
-from torque.constants import DONE_STATUS, UNCOMMITTED_BRANCH_NAME
-from torque.exceptions import BadBlueprintRepo
+from torque.constants import DEADLINE_CLEANUP_GRACE, DONE_STATUS, UNCOMMITTED_BRANCH_NAME
+from torque.deadline import deadline
+from torque.exceptions import BadBlueprintRepo, DeadlineExceededError
+from torque.profiler import profiler
 from torque.sandboxes import Sandbox
-from torque.utils import BlueprintRepo
+from torque.utils import BlueprintRepo, BlueprintRepoCache
 
 logging.getLogger("git").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
@@ -59,18 +63,21 @@ def create_temp_branch_and_stash_if_needed(repo: BlueprintRepo, working_branch:
                 f"Using temp branch: {temp_working_branch} "
                 f"(This shall include any uncommitted changes and/or untracked files)"
             )
+        except DeadlineExceededError:
+            raise
         except Exception as e:
             logger.error(f"Was not able push your latest changes to temp branch for validation. Reason: {str(e)}")
     return temp_working_branch
 
 
-def get_and_check_folder_based_repo(blueprint_name: str) -> BlueprintRepo:
+def get_and_check_folder_based_repo(blueprint_name: str, repo_cache: BlueprintRepoCache = None) -> BlueprintRepo:
     # Try to detect branch from current git-enabled folder
     logger.debug("Branch hasn't been specified. Trying to identify branch from current working directory")
     try:
-        repo = BlueprintRepo(os.getcwd())
-        check_repo_for_errors(repo)
-        debug_output_about_repo_examination(repo, blueprint_name)
+        with profiler.phase("repo"):
+            repo = repo_cache.get(os.getcwd()) if repo_cache else BlueprintRepo(os.getcwd())
+            check_repo_for_errors(repo)
+            debug_output_about_repo_examination(repo, blueprint_name)
     except Exception as e:
         logger.error(f"Branch could not be identified/used from the working directory; reason: {e}.")
         raise
@@ -95,6 +102,8 @@ def switch_to_temp_branch(repo: BlueprintRepo, defined_branch_in_file: str):
             commit_to_local_temp_branch(repo)
         create_remote_branch(repo, uncommitted_branch_name)
         created_remote_flag = True
+        # the push is not killed at the deadline everywhere, a late one is cleaned up below
+        deadline.check("git")
     except Exception as e:
         logger.debug(f"An issue while creating temp branch: {str(e)}")
         if not stashed_flag and (count_stashed_items(repo) > stashed_items_before):
@@ -127,7 +136,8 @@ def remove_gitkeep_in_branch() -> None:
 
 def create_remote_branch(repo: BlueprintRepo, uncommitted_branch_name: str) -> None:
     logger.debug(f"[GIT] Push (origin) {uncommitted_branch_name}")
-    repo.git.push("origin", uncommitted_branch_name)
+    timeout = deadline.cap(None, "git")
+    repo.git.push("origin", uncommitted_branch_name, **kill_after_timeout(timeout))
 
 
 def create_local_temp_branch(repo: BlueprintRepo, uncommitted_branch_name: str) -> bool:
@@ -184,7 +194,16 @@ def delete_temp_local_branch(repo: BlueprintRepo, temp_branch: str) -> None:
 
 def delete_temp_remote_branch(repo: BlueprintRepo, temp_branch: str) -> None:
     logger.debug(f"[GIT] Deleting remote branch {temp_branch}")
-    repo.git.push("origin", "--delete", temp_branch)
+    # cleanup is allowed to run a bit past the deadline, so temp branches are not left behind
+    repo.git.push("origin", "--delete", temp_branch, **kill_after_timeout(deadline.remaining(DEADLINE_CLEANUP_GRACE)))
+
+
+def kill_after_timeout(timeout: Optional[float]) -> dict:
+    """Git command kwargs killing the command after timeout. GitPython does not support it on Windows, there the
+    command runs to the end and the deadline is only checked around it"""
+    if timeout is None or sys.platform == "win32":
+        return {}
+    return {"kill_after_timeout": timeout}
 
 
 def is_k8s_blueprint(blueprint_name: str, repo: BlueprintRepo) -> bool:
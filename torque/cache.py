@@ -0,0 +1,188 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from requests import Response
+
+DEFAULT_CACHE_DIR = "~/.torque/cache"
+DEFAULT_CACHE_MAX_SIZE = 32 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry(object):
+    def __init__(self, body: bytes, etag: str = None, last_modified: str = None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+    def validators(self) -> dict:
+        """Headers turning a GET into a conditional request"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_dict(self) -> dict:
+        return {"etag": self.etag, "last_modified": self.last_modified, "body": self.body.decode("utf-8")}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(data["body"].encode("utf-8"), data.get("etag"), data.get("last_modified"))
+
+
+class ResponseCache(object):
+    """Size-bounded LRU cache of GET response bodies and their validators (ETag / Last-Modified)
+
+    Entries are kept in memory and, when cache_dir is set, also on disk so they survive between CLI runs.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_MAX_SIZE, cache_dir: str = None):
+        self.max_size = max_size
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, mode: str):
+        """Creates cache for the given mode: 'memory', 'disk' or None to disable caching"""
+        if not mode:
+            return None
+        return cls(cache_dir=DEFAULT_CACHE_DIR if mode == "disk" else None)
+
+    @staticmethod
+    def make_key(url: str, params: dict = None, token: str = None) -> str:
+        # the token is part of the key since the same URL returns different data for different users
+        params_str = json.dumps(params or {}, sort_keys=True, default=str)
+        return hashlib.sha256(f"{token}|{url}|{params_str}".encode("utf-8")).hexdigest()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hit_rate, 3), "size": self._size}
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self._read_from_disk(key)
+        if entry is not None:
+            self._put_in_memory(key, entry)
+        return entry
+
+    def store(self, key: str, response: Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            # without validators the entry could never be revalidated
+            self.invalidate(key)
+            return
+
+        entry = CacheEntry(response.content, etag, last_modified)
+        if entry.size > self.max_size:
+            return
+
+        self._put_in_memory(key, entry)
+        self._write_to_disk(key, entry)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry.size
+
+        if self.cache_dir:
+            try:
+                self._get_path(key).unlink()
+            except OSError:
+                pass
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def _put_in_memory(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+
+            self._entries[key] = entry
+            self._size += entry.size
+
+            while self._size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+    def _get_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _read_from_disk(self, key: str) -> Optional[CacheEntry]:
+        if not self.cache_dir:
+            return None
+
+        path = self._get_path(key)
+        try:
+            with open(path) as cache_file:
+                entry = CacheEntry.from_dict(json.load(cache_file))
+            # mtime tracks recency for disk LRU eviction
+            os.utime(path)
+            return entry
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_to_disk(self, key: str, entry: CacheEntry) -> None:
+        if not self.cache_dir:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._get_path(key)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, "w") as cache_file:
+                json.dump(entry.to_dict(), cache_file)
+            os.replace(tmp_path, path)
+            self._evict_from_disk()
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug(f"Unable to write response cache entry. Details: {e}")
+
+    def _evict_from_disk(self) -> None:
+        files = [(f.stat().st_mtime, f.stat().st_size, f) for f in self.cache_dir.glob("*.json")]
+        total_size = sum(size for _, size, _ in files)
+
+        for _, size, path in sorted(files):
+            if total_size <= self.max_size:
+                break
+            try:
+                path.unlink()
+                total_size -= size
+            except OSError:
+                pass
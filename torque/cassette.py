@@ -0,0 +1,162 @@
+import base64
+import datetime
+import json
+import threading
+import time
+from collections import deque
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from torque.exceptions import CassetteMismatchError
+from torque.transport import Transport
+
+REDACTED = "<redacted>"
+# JSON fields holding credentials, they are never written to a cassette
+SECRET_FIELDS = ("access_token", "password", "token")
+
+
+def _path_url(method: str, url: str, params: dict = None) -> str:
+    """Path and query of the request, cassettes are matched without the host so they can be replayed anywhere"""
+    return requests.Request(method, url, params=params).prepare().path_url
+
+
+def _redact_headers(headers: dict) -> dict:
+    headers = dict(headers)
+    for name in list(headers):
+        if name.lower() == "authorization":
+            headers[name] = REDACTED
+    return headers
+
+
+def _redact_json(body: bytes) -> bytes:
+    try:
+        doc = json.loads(body)
+    except ValueError:
+        return body
+
+    if isinstance(doc, dict) and any(field in doc for field in SECRET_FIELDS):
+        doc = {key: REDACTED if key in SECRET_FIELDS else value for key, value in doc.items()}
+        return json.dumps(doc).encode()
+    return body
+
+
+def _encode_body(body: bytes) -> dict:
+    try:
+        return {"body": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_base64": base64.b64encode(body).decode()}
+
+
+def _decode_body(interaction: dict) -> bytes:
+    if "body_base64" in interaction:
+        return base64.b64decode(interaction["body_base64"])
+    return interaction.get("body", "").encode("utf-8")
+
+
+class RecordingTransport(Transport):
+    """Sends requests through another transport and appends every request/response pair to a cassette file
+
+    The cassette is a JSON lines file. Credentials (the bearer token, passwords and access tokens) are redacted.
+    """
+
+    def __init__(self, transport, path: str):
+        self.transport = transport
+        self.path = path
+        self._started_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._file = open(path, "w", encoding="utf-8")
+
+    @property
+    def headers(self):
+        return self.transport.headers
+
+    def init_bearer_auth(self, token: str) -> None:
+        self.transport.init_bearer_auth(token)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        offset = time.monotonic() - self._started_at
+        response = self.transport.request(method, url, **kwargs)
+        # the body is read to be recorded, iter_content still works on the response afterwards
+        body = response.content
+
+        request_body = kwargs.get("data")
+        if request_body is None and kwargs.get("json") is not None:
+            request_body = json.dumps(kwargs["json"]).encode()
+
+        interaction = {
+            "method": method,
+            "path": _path_url(method, url, kwargs.get("params")),
+            "request_headers": _redact_headers(kwargs.get("headers") or {}),
+            "request_body": _redact_json(request_body).decode("utf-8", "replace") if request_body else None,
+            "started_at": round(offset, 6),
+            "elapsed": response.elapsed.total_seconds(),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": _redact_headers(response.headers),
+        }
+        interaction.update(_encode_body(_redact_json(body)))
+
+        with self._lock:
+            self._file.write(json.dumps(interaction) + "\n")
+            self._file.flush()
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+        with self._lock:
+            self._file.close()
+
+
+class ReplayTransport(Transport):
+    """Answers requests from a cassette written by RecordingTransport without any network access
+
+    Requests are matched by method, path and query. Repeated requests (e.g. status polling) get the recorded responses
+    in order, the last one is repeated when they run out. With speed "recorded" every response is delayed by its
+    recorded latency, with "fast" responses are returned immediately.
+    """
+
+    SPEEDS = ("recorded", "fast")
+
+    def __init__(self, path: str, speed: str = "recorded"):
+        if speed not in self.SPEEDS:
+            raise ValueError(f"Replay speed must be in [{', '.join(self.SPEEDS)}]")
+
+        self.speed = speed
+        self.headers = {}
+        self._lock = threading.Lock()
+        self._interactions = {}
+        with open(path, encoding="utf-8") as cassette:
+            for line in cassette:
+                if line.strip():
+                    interaction = json.loads(line)
+                    key = (interaction["method"], interaction["path"])
+                    self._interactions.setdefault(key, deque()).append(interaction)
+
+    def init_bearer_auth(self, token: str) -> None:
+        pass
+
+    def request(self, method: str, url: str, params: dict = None, stream: bool = False, **kwargs):
+        key = (method, _path_url(method, url, params))
+        with self._lock:
+            recorded = self._interactions.get(key)
+            if not recorded:
+                raise CassetteMismatchError(f"No recorded response for {key[0]} {key[1]}")
+            interaction = recorded.popleft() if len(recorded) > 1 else recorded[0]
+
+        if self.speed == "recorded":
+            time.sleep(interaction["elapsed"])
+
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.reason = interaction.get("reason")
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = _decode_body(interaction)
+        # the recorded body is already decoded
+        response.headers.pop("Content-Encoding", None)
+        response.headers["Content-Length"] = str(len(response._content))
+        response._content_consumed = True
+        response.elapsed = datetime.timedelta(seconds=interaction["elapsed"])
+        return response
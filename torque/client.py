@@ -1,13 +1,27 @@
+import gzip
+import json
 import logging
 import os
+import threading
+import time
+from typing import Union
 from urllib.parse import urljoin
 
-from requests import Response, Session
+from requests import RequestException, Response, Session
 
-from .exceptions import Unauthorized
-from .session import TorqueSession
+from . import timings
+from .constants import COMPRESSION_MIN_SIZE, DEFAULT_CONNECT_TIMEOUT, DEFAULT_POOL_SIZE, DEFAULT_READ_TIMEOUT
+from .deadline import deadline
+from .exceptions import NotFoundError, TorqueApiError, Unauthorized
+from .hedging import HedgingPolicy
+from .profiler import profiler
+from .rate_limiter import TokenBucket
+from .retry import RetryPolicy
+from .session import TorqueSession, get_connect_time, reset_connect_time
+from .transport import Transport, create_transport
 
 logging.getLogger("urllib3").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
 
 
 class TorqueClient(object):
@@ -24,25 +38,45 @@ class TorqueClient(object):
         account: str = None,
         email: str = None,
         password: str = None,
-        session: TorqueSession = TorqueSession(),
+        session: Union[TorqueSession, Transport] = None,
+        pool_size: int = None,
+        retry_policy: RetryPolicy = None,
+        rate_limiter: TokenBucket = None,
+        compress_requests: bool = None,
+        hedging_policy: HedgingPolicy = None,
+        transport: str = None,
     ):
 
         if os.environ.get("TORQUE_HOSTNAME"):
             torque_host = os.environ["TORQUE_HOSTNAME"]
 
+        if rate_limiter is None and os.environ.get("TORQUE_RATE_LIMIT"):
+            rate_limiter = TokenBucket(rate=float(os.environ["TORQUE_RATE_LIMIT"]))
+
+        if compress_requests is None:
+            compress_requests = os.environ.get("TORQUE_COMPRESS_REQUESTS", "").lower() in ("1", "true", "yes")
+
+        if hedging_policy is None and os.environ.get("TORQUE_HEDGE_REQUESTS", "").lower() in ("1", "true", "yes"):
+            hedging_policy = HedgingPolicy()
+
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.hedging_policy = hedging_policy
+        self.rate_limiter = rate_limiter
+        self.compress_requests = compress_requests
+
         self.base_url = urljoin(f"{torque_host_prefix}{torque_host}", self.API_URL)
 
-        self.session = session
+        # the transport is chosen by name or with the TORQUE_TRANSPORT environment variable
+        self.session = session or create_transport(transport, pool_size=pool_size or DEFAULT_POOL_SIZE)
         self.space = space
         self.account = account
 
-        if token:
-            self.token = token
+        self.token = token
 
-        elif all([account, email, password]):
-            self.token = TorqueClient.login(account, email, password, self.session, self.base_url)
+        if not token and all([account, email, password]):
+            self.token = self.login(account, email, password)
 
-        self.session.init_bearer_auth(token)
+        self.session.init_bearer_auth(self.token)
 
     def __del__(self):
         if self.session:
@@ -58,8 +92,9 @@ class TorqueClient(object):
         account: str,
         email: str,
         password: str,
-        session: Session = TorqueSession(),
+        session: Session = None,
     ):
+        session = session or self.session
         path = urljoin(self.base_url, f"accounts/{account}/login")
         payload = {"email": email, "password": password}
         resp = session.post(url=path, json=payload)
@@ -74,18 +109,34 @@ class TorqueClient(object):
         longtoken_resp = self.session.post(url_longtoken)
         return longtoken_resp.json().get("access_token", "")
 
-    def request(self, endpoint: str, method: str = "GET", params: dict = None, headers: dict = None) -> Response:
-        """Gets response as Json"""
+    def warm_up(self) -> threading.Thread:
+        """Opens a connection to the API in a background thread so later requests skip DNS, TCP and TLS setup"""
+
+        def open_connection():
+            try:
+                self.session.request("HEAD", self.base_url).close()
+            except Exception as e:
+                logger.debug(f"Connection warm-up failed: {e}")
+
+        thread = threading.Thread(target=open_connection, daemon=True)
+        thread.start()
+        return thread
+
+    def request(
+        self, endpoint: str, method: str = "GET", params: dict = None, headers: dict = None, stream: bool = False
+    ) -> Response:
+        """Gets response as Json. With stream=True the body is not read, the caller must close the response"""
         method = method.upper()
 
         if method not in ("GET", "PUT", "POST", "DELETE"):
             raise ValueError("Method must be in [GET, POST, PUT, DELETE]")
 
-        if headers:
-            self.session.headers.update(headers)
+        # headers are request-scoped: the session is shared by all threads using this client, so it must not be
+        # mutated per request
+        request_headers = dict(headers) if headers else {}
 
         if method in ("POST", "PUT", "DELETE"):
-            self.session.headers.update({"Content-Type": "application/json"})
+            request_headers.setdefault("Content-Type", "application/json")
 
         if params is None:
             params = {}
@@ -95,17 +146,120 @@ class TorqueClient(object):
         request_args = {
             "method": method,
             "url": url,
+            "headers": request_headers,
+            "stream": stream,
         }
         if method == "GET":
             request_args["params"] = params
+        elif self.compress_requests:
+            body = json.dumps(params).encode("utf-8")
+            if len(body) >= COMPRESSION_MIN_SIZE:
+                logger.debug(f"Compressing {method} {url} request body ({len(body)} bytes)")
+                body = gzip.compress(body)
+                request_headers["Content-Encoding"] = "gzip"
+            request_args["data"] = body
         else:
             request_args["json"] = params
 
-        response = self.session.request(**request_args)
+        with deadline.stage("http"), profiler.phase("api"):
+            return self._send_recorded(method, url, request_args, stream)
 
-        if response.status_code >= 400:
-            # TODO(ddovbii): implement exceptions and error handler
-            message = ";".join([f"{err['name']}: {err['message']}" for err in response.json().get("errors", [])])
-            raise Exception(message)
+    def _send_recorded(self, method: str, url: str, request_args: dict, stream: bool) -> Response:
+        if not timings.recorder.enabled:
+            return self._send(method, url, request_args, stream)
+
+        reset_connect_time()
+        start = time.perf_counter()
+        response = None
+        try:
+            response = self._send(method, url, request_args, stream)
+            return response
+        except TorqueApiError as e:
+            response = e.response
+            raise
+        finally:
+            self._record_timing(method, url, response, get_connect_time(), time.perf_counter() - start, stream)
+
+    def _send(self, method: str, url: str, request_args: dict, stream: bool) -> Response:
+        attempt = 0
+        while True:
+            if deadline.enabled:
+                # every attempt gets at most the time left in the --deadline budget
+                request_args["timeout"] = (
+                    deadline.cap(DEFAULT_CONNECT_TIMEOUT, "http"),
+                    deadline.cap(DEFAULT_READ_TIMEOUT, "http"),
+                )
+
+            try:
+                if self.hedging_policy and method == "GET" and not stream:
+                    response = self.hedging_policy.execute(lambda: self._send_once(request_args))
+                else:
+                    response = self._send_once(request_args)
+            except RequestException as e:
+                if not self.retry_policy.should_retry(method, attempt, error=e):
+                    raise
+                delay = self.retry_policy.get_delay(attempt)
+                logger.debug(f"{method} {url} failed: {e}")
+            else:
+                if response.status_code < 400:
+                    if not stream and logger.isEnabledFor(logging.DEBUG):
+                        self._log_transfer_size(method, url, response)
+                    return response
+
+                if not self.retry_policy.should_retry(method, attempt, status_code=response.status_code):
+                    error_class = NotFoundError if response.status_code == 404 else TorqueApiError
+                    raise error_class(self._get_error_message(response), response.status_code, response)
+
+                delay = self.retry_policy.get_delay(attempt, response)
+                # release the connection before sleeping, a streamed response would hold it otherwise
+                response.close()
+                if response.status_code == 429 and self.rate_limiter:
+                    # slow down every thread sharing this client, not only the current one
+                    self.rate_limiter.pause(delay)
+                logger.debug(f"{method} {url} returned status {response.status_code}")
+
+            attempt += 1
+            logger.debug(f"Retrying in {delay:.2f} sec (attempt {attempt} of {self.retry_policy.max_retries})")
+            time.sleep(deadline.cap(delay, "http"))
+
+    def _send_once(self, request_args: dict) -> Response:
+        # hedges are requests too, each one takes a token of the shared rate limit
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        return self.session.request(**request_args)
+
+    @staticmethod
+    def _record_timing(
+        method: str, url: str, response: Response, connect_time: float, total_time: float, stream: bool
+    ) -> None:
+        if response is not None:
+            status = response.status_code
+            ttfb = response.elapsed.total_seconds()
+            if stream or response.raw is None:
+                size = int(response.headers.get("Content-Length", 0))
+            else:
+                size = response.raw.tell()
+        else:
+            status, ttfb, size = None, total_time, 0
+
+        timing = timings.RequestTiming(
+            method, timings.endpoint_template(url), status, size, connect_time, ttfb, total_time
+        )
+        timings.recorder.record(timing)
+
+    @staticmethod
+    def _log_transfer_size(method: str, url: str, response: Response) -> None:
+        encoding = response.headers.get("Content-Encoding", "identity")
+        # raw.tell() counts bytes read from the socket, content holds the decoded body
+        received = response.raw.tell() if response.raw is not None else len(response.content)
+        logger.debug(f"{method} {url}: {received} bytes received, {len(response.content)} bytes decoded ({encoding})")
+
+    @staticmethod
+    def _get_error_message(response: Response) -> str:
+        try:
+            errors = response.json().get("errors", [])
+            message = ";".join([f"{err['name']}: {err['message']}" for err in errors])
+        except (ValueError, AttributeError, KeyError, TypeError):
+            message = ""
 
-        return response
+        return message or f"{response.status_code} {response.reason}"
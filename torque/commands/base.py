@@ -1,13 +1,13 @@
 from typing import Any
 
 from colorama import Fore, Style
-from docopt import DocoptExit, docopt
+from docopt import DocoptExit
 
-from torque.base import ResourceManager
-from torque.client import TorqueClient
 from torque.models.connection import TorqueConnection
 from torque.parsers.command_input_parsers import CommandInputParser
+from torque.parsers.docopt_cache import docopt
 from torque.parsers.global_input_parser import GlobalInputParser
+from torque.profiler import profiler
 from torque.services.output_formatter import OutputFormatter
 
 
@@ -16,22 +16,41 @@ class BaseCommand(object):
     usage: torque
     """
 
-    RESOURCE_MANAGER = ResourceManager
+    # ResourceManager when not set, API modules pull in requests and are imported only by commands that connect
+    RESOURCE_MANAGER = None
     OUTPUT_FORMATTER = OutputFormatter
+    # actions doing slow local work (e.g. git) before their first request, the connection is opened meanwhile
+    WARM_UP_ACTIONS = []
+
+    def __init__(self, command_args: list, connection: TorqueConnection = None, client=None, repo_cache=None):
+        """client and repo_cache are passed by a long running process (torque daemon) to reuse warm connections and
+        repository scans between commands"""
+        with profiler.phase("docopt"):
+            self.args = docopt(self.__doc__, argv=command_args)
+        self.input_parser = CommandInputParser(self.args)
+        self.global_input_parser = GlobalInputParser(self.args)
+        self.output_formatter = self.OUTPUT_FORMATTER(self.global_input_parser)
 
-    def __init__(self, command_args: list, connection: TorqueConnection = None):
-        if connection:
-            self.client = TorqueClient(space=connection.space, token=connection.token, account=connection.account)
-            self.manager = self.RESOURCE_MANAGER(client=self.client)
+        self.repo_cache = repo_cache
+
+        if client or connection:
+            from torque.base import ResourceManager
+            from torque.cache import ResponseCache
+            from torque.client import TorqueClient
+
+            self.client = client or TorqueClient(
+                space=connection.space,
+                token=connection.token,
+                account=connection.account,
+                pool_size=connection.pool_size,
+            )
+            cache = ResponseCache.create(self.global_input_parser.response_cache)
+            manager_class = self.RESOURCE_MANAGER or ResourceManager
+            self.manager = manager_class(client=self.client, cache=cache)
         else:
             self.client = None
             self.manager = None
 
-        self.args = docopt(self.__doc__, argv=command_args)
-        self.input_parser = CommandInputParser(self.args)
-        self.global_input_parser = GlobalInputParser(self.args)
-        self.output_formatter = self.OUTPUT_FORMATTER(self.global_input_parser)
-
     def execute(self) -> bool:
         """Finds a subcommand passed to with command in
         object actions table and executes mapped method"""
@@ -51,6 +70,9 @@ class BaseCommand(object):
     def get_actions_table(self) -> dict:
         return {}
 
+    def should_warm_up(self) -> bool:
+        return self.client is not None and any(self.args.get(action, False) for action in self.WARM_UP_ACTIONS)
+
     def styled_text(self, style, message: str = "", newline=True):
         self.output_formatter.styled_text(style, message, newline)
 
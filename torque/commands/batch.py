@@ -0,0 +1,61 @@
+import json
+import logging
+import sys
+import time
+
+from torque.commands.base import BaseCommand
+
+logger = logging.getLogger(__name__)
+
+
+class BatchCommand(BaseCommand):
+    """
+    usage:
+        torque batch <file> [--jobs=<N>]
+        torque batch [--help|-h]
+
+    options:
+        -j --jobs=<N>   Number of commands run at the same time (default is 1). Commands starting a sandbox or
+                        validating a blueprint from the local repo always run one at a time.
+
+        -h --help       Show this message
+
+    Runs the commands of a file (or of stdin with '-') in one process, sharing the connection to Torque, the config
+    and opened blueprint repos. The file has one command per line, e.g. 'sb end <sandbox_id>', with or without the
+    leading 'torque', or is a YAML list of commands.
+
+    A JSON result is printed per command, in file order: line, command, success, exit_code, duration, stdout and
+    stderr. The batch fails when any of its commands fails.
+    """
+
+    def get_actions_table(self) -> dict:
+        return {"<file>": self.do_batch}
+
+    def do_batch(self):
+        from torque import shell
+        from torque.services.batch import BatchRunner, parse_script
+        from torque.utils import BlueprintRepoCache
+
+        path = self.input_parser.batch.path
+        jobs = self.input_parser.batch.jobs
+        try:
+            if path == "-":
+                script = parse_script(sys.stdin.read())
+            else:
+                with open(path) as f:
+                    script = parse_script(f.read())
+        except (OSError, ValueError) as e:
+            return self.die(f"Unable to read batch file {path}: {e}")
+
+        runner = BatchRunner(shell.load_runnable_commands(), self.client, self.repo_cache or BlueprintRepoCache(), jobs)
+        stdout, stderr = sys.stdout, sys.stderr
+        started_at = time.monotonic()
+        failed = 0
+        for result in runner.run(script):
+            failed += not result["success"]
+            stdout.write(json.dumps(result) + "\n")
+            stdout.flush()
+
+        duration = time.monotonic() - started_at
+        stderr.write(f"{len(script) - failed} of {len(script)} commands succeeded in {duration:.1f} sec\n")
+        return failed == 0, None
@@ -1,8 +1,6 @@
 import logging
 from typing import Any
 
-from torque.branch.branch_context import ContextBranch
-from torque.branch.branch_utils import get_and_check_folder_based_repo
 from torque.commands.base import BaseCommand
 from torque.models.blueprints import BlueprintsManager
 from torque.parsers.command_input_validators import CommandInputValidator
@@ -33,6 +31,7 @@ class BlueprintsCommand(BaseCommand):
     """
 
     RESOURCE_MANAGER = BlueprintsManager
+    WARM_UP_ACTIONS = ["validate"]
 
     def get_actions_table(self) -> dict:
         return {"list": self.do_list, "validate": self.do_validate}
@@ -51,13 +50,16 @@ class BlueprintsCommand(BaseCommand):
         return True, blueprint_list
 
     def do_validate(self) -> (bool, Any):
+        from torque.branch.branch_context import ContextBranch
+        from torque.branch.branch_utils import get_and_check_folder_based_repo
+
         blueprint_name = self.input_parser.blueprint_validate.blueprint_name
         branch = self.input_parser.blueprint_validate.branch
         commit = self.input_parser.blueprint_validate.commit
 
         CommandInputValidator.validate_commit_and_branch_specified(branch, commit)
 
-        repo = get_and_check_folder_based_repo(blueprint_name)
+        repo = get_and_check_folder_based_repo(blueprint_name, self.repo_cache)
         with ContextBranch(repo, branch) as context_branch:
             if not context_branch:
                 return self.error("Unable to Validate BP")
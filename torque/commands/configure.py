@@ -3,7 +3,6 @@ import logging
 
 from docopt import DocoptExit
 
-from torque.client import TorqueClient
 from torque.commands.base import BaseCommand
 from torque.constants import TorqueConfigKeys
 from torque.exceptions import ConfigFileMissingError
@@ -122,6 +121,8 @@ class ConfigureCommand(BaseCommand):
             password = self.input_parser.configure_set.password or getpass.getpass("Password: ")
 
             # get token
+            from torque.client import TorqueClient
+
             try:
                 client = TorqueClient()
                 access_token = client.login(account, email, password)
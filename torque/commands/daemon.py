@@ -0,0 +1,60 @@
+import logging
+
+from torque import daemon
+from torque.commands.base import BaseCommand
+
+logger = logging.getLogger(__name__)
+
+
+class DaemonCommand(BaseCommand):
+    """
+    usage:
+        torque daemon start [--foreground]
+        torque daemon stop
+        torque daemon status
+        torque daemon [--help|-h]
+
+    options:
+        --foreground    Run the daemon in the current process instead of in the background
+
+        -h --help       Show this message
+
+    While the daemon runs, sb and bp commands are forwarded to it over a Unix socket (~/.torque/daemon.sock, set
+    TORQUE_DAEMON_SOCKET to change it). It keeps connections to Torque, the parsed config and opened blueprint repos
+    warm between commands. Commands run in the CLI process when no daemon is running.
+    """
+
+    def get_actions_table(self) -> dict:
+        return {"start": self.do_start, "stop": self.do_stop, "status": self.do_status}
+
+    def do_start(self):
+        status = daemon.DaemonClient().status()
+        if status:
+            return self.die(f"Daemon is already running (pid {status['pid']})")
+
+        if self.args["--foreground"]:
+            self.info(f"Daemon is listening on {daemon.get_socket_path()}")
+            daemon.serve()
+            return self.success("Daemon stopped")
+
+        pid = daemon.start_detached()
+        if pid is None:
+            return self.die("Unable to start the daemon")
+        return self.success(f"Daemon started (pid {pid})")
+
+    def do_stop(self):
+        if not daemon.DaemonClient().stop():
+            return self.die("Daemon is not running")
+        return self.success("Daemon stopped")
+
+    def do_status(self):
+        status = daemon.DaemonClient().status()
+        if not status:
+            return self.die("Daemon is not running")
+
+        self.important_value("Pid: ", str(status["pid"]))
+        self.important_value("Uptime: ", f"{status['uptime']} sec")
+        self.important_value("Commands run: ", str(status["commands"]))
+        self.important_value("Warm clients: ", str(status["clients"]))
+        self.important_value("Cached repos: ", str(status["repos"]))
+        return True, None
@@ -0,0 +1,147 @@
+import logging
+import os
+import shlex
+import sys
+
+from torque.commands.base import BaseCommand
+
+try:
+    import readline
+except ImportError:
+    # not available on Windows, the shell works without history and completion
+    readline = None
+
+logger = logging.getLogger(__name__)
+
+HISTORY_PATH = "~/.torque/shell_history"
+HISTORY_LENGTH = 1000
+PROMPT = "torque> "
+# actions after which the completions of sandbox ids are refreshed right away
+REFRESH_ACTIONS = ["start", "end"]
+
+
+class ReplCommand(BaseCommand):
+    """
+    usage:
+        torque shell [--help|-h]
+
+    options:
+        -h --help       Show this message
+
+    Runs torque commands from an interactive prompt, e.g. 'sb list' or 'bp validate my-bp', with one connection to
+    Torque kept open between them. Sandbox ids and blueprint names are completed with Tab.
+    Type 'help' to list commands and 'exit' or Ctrl+D to leave.
+    """
+
+    BUILTINS = ["help", "exit", "quit"]
+
+    def get_actions_table(self) -> dict:
+        return {"shell": self.do_shell}
+
+    def do_shell(self):
+        from torque import shell
+        from torque.services.completion import CompletionCache, ReplCompleter
+        from torque.utils import BlueprintRepoCache
+
+        self.commands = shell.load_runnable_commands()
+        # blueprint repos are scanned once and reopened only when their blueprints change
+        self.repo_cache = self.repo_cache or BlueprintRepoCache()
+        self.completion_cache = CompletionCache(self.client)
+        self.completion_cache.start()
+
+        self._init_readline(ReplCompleter(self.commands, self.completion_cache, self.BUILTINS))
+        try:
+            self._loop()
+        finally:
+            self.completion_cache.stop()
+            self._save_history()
+
+        return True, None
+
+    def run_line(self, line: str) -> bool:
+        """Runs one line typed at the prompt, returns False when the shell should exit"""
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            self.error(f"Unable to parse the command: {e}")
+            return True
+
+        if not argv:
+            return True
+
+        name = argv[0]
+        if name in ["exit", "quit"]:
+            return False
+        if name == "help":
+            self._print_help()
+            return True
+        if name not in self.commands:
+            self.error(f"Unknown command '{name}'. Type 'help' to list commands")
+            return True
+
+        try:
+            self._run_command(name, argv)
+        except KeyboardInterrupt:
+            sys.stdout.write("\n")
+        except Exception as e:
+            logger.debug("Command failed", exc_info=True)
+            self.error(str(e) or e.__class__.__name__)
+        return True
+
+    def _run_command(self, name: str, argv: list) -> None:
+        from torque import shell
+
+        shell.run_command(argv, client=self.client, repo_cache=self.repo_cache)
+        if len(argv) > 1 and argv[1] in REFRESH_ACTIONS:
+            self.completion_cache.request_refresh()
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                line = input(PROMPT)
+            except EOFError:
+                sys.stdout.write("\n")
+                return
+            except KeyboardInterrupt:
+                # drop the line being typed, like a regular shell
+                sys.stdout.write("\n")
+                continue
+
+            if not self.run_line(line):
+                return
+
+    def _print_help(self) -> None:
+        self.message("Commands (add --help to see the usage of a command):")
+        for name in self.commands:
+            self.message(f"    {name}")
+        self.message("Type 'exit' or press Ctrl+D to leave the shell")
+
+    def _init_readline(self, completer) -> None:
+        if readline is None:
+            return
+
+        if "libedit" in (readline.__doc__ or ""):
+            # readline of macOS python
+            readline.parse_and_bind("bind ^I rl_complete")
+        else:
+            readline.parse_and_bind("tab: complete")
+        # blueprint names and sandbox ids may contain dashes
+        readline.set_completer_delims(" \t\n")
+        readline.set_completer(completer.complete)
+
+        readline.set_history_length(HISTORY_LENGTH)
+        try:
+            readline.read_history_file(os.path.expanduser(HISTORY_PATH))
+        except OSError:
+            pass
+
+    def _save_history(self) -> None:
+        if readline is None:
+            return
+
+        path = os.path.expanduser(HISTORY_PATH)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            readline.write_history_file(path)
+        except OSError as e:
+            sys.stderr.write(f"Unable to save shell history: {e}\n")
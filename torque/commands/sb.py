@@ -1,10 +1,16 @@
-from torque.branch.branch_context import ContextBranch
-from torque.branch.branch_utils import get_and_check_folder_based_repo, logger
+import logging
+import sys
+import time
+from collections import OrderedDict
+
+from colorama import Fore
+
 from torque.commands.base import BaseCommand
 from torque.parsers.command_input_validators import CommandInputValidator
 from torque.sandboxes import SandboxesManager
 from torque.services.sb_naming import generate_sandbox_name
-from torque.services.waiter import Waiter
+
+logger = logging.getLogger(__name__)
 
 
 class SandboxesCommand(BaseCommand):
@@ -13,8 +19,10 @@ class SandboxesCommand(BaseCommand):
         torque (sb | sandbox) start <blueprint_name> [options] [--output=json]
         torque (sb | sandbox) status <sandbox_id> [--output=json]
         torque (sb | sandbox) get <sandbox_id> [--output=json | --output=json --detail]
-        torque (sb | sandbox) end <sandbox_id>
-        torque (sb | sandbox) list [--filter={all|my|auto}] [--show-ended] [--count=<N>] [--output=json]
+        torque (sb | sandbox) end (<sandbox_ids>... | --filter=<filter> [--yes]) [--jobs=<N>] [--no-verify]
+                                  [--output=json]
+        torque (sb | sandbox) list [--filter={all|my|auto}] [--show-ended] [--count=<N>] [--page-size=<N>]
+                                   [--prefetch=<N>] [--output=json]
         torque (sb | sandbox) [--help]
 
     options:
@@ -58,10 +66,30 @@ class SandboxesCommand(BaseCommand):
 
        -o --output=json                 Yield output in JSON format
 
+       --filter=<filter>                Sandboxes to list or end: my (default when listing), all or auto.
+
+       --yes                            Confirm ending sandboxes of other users, which are selected by the all and
+                                        auto filters.
+
+       -j, --jobs=<N>                   Number of sandboxes ended at the same time (default is 10).
+
+       --no-verify                      End sandboxes without checking that they exist first, which saves a request
+                                        per sandbox.
+
+       --count=<N>                      Number of sandboxes to list. Use "all" to walk the full sandbox history of the
+                                        space page by page.
+
+       --page-size=<N>                  Number of sandboxes fetched per request when listing with --count=all
+                                        (default is 100).
+
+       --prefetch=<N>                   Number of pages fetched ahead in the background when listing with --count=all
+                                        (default is 1, 0 disables prefetching).
+
 
     """
 
     RESOURCE_MANAGER = SandboxesManager
+    WARM_UP_ACTIONS = ["start"]
 
     def get_actions_table(self) -> dict:
         return {
@@ -76,16 +104,23 @@ class SandboxesCommand(BaseCommand):
         list_filter = self.input_parser.sandbox_list.filter
         show_ended = self.input_parser.sandbox_list.show_ended
         count = self.input_parser.sandbox_list.count
+        page_size = self.input_parser.sandbox_list.page_size
+        prefetch = self.input_parser.sandbox_list.prefetch
 
         try:
-            sandbox_list = self.manager.list(filter_opt=list_filter, count=count)
+            if count == "all":
+                sandboxes = self.manager.paginate(filter_opt=list_filter, page_size=page_size, prefetch=prefetch)
+            else:
+                sandboxes = self.manager.list(filter_opt=list_filter, count=count)
+
+            if not show_ended:
+                sandboxes = filter(lambda sb: sb.sandbox_status != "Ended", sandboxes)
+
+            sandbox_list = list(sandboxes)
         except Exception as e:
             logger.exception(e, exc_info=False)
             return self.die()
 
-        if not show_ended:
-            sandbox_list = list(filter(lambda sb: sb.sandbox_status != "Ended", sandbox_list))
-
         return True, sandbox_list
 
     def do_status(self):
@@ -112,15 +147,89 @@ class SandboxesCommand(BaseCommand):
         return True, sandbox
 
     def do_end(self):
-        try:
-            self.manager.end(self.input_parser.sandbox_status.sandbox_id)
-        except Exception as e:
-            logger.exception(e, exc_info=False)
-            return self.die()
+        sandbox_ids = self.input_parser.sandbox_end.sandbox_ids
+        list_filter = self.input_parser.sandbox_end.filter
+        jobs = self.input_parser.sandbox_end.jobs
+        verify = self.input_parser.sandbox_end.verify
 
-        return self.success("End request has been sent")
+        if len(sandbox_ids) == 1 and sandbox_ids != ["-"]:
+            try:
+                self.manager.end(sandbox_ids[0], verify=verify)
+            except Exception as e:
+                logger.exception(e, exc_info=False)
+                return self.die()
+
+            return self.success("End request has been sent")
+
+        if sandbox_ids == ["-"]:
+            # e.g. torque sb list --output=json | jq -r '.[].id' | torque sb end -
+            sandbox_ids = sys.stdin.read().split()
+        elif list_filter:
+            try:
+                sandboxes = self.manager.paginate(filter_opt=list_filter)
+                sandbox_ids = [sb.sandbox_id for sb in sandboxes if sb.sandbox_status not in ["Ended", "Ending"]]
+            except Exception as e:
+                logger.exception(e, exc_info=False)
+                return self.die()
+
+            if sandbox_ids and list_filter != "my" and not self.input_parser.sandbox_end.confirmed:
+                return self.die(
+                    f"--filter={list_filter} selects {len(sandbox_ids)} sandboxes, including sandboxes of other users. "
+                    "Add --yes to end them"
+                )
+
+        # the same sandbox can't be ended twice
+        sandbox_ids = list(OrderedDict.fromkeys(sandbox_ids))
+        if not sandbox_ids:
+            return self.success("No sandboxes to end")
+
+        output_json = self.global_input_parser.output_json
+        started_at = time.monotonic()
+        results = []
+        for result in self.manager.end_many(sandbox_ids, jobs=jobs, verify=verify):
+            results.append(result)
+            if not output_json and result.success:
+                self.styled_text(Fore.GREEN, f"{result.sandbox_id}: ended ({result.latency:.2f} sec)")
+            elif not output_json:
+                self.styled_text(Fore.RED, f"{result.sandbox_id}: failed ({result.error})")
+
+        summary = self._get_end_summary(results, time.monotonic() - started_at)
+        success = summary["failed"] == 0
+        if output_json:
+            # the results are needed the most when some sandboxes failed, only the exit code tells about failures
+            self.output_formatter.yield_output(True, {"results": results, "summary": summary})
+            return success, None
+
+        self.important_value("Ended: ", f"{summary['ended']} of {len(results)}")
+        self.important_value("Throughput: ", f"{summary['throughput']} sandboxes/sec in {summary['duration']} sec")
+        self.important_value(
+            "Latency: ",
+            f"p50 {summary['latency_p50']} sec, p95 {summary['latency_p95']} sec, max {summary['latency_max']} sec",
+        )
+        return success, None
+
+    @staticmethod
+    def _get_end_summary(results: list, duration: float) -> dict:
+        from torque.timings import percentile
+
+        latencies = [result.latency for result in results]
+        ended = sum(1 for result in results if result.success)
+        return {
+            "ended": ended,
+            "failed": len(results) - ended,
+            "duration": round(duration, 2),
+            "throughput": round(len(results) / duration, 1) if duration else 0.0,
+            "latency_p50": round(percentile(latencies, 50), 2),
+            "latency_p95": round(percentile(latencies, 95), 2),
+            "latency_max": round(max(latencies, default=0.0), 2),
+        }
 
     def do_start(self):
+        # git is only needed to start a sandbox, it is imported here to keep the other actions fast to load
+        from torque.branch.branch_context import ContextBranch
+        from torque.branch.branch_utils import get_and_check_folder_based_repo
+        from torque.services.waiter import Waiter
+
         # get commands inputs
         blueprint_name = self.input_parser.sandbox_start.blueprint_name
 
@@ -136,7 +245,7 @@ class SandboxesCommand(BaseCommand):
         artifacts = self.input_parser.sandbox_start.artifacts
 
         if not branch:
-            repo = get_and_check_folder_based_repo(blueprint_name)
+            repo = get_and_check_folder_based_repo(blueprint_name, self.repo_cache)
             self._update_missing_artifacts_and_inputs_with_default_values(artifacts, blueprint_name, inputs, repo)
         else:
             repo = None
@@ -4,6 +4,39 @@ FINAL_SB_STATUSES = ["Active", "ActiveWithError", "Ended", "EndedWithError", "En
 
 DONE_STATUS = "Done"
 
+# HTTP transport settings
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 60
+# request bodies larger than this are gzipped when request compression is enabled
+COMPRESSION_MIN_SIZE = 64 * 1024
+
+# Paging settings
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_PREFETCH_PAGES = 1
+
+# number of sandboxes ended at the same time by 'sb end' with many ids
+DEFAULT_END_JOBS = 10
+
+# Retry settings
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30
+
+# time allowed for cleanup (e.g. deleting the temp branch) after the --deadline budget is spent
+DEADLINE_CLEANUP_GRACE = 10
+
+# GET responses are reused within one command run for this many seconds
+DEFAULT_MEMO_TTL = 1.0
+
+# Hedged requests settings
+DEFAULT_HEDGE_PERCENTILE = 95
+# hedges may add at most this share of extra GET requests
+DEFAULT_HEDGE_MAX_EXTRA_LOAD = 0.1
+# delay used until enough latencies are observed to compute the percentile
+DEFAULT_HEDGE_INITIAL_DELAY = 1.0
+DEFAULT_HEDGE_MIN_DELAY = 0.05
+
 
 class ConstantBase:
     def __new__(cls, *args, **kwargs):
@@ -0,0 +1,344 @@
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = "~/.torque/daemon.sock"
+# commands the CLI forwards to a running daemon
+FORWARDED_COMMANDS = ["sb", "sandbox", "bp", "blueprint"]
+# seconds to wait for a starting daemon to listen
+DAEMON_START_TIMEOUT = 10
+
+
+def get_socket_path() -> str:
+    return os.path.expanduser(os.environ.get("TORQUE_DAEMON_SOCKET") or DEFAULT_SOCKET_PATH)
+
+
+def should_forward(input_parser) -> bool:
+    """Commands using the process wide timings, deadline or profiler always run in the CLI process, like commands
+    reading stdin ('-' argument, e.g. sb end -) which is not forwarded to the daemon"""
+    if not hasattr(socket, "AF_UNIX") or input_parser.command not in FORWARDED_COMMANDS:
+        return False
+    if "-" in input_parser.command_args:
+        return False
+    return not (input_parser.timings or input_parser.deadline or input_parser.profiler)
+
+
+class DaemonClient(object):
+    """Talks to a running torque daemon over its Unix socket, one JSON message per line"""
+
+    def __init__(self, socket_path: str = None):
+        self.socket_path = socket_path or get_socket_path()
+
+    def request(self, message: dict) -> Iterator[dict]:
+        """Yields the replies of the daemon, raises OSError when no daemon is listening"""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.socket_path)
+            sock.sendall(json.dumps(message).encode() + b"\n")
+            with sock.makefile("rb") as replies:
+                for line in replies:
+                    yield json.loads(line)
+
+    def run(self, argv: list) -> Optional[int]:
+        """Runs a command in the daemon and relays its output, returns the exit code or None without a daemon"""
+        streams = {"stdout": sys.stdout, "stderr": sys.stderr}
+        message = {
+            "action": "run",
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "env": {name: value for name, value in os.environ.items() if name.startswith("TORQUE_")},
+            "isatty": streams["stdout"].isatty(),
+        }
+        replies = self.request(message)
+        try:
+            reply = next(replies)
+        except (OSError, StopIteration, ValueError) as e:
+            # nothing was run yet, the command can still run in-process
+            logger.debug(f"Torque daemon is not available: {e}")
+            return None
+        if reply.get("busy"):
+            logger.debug("Torque daemon is busy with another command")
+            return None
+
+        try:
+            for reply in replies:
+                if "exit_code" in reply:
+                    return reply["exit_code"]
+                for name, text in reply.items():
+                    streams[name].write(text)
+                    streams[name].flush()
+        except (OSError, ValueError):
+            pass
+        streams["stderr"].write("Lost connection to the torque daemon\n")
+        return 1
+
+    def status(self) -> Optional[dict]:
+        try:
+            return next(self.request({"action": "status"}))
+        except (OSError, StopIteration, ValueError):
+            return None
+
+    def stop(self) -> bool:
+        try:
+            return bool(next(self.request({"action": "stop"})).get("ok"))
+        except (OSError, StopIteration, ValueError):
+            return False
+
+
+class _ReplyStream(io.TextIOBase):
+    """stdout/stderr of a command run by the daemon, every write is sent to the CLI right away"""
+
+    def __init__(self, handler: "DaemonRequestHandler", name: str, isatty: bool):
+        self._handler = handler
+        self._name = name
+        self._isatty = isatty
+
+    def write(self, text: str) -> int:
+        if text:
+            self._handler.reply({self._name: text})
+        return len(text)
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def isatty(self) -> bool:
+        return self._isatty
+
+
+class _CurrentStderr(object):
+    """Log handlers keep their stream, this one writes to whatever sys.stderr is when a record is logged"""
+
+    def write(self, text: str) -> None:
+        sys.stderr.write(text)
+
+    def flush(self) -> None:
+        sys.stderr.flush()
+
+
+class DaemonState(object):
+    """Warm state kept between commands: parsed config, authenticated clients and opened blueprint repos"""
+
+    def __init__(self):
+        from torque.utils import BlueprintRepoCache
+
+        self.started_at = time.time()
+        self.commands_count = 0
+        self.repo_cache = BlueprintRepoCache()
+        self._connections = {}
+        self._clients = {}
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "uptime": round(time.time() - self.started_at, 1),
+            "commands": self.commands_count,
+            "clients": len(self._clients),
+            "repos": len(self.repo_cache),
+        }
+
+    def get_connection(self, input_parser):
+        from torque.services.config import DEFAULT_CONFIG_PATH
+        from torque.services.connection import TorqueConnectionProvider
+
+        config_path = Path(input_parser.get_config_path() or DEFAULT_CONFIG_PATH).expanduser()
+        try:
+            config_mtime = config_path.stat().st_mtime
+        except OSError:
+            config_mtime = None
+
+        key = (
+            input_parser.token,
+            input_parser.space,
+            input_parser.account,
+            input_parser.profile,
+            input_parser.pool_size,
+            str(config_path),
+            config_mtime,
+        )
+        if key not in self._connections:
+            self._connections[key] = TorqueConnectionProvider(input_parser).get_connection()
+        return self._connections[key]
+
+    def get_client(self, connection, env: dict):
+        from torque.client import TorqueClient
+
+        # the environment selects the transport, hedging and rate limits of a client
+        key = (connection.account, connection.space, connection.token, connection.pool_size, tuple(sorted(env.items())))
+        if key not in self._clients:
+            self._clients[key] = TorqueClient(
+                space=connection.space,
+                token=connection.token,
+                account=connection.account,
+                pool_size=connection.pool_size,
+            )
+        return self._clients[key]
+
+    def run(self, argv: list, env: dict) -> int:
+        """Runs a command like torque.shell.main, without version check and with warm state"""
+        from torque import shell
+        from torque.parsers.docopt_cache import docopt
+        from torque.parsers.global_input_parser import GlobalInputParser
+
+        self.commands_count += 1
+        try:
+            input_parser = GlobalInputParser(docopt(shell.__doc__, argv=argv, options_first=True))
+            logging.getLogger().setLevel(logging.DEBUG if input_parser.debug else logging.WARNING)
+            shell.BootstrapHelper.validate_command(input_parser.command)
+
+            connection = client = None
+            if shell.BootstrapHelper.should_get_connection_params(input_parser):
+                connection = self.get_connection(input_parser)
+                client = self.get_client(connection, env)
+
+            command_argv = [input_parser.command] + input_parser.command_args
+            return shell.run_command(command_argv, connection, client, self.repo_cache)
+
+        except SystemExit as e:
+            return shell.get_exit_code(e)
+        except Exception:
+            sys.stderr.write(traceback.format_exc())
+            return 1
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        self._lock = threading.Lock()
+        try:
+            message = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+
+        action = message.get("action")
+        if action == "run":
+            # a long command (e.g. sb start --wait) must not hold up the others, the CLI runs them itself meanwhile
+            if not self.server.run_lock.acquire(blocking=False):
+                self.reply({"busy": True})
+                return
+            try:
+                self.reply({"started": True})
+                exit_code = self._run(message)
+            finally:
+                # released before replying, the next command of a script may be forwarded right after it
+                self.server.run_lock.release()
+            self.reply({"exit_code": exit_code})
+        elif action == "status":
+            self.reply(self.server.state.stats)
+        elif action == "stop":
+            self.reply({"ok": True})
+            # shutdown waits for serve_forever to return, it can't be called from the serving thread
+            threading.Thread(target=self.server.stop, daemon=True).start()
+
+    def reply(self, message: dict) -> None:
+        with self._lock:
+            try:
+                self.wfile.write(json.dumps(message).encode() + b"\n")
+                self.wfile.flush()
+            except OSError:
+                # the CLI went away (e.g. Ctrl+C), the command still runs to the end so temp branches are cleaned up
+                pass
+
+    def _run(self, message: dict) -> int:
+        isatty = message.get("isatty", False)
+        stdout, stderr = sys.stdout, sys.stderr
+        cwd = os.getcwd()
+        environ = dict(os.environ)
+        try:
+            # commands are run one at a time, so the process wide cwd, environment and streams can be swapped
+            os.chdir(message["cwd"])
+            for name in [name for name in os.environ if name.startswith("TORQUE_")]:
+                del os.environ[name]
+            os.environ.update(message.get("env", {}))
+            sys.stdout = _ReplyStream(self, "stdout", isatty)
+            sys.stderr = _ReplyStream(self, "stderr", isatty)
+            return self.server.state.run(message["argv"], message.get("env", {}))
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+            os.environ.clear()
+            os.environ.update(environ)
+            os.chdir(cwd)
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Runs commands forwarded by the CLI one at a time, the socket is only accessible by the current user
+
+    Commands forwarded while another one runs are answered as busy right away.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str = None, state: DaemonState = None):
+        self.socket_path = socket_path or get_socket_path()
+        self.state = state or DaemonState()
+        self.run_lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+        if os.path.exists(self.socket_path):
+            # left behind by a daemon which didn't stop cleanly
+            os.unlink(self.socket_path)
+
+        umask = os.umask(0o177)
+        try:
+            super(DaemonServer, self).__init__(self.socket_path, DaemonRequestHandler)
+        finally:
+            os.umask(umask)
+
+    def stop(self) -> None:
+        """Stops serving once the running command, if any, is finished"""
+        with self.run_lock:
+            self.shutdown()
+
+    def server_close(self):
+        super(DaemonServer, self).server_close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+def serve(socket_path: str = None) -> None:
+    logging.basicConfig(format="%(levelname)s - %(message)s", level=logging.WARNING, stream=_CurrentStderr())
+    server = DaemonServer(socket_path)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+def start_detached(socket_path: str = None) -> Optional[int]:
+    """Starts a daemon in the background and waits until it listens, returns its pid"""
+    import subprocess
+
+    socket_path = socket_path or get_socket_path()
+    subprocess.Popen(
+        [sys.executable, "-m", "torque.daemon", socket_path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        start_new_session=True,
+    )
+
+    client = DaemonClient(socket_path)
+    started_at = time.monotonic()
+    while time.monotonic() - started_at < DAEMON_START_TIMEOUT:
+        status = client.status()
+        if status:
+            return status["pid"]
+        time.sleep(0.05)
+    return None
+
+
+if __name__ == "__main__":
+    # detached daemon started by 'torque daemon start': python -m torque.daemon <socket_path>
+    serve(sys.argv[1])
@@ -0,0 +1,95 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from torque.exceptions import DeadlineExceededError
+from torque.timings import StageTimer
+
+
+class Deadline(object):
+    """End-to-end time budget of a command run shared by its git, HTTP and wait stages
+
+    Every stage gets the remaining time as its timeout. Time is attributed to the innermost running stage of a
+    thread, so waiting which makes HTTP calls is not counted twice.
+    """
+
+    def __init__(self):
+        self.budget = None
+        self.started_at = None
+        self.exceeded_stage = None
+        self._timer = StageTimer(time.monotonic)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.budget is not None
+
+    @property
+    def stages(self) -> dict:
+        return self._timer.totals
+
+    @property
+    def expired(self) -> bool:
+        return self.enabled and self.remaining() <= 0
+
+    def start(self, budget: float) -> None:
+        self.budget = budget
+        self.started_at = time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at if self.enabled else 0.0
+
+    def remaining(self, minimum: float = 0) -> Optional[float]:
+        """Seconds left in the budget or None when no deadline is set"""
+        if not self.enabled:
+            return None
+        return max(minimum, self.budget - self.elapsed())
+
+    def check(self, stage: str) -> None:
+        if self.expired:
+            self._mark_exceeded(stage)
+            raise DeadlineExceededError(f"Deadline of {self.budget:g} sec exceeded during {stage}")
+
+    def cap(self, timeout: Optional[float], stage: str) -> Optional[float]:
+        """Limits timeout to the remaining budget, raises DeadlineExceededError if nothing is left"""
+        if not self.enabled:
+            return timeout
+        self.check(stage)
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+    @contextmanager
+    def stage(self, name: str, check: bool = True):
+        """Accounts time spent in the block to the stage. With check=False the block runs even if the budget is
+        spent, which is needed for cleanup"""
+        if not self.enabled:
+            yield
+            return
+
+        if check:
+            self.check(name)
+
+        try:
+            with self._timer.stage(name):
+                yield
+        finally:
+            if check and self.expired:
+                self._mark_exceeded(name)
+
+    def format_report(self) -> str:
+        lines = [f"Deadline of {self.budget:g} sec exceeded during {self.exceeded_stage}. Time spent per stage:"]
+        stages = self._timer.items()
+        other = self.elapsed() - sum(spent for _, spent in stages)
+        for name, spent in stages + [("other", max(0.0, other))]:
+            lines.append(f"  {name:<6} {spent:8.2f} sec")
+        return "\n".join(lines)
+
+    def _mark_exceeded(self, stage: str) -> None:
+        with self._lock:
+            if self.exceeded_stage is None:
+                self.exceeded_stage = stage
+
+
+# process wide deadline, started with the --deadline option
+deadline = Deadline()
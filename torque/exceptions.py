@@ -12,3 +12,38 @@ class ConfigFileMissingError(ConfigError):
 
 class BadBlueprintRepo(Exception):
     pass
+
+
+class DeadlineExceededError(Exception):
+    pass
+
+
+class CassetteMismatchError(Exception):
+    pass
+
+
+class TorqueApiError(Exception):
+    def __init__(self, message: str, status_code: int = None, response=None):
+        super(TorqueApiError, self).__init__(message)
+        self.status_code = status_code
+        self.response = response
+
+
+class NotFoundError(TorqueApiError):
+    pass
+
+
+class BlueprintValidationError(Exception):
+    def __init__(self, message: str, errors: list = None):
+        super(BlueprintValidationError, self).__init__(message)
+        self.errors = errors or []
+
+
+class SandboxLaunchError(Exception):
+    def __init__(self, message: str, sandbox=None):
+        super(SandboxLaunchError, self).__init__(message)
+        self.sandbox = sandbox
+
+
+class WaitTimeoutError(Exception):
+    pass
@@ -0,0 +1,120 @@
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Callable
+
+from requests import Response
+
+from torque.constants import (
+    DEFAULT_HEDGE_INITIAL_DELAY,
+    DEFAULT_HEDGE_MAX_EXTRA_LOAD,
+    DEFAULT_HEDGE_MIN_DELAY,
+    DEFAULT_HEDGE_PERCENTILE,
+)
+from torque.timings import percentile
+
+
+class HedgingPolicy(object):
+    """Sends a second identical GET when the first one is slower than the observed latency percentile
+
+    Whichever response arrives first is used. Hedges are limited to max_extra_load of all hedged calls so a slow
+    backend is not overloaded further.
+    """
+
+    MIN_SAMPLES = 20
+
+    def __init__(
+        self,
+        percent: float = DEFAULT_HEDGE_PERCENTILE,
+        max_extra_load: float = DEFAULT_HEDGE_MAX_EXTRA_LOAD,
+        initial_delay: float = DEFAULT_HEDGE_INITIAL_DELAY,
+        min_delay: float = DEFAULT_HEDGE_MIN_DELAY,
+        window: int = 200,
+    ):
+        self.percent = percent
+        self.max_extra_load = max_extra_load
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.requests = 0
+        self.hedges = 0
+        self.hits = 0
+        self.wasted = 0
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> dict:
+        return {"requests": self.requests, "hedges": self.hedges, "hits": self.hits, "wasted": self.wasted}
+
+    def get_delay(self) -> float:
+        with self._lock:
+            if len(self._latencies) < self.MIN_SAMPLES:
+                return self.initial_delay
+            return max(self.min_delay, percentile(list(self._latencies), self.percent))
+
+    def record_latency(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def acquire_hedge(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.requests * self.max_extra_load:
+                return False
+            self.hedges += 1
+            return True
+
+    def execute(self, send: Callable[[], Response]) -> Response:
+        """Calls send, and once more in parallel if the first call does not complete within the hedge delay"""
+        with self._lock:
+            self.requests += 1
+
+        primary = _submit(send)
+        done, _ = wait([primary], timeout=self.get_delay())
+        if done or not self.acquire_hedge():
+            return self._result(primary)
+
+        hedge = _submit(send)
+        pending = {primary, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((f for f in done if f.exception() is None), None)
+            if winner is not None or not pending:
+                break
+
+        with self._lock:
+            if winner is hedge:
+                self.hits += 1
+            else:
+                self.wasted += 1
+
+        for future in {primary, hedge} - {winner}:
+            future.add_done_callback(_close_response)
+
+        if winner is None:
+            # both attempts failed, report the error of the original request
+            return self._result(primary)
+        return self._result(winner)
+
+    def _result(self, future: Future) -> Response:
+        response = future.result()
+        self.record_latency(response.elapsed.total_seconds())
+        return response
+
+
+def _submit(fn: Callable[[], Response]) -> Future:
+    # daemon threads: a stalled request that lost the race must not block the CLI from exiting
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _close_response(future: Future) -> None:
+    if future.exception() is None:
+        future.result().close()
@@ -0,0 +1,91 @@
+import copy
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Hashable
+
+from torque.constants import DEFAULT_MEMO_TTL
+
+
+class RequestMemo(object):
+    """Request-scoped memo of GET results
+
+    Identical calls in flight at the same time share one network request, and results are reused for ttl seconds.
+    Callers making mutating requests must invalidate the affected keys.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_MEMO_TTL):
+        self.ttl = ttl
+        self.calls = 0
+        self.hits = 0
+        self.coalesced = 0
+        self._results = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> dict:
+        return {"calls": self.calls, "hits": self.hits, "coalesced": self.coalesced}
+
+    @staticmethod
+    def make_key(url: str, params: dict = None, headers: dict = None) -> tuple:
+        return url, tuple(sorted((params or {}).items())), tuple(sorted((headers or {}).items()))
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable):
+        with self._lock:
+            self.calls += 1
+            cached = self._results.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self.hits += 1
+                return copy.deepcopy(cached[1])
+
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            # waiters are released first, they must never be left blocked on the future
+            future.set_exception(e)
+            with self._lock:
+                self._release(key, future)
+            raise
+
+        with self._lock:
+            # a key invalidated while the request was in flight must not be filled with a possibly stale result
+            if self._release(key, future):
+                self._results[key] = (time.monotonic() + self.ttl, result)
+        future.set_result(result)
+        return copy.deepcopy(result)
+
+    def _release(self, key: Hashable, future: Future) -> bool:
+        """Removes the in flight future of the key, unless it was invalidated and another request started since"""
+        if self._in_flight.get(key) is not future:
+            return False
+        del self._in_flight[key]
+        return True
+
+    def invalidate(self, url: str) -> None:
+        """Drops results of the url and of all urls below it"""
+        with self._lock:
+            keys = {key for key in list(self._results) + list(self._in_flight) if _url_matches(key[0], url)}
+            for key in keys:
+                self._results.pop(key, None)
+                self._in_flight.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self._in_flight.clear()
+
+
+def _url_matches(key_url: str, url: str) -> bool:
+    url = url.rstrip("/")
+    return key_url == url or key_url.startswith(url + "/")
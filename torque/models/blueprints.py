@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, Iterator, List
 
 from torque.base import Resource, ResourceManager
 
@@ -51,6 +51,11 @@ class BlueprintsManager(ResourceManager):
         result_json = self._list(path=url)
         return [self.resource_obj.json_deserialize(self, obj) for obj in result_json]
 
+    def iter_blueprints(self) -> Iterator[Blueprint]:
+        url = "blueprints"
+        for obj in self._iter_list(path=url):
+            yield self.resource_obj.json_deserialize(self, obj)
+
     def list_detailed(self) -> Any:
         url = "blueprints"
         result_json = self._list(path=url)
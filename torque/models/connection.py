@@ -1,5 +1,6 @@
 class TorqueConnection(object):
-    def __init__(self, space: str, token: str, account: str):
+    def __init__(self, space: str, token: str, account: str, pool_size: int = None):
         self.space = space
         self.token = token
         self.account = account
+        self.pool_size = pool_size
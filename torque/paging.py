@@ -0,0 +1,84 @@
+import queue
+import threading
+from typing import Callable, Iterator, List
+
+from torque.constants import DEFAULT_PAGE_SIZE, DEFAULT_PREFETCH_PAGES
+
+_END = object()
+
+
+class PrefetchingPager(object):
+    """Lazily walks paged results while fetching the next pages on a background thread
+
+    fetch_page(offset, limit) must return a list of items, a page shorter than page_size is the last one.
+    Up to `prefetch` pages are fetched ahead of the consumer; prefetch=0 fetches pages synchronously.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int, int], List],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = DEFAULT_PREFETCH_PAGES,
+    ):
+        if page_size <= 0:
+            raise ValueError("Page size must be positive")
+        if prefetch < 0:
+            raise ValueError("Prefetch depth can't be negative")
+
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.prefetch = prefetch
+
+    def __iter__(self) -> Iterator:
+        if self.prefetch == 0:
+            return self._iter_sync()
+        return self._iter_prefetched()
+
+    def _iter_pages(self, stop: threading.Event = None) -> Iterator[List]:
+        offset = 0
+        while stop is None or not stop.is_set():
+            page = self.fetch_page(offset, self.page_size)
+            if page:
+                yield page
+            if len(page) < self.page_size:
+                return
+            offset += len(page)
+
+    def _iter_sync(self) -> Iterator:
+        for page in self._iter_pages():
+            yield from page
+
+    def _iter_prefetched(self) -> Iterator:
+        pages = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for page in self._iter_pages(stop):
+                    self._put(pages, page, stop)
+                self._put(pages, _END, stop)
+            except Exception as e:
+                self._put(pages, e, stop)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            while True:
+                page = pages.get()
+                if page is _END:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                yield from page
+        finally:
+            # consumer is done or stopped early, let the producer exit without fetching more pages
+            stop.set()
+
+    @staticmethod
+    def _put(pages: queue.Queue, item, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
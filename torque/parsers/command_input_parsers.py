@@ -1,8 +1,12 @@
 from abc import ABC
-from typing import Dict
+from typing import Dict, List
 
-from torque.parsers.command_input_validators import SandboxListValidator, SandboxStartInputValidator
-from torque.utils import parse_comma_separated_string
+from torque.constants import DEFAULT_END_JOBS, DEFAULT_PAGE_SIZE, DEFAULT_PREFETCH_PAGES
+from torque.parsers.command_input_validators import (
+    CommandInputValidator,
+    SandboxListValidator,
+    SandboxStartInputValidator,
+)
 
 
 class CommandInputParser:
@@ -19,6 +23,7 @@ class CommandInputParser:
         self.blueprint_validate = BlueprintValidateInputParser(command_args)
         self.configure_set = ConfigureSetInputParser(command_args)
         self.configure_remove = ConfigureRemoveInputParser(command_args)
+        self.batch = BatchInputParser(command_args)
 
 
 class InputParserBase(ABC):
@@ -84,8 +89,29 @@ class BlueprintValidateInputParser(InputParserBase):
 
 class SandboxEndInputParser(InputParserBase):
     @property
-    def sandbox_id(self) -> str:
-        return self._args["<sandbox_id>"]
+    def sandbox_ids(self) -> List[str]:
+        return self._args.get("<sandbox_ids>") or []
+
+    @property
+    def filter(self) -> str:
+        list_filter = self._args.get("--filter")
+        if list_filter:
+            SandboxListValidator.validate_filter(list_filter)
+        return list_filter
+
+    @property
+    def jobs(self) -> int:
+        jobs = self._args.get("--jobs")
+        CommandInputValidator.validate_jobs(jobs)
+        return int(jobs) if jobs is not None else DEFAULT_END_JOBS
+
+    @property
+    def verify(self) -> bool:
+        return not self._args.get("--no-verify")
+
+    @property
+    def confirmed(self) -> bool:
+        return self._args.get("--yes", False)
 
 
 class SandboxStatusInputParser(InputParserBase):
@@ -108,8 +134,22 @@ class SandboxListInputParser(InputParserBase):
         return self._args["--show-ended"]
 
     @property
-    def count(self) -> int:
-        return self._args.get("--count", 25)
+    def count(self):
+        count = self._args.get("--count", 25)
+        SandboxListValidator.validate_count(count)
+        return count
+
+    @property
+    def page_size(self) -> int:
+        page_size = self._args.get("--page-size")
+        SandboxListValidator.validate_page_size(page_size)
+        return int(page_size) if page_size is not None else DEFAULT_PAGE_SIZE
+
+    @property
+    def prefetch(self) -> int:
+        prefetch = self._args.get("--prefetch")
+        SandboxListValidator.validate_prefetch(prefetch)
+        return int(prefetch) if prefetch is not None else DEFAULT_PREFETCH_PAGES
 
     # @property
     # def sandbox_id(self) -> str:
@@ -151,8 +191,25 @@ class SandboxStartInputParser(InputParserBase):
 
     @property
     def inputs(self) -> dict:
+        # torque.utils imports git and yaml
+        from torque.utils import parse_comma_separated_string
+
         return parse_comma_separated_string(self._args["--inputs"])
 
     @property
     def artifacts(self) -> dict:
+        from torque.utils import parse_comma_separated_string
+
         return parse_comma_separated_string(self._args["--artifacts"])
+
+
+class BatchInputParser(InputParserBase):
+    @property
+    def path(self) -> str:
+        return self._args["<file>"]
+
+    @property
+    def jobs(self) -> int:
+        jobs = self._args.get("--jobs")
+        CommandInputValidator.validate_jobs(jobs)
+        return int(jobs) if jobs is not None else 1
@@ -8,6 +8,51 @@ class CommandInputValidator:
         if commit and branch is None:
             raise DocoptExit("Since commit is specified, branch is required")
 
+    @staticmethod
+    def validate_jobs(jobs: str):
+        if jobs is not None:
+            try:
+                jobs = int(jobs)
+            except ValueError:
+                raise DocoptExit("Jobs must be a number")
+
+            if jobs <= 0:
+                raise DocoptExit("Jobs must be positive")
+
+
+class GlobalInputValidator:
+    @staticmethod
+    def validate_pool_size(pool_size: str):
+        if pool_size is not None:
+            try:
+                pool_size = int(pool_size)
+            except ValueError:
+                raise DocoptExit("Pool size must be a number")
+
+            if pool_size <= 0:
+                raise DocoptExit("Pool size must be positive")
+
+    @staticmethod
+    def validate_deadline(deadline: str):
+        if deadline is not None:
+            try:
+                deadline = float(deadline)
+            except ValueError:
+                raise DocoptExit("Deadline must be a number of seconds")
+
+            if deadline <= 0:
+                raise DocoptExit("Deadline must be positive")
+
+    @staticmethod
+    def validate_profiler(mode: str):
+        if mode is not None and mode not in ["cpu", "startup"]:
+            raise DocoptExit("--profiler value must be in [cpu, startup]")
+
+    @staticmethod
+    def validate_response_cache(value: str):
+        if value and value not in ["memory", "disk"]:
+            raise DocoptExit("TORQUE_RESPONSE_CACHE value must be in [memory, disk]")
+
 
 class SandboxListValidator:
     @staticmethod
@@ -15,6 +60,39 @@ class SandboxListValidator:
         if value not in ["my", "all", "auto"]:
             raise DocoptExit("--filter value must be in [my, all, auto]")
 
+    @staticmethod
+    def validate_count(count: str):
+        if count is not None and count != "all":
+            try:
+                count = int(count)
+            except ValueError:
+                raise DocoptExit("Count must be a number or 'all'")
+
+            if count <= 0:
+                raise DocoptExit("Count must be positive")
+
+    @staticmethod
+    def validate_page_size(page_size: str):
+        if page_size is not None:
+            try:
+                page_size = int(page_size)
+            except ValueError:
+                raise DocoptExit("Page size must be a number")
+
+            if page_size <= 0:
+                raise DocoptExit("Page size must be positive")
+
+    @staticmethod
+    def validate_prefetch(prefetch: str):
+        if prefetch is not None:
+            try:
+                prefetch = int(prefetch)
+            except ValueError:
+                raise DocoptExit("Prefetch must be a number")
+
+            if prefetch < 0:
+                raise DocoptExit("Prefetch can't be negative")
+
 
 class SandboxStartInputValidator:
     @staticmethod
@@ -0,0 +1,131 @@
+import copy
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import threading
+from pathlib import Path
+
+import docopt as docopt_module
+from docopt import AnyOptions, DocoptExit, Option, TokenStream
+
+logger = logging.getLogger(__name__)
+
+# pickled grammars are kept next to the package like bytecode, commands still work when it is read-only
+DEFAULT_GRAMMAR_CACHE_DIR = Path(__file__).parent / "__pycache__"
+
+
+class UsageGrammar(object):
+    """Usage section, options and matching pattern docopt builds from a docstring"""
+
+    def __init__(self, doc: str):
+        self.usage = docopt_module.printable_usage(doc)
+        self.options = docopt_module.parse_defaults(doc)
+        pattern = docopt_module.parse_pattern(docopt_module.formal_usage(self.usage), self.options)
+        pattern_options = set(pattern.flat(Option))
+        for any_options in pattern.flat(AnyOptions):
+            any_options.children = list(set(self.options) - pattern_options)
+        self.pattern = pattern.fix()
+
+
+class GrammarCache(object):
+    """Builds docopt grammars once per docstring and keeps them in memory and pickled on disk
+
+    Building the pattern of a long usage text takes milliseconds, loading the pickle a fraction of that. Entries are
+    keyed by a hash of the docstring and the docopt version, a changed usage text gets a new entry.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_GRAMMAR_CACHE_DIR):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._grammars = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(doc: str) -> str:
+        source = f"{docopt_module.__version__}\n{doc}"
+        return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+    def get(self, doc: str) -> UsageGrammar:
+        key = self.make_key(doc)
+        with self._lock:
+            grammar = self._grammars.get(key)
+        if grammar is not None:
+            return grammar
+
+        grammar = self._read_from_disk(key)
+        if grammar is None:
+            grammar = UsageGrammar(doc)
+            self._write_to_disk(key, grammar)
+
+        with self._lock:
+            self._grammars[key] = grammar
+        return grammar
+
+    def _get_path(self, key: str) -> Path:
+        return self.cache_dir / f"docopt-{key}.pickle"
+
+    def _read_from_disk(self, key: str):
+        if not self.cache_dir:
+            return None
+
+        try:
+            with open(self._get_path(key), "rb") as cache_file:
+                grammar = pickle.load(cache_file)
+            return grammar if isinstance(grammar, UsageGrammar) else None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Unable to read cached usage grammar. Details: {e}")
+            return None
+
+    def _write_to_disk(self, key: str, grammar: UsageGrammar) -> None:
+        if not self.cache_dir:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._get_path(key)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as cache_file:
+                pickle.dump(grammar, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Unable to write cached usage grammar. Details: {e}")
+
+
+class ThreadUsage(object):
+    """DocoptExit.usage kept per thread, so commands parsed at the same time (torque batch --jobs) and their input
+    validators report their own usage"""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def __get__(self, instance, owner) -> str:
+        return getattr(self._local, "usage", "")
+
+    def set(self, usage: str) -> None:
+        self._local.usage = usage
+
+
+grammar_cache = GrammarCache()
+thread_usage = ThreadUsage()
+
+
+def docopt(doc: str, argv: list = None, help: bool = True, version: str = None, options_first: bool = False):
+    """Drop-in replacement of docopt.docopt which takes the parsed usage grammar from grammar_cache"""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    grammar = grammar_cache.get(doc)
+    # docopt.docopt sets a plain class attribute shared by all threads
+    DocoptExit.usage = thread_usage
+    thread_usage.set(grammar.usage)
+    argv = docopt_module.parse_argv(TokenStream(argv, DocoptExit), list(grammar.options), options_first)
+    docopt_module.extras(help, version, argv, doc)
+
+    matched, left, collected = grammar.pattern.match(argv)
+    if matched and left == []:
+        # defaults (e.g. [] of repeated arguments) belong to the cached pattern, callers get their own copies
+        return docopt_module.Dict((a.name, copy.deepcopy(a.value)) for a in (grammar.pattern.flat() + collected))
+    raise DocoptExit()
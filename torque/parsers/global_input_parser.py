@@ -1,6 +1,8 @@
 import os
 from typing import Dict, List
 
+from torque.parsers.command_input_validators import GlobalInputValidator
+
 
 class GlobalInputParser:
     def __init__(self, command_args: Dict):
@@ -34,6 +36,40 @@ class GlobalInputParser:
     def disable_version_check(self) -> str:
         return self._args.get("--disable-version-check", None)
 
+    @property
+    def timings(self) -> bool:
+        return self._args.get("--timings", None)
+
+    @property
+    def pool_size(self) -> int:
+        pool_size = self._args.get("--pool-size", None) or os.environ.get("TORQUE_POOL_SIZE", None)
+        GlobalInputValidator.validate_pool_size(pool_size)
+        return int(pool_size) if pool_size is not None else pool_size
+
+    @property
+    def deadline(self) -> float:
+        deadline = self._args.get("--deadline", None)
+        GlobalInputValidator.validate_deadline(deadline)
+        return float(deadline) if deadline is not None else deadline
+
+    @property
+    def profiler(self) -> str:
+        profiler = self._args.get("--profiler", None)
+        if profiler is None and self.profiler_summary:
+            profiler = "cpu"
+        GlobalInputValidator.validate_profiler(profiler)
+        return profiler
+
+    @property
+    def profiler_summary(self) -> bool:
+        return self._args.get("--profiler-summary", None)
+
+    @property
+    def response_cache(self) -> str:
+        response_cache = os.environ.get("TORQUE_RESPONSE_CACHE", None)
+        GlobalInputValidator.validate_response_cache(response_cache)
+        return response_cache
+
     @property
     def command(self) -> str:
         return self._args.get("<command>", None)
@@ -0,0 +1,96 @@
+import io
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from torque.timings import StageTimer
+
+DEFAULT_PROFILE_DIR = "~/.torque/profiles"
+SUMMARY_TOP_FUNCTIONS = 15
+
+
+class Profiler(object):
+    """Wall-clock phase breakdown and cProfile statistics of a command run
+
+    In "cpu" mode the whole run is profiled, in "startup" mode only the work done before the command starts
+    executing (imports, version check, config load, argument parsing). Phases are timed in both modes, time is
+    attributed to the innermost running phase of a thread (see StageTimer).
+    """
+
+    MODES = ("cpu", "startup")
+
+    def __init__(self):
+        self.mode = None
+        self.started_at = None
+        self.finished_at = None
+        self._profile = None
+        self._timer = StageTimer(time.perf_counter)
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode is not None
+
+    @property
+    def phases(self) -> dict:
+        return self._timer.totals
+
+    def start(self, mode: str) -> None:
+        import cProfile
+
+        self.mode = mode
+        self.started_at = time.perf_counter()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def startup_finished(self) -> None:
+        if self.mode == "startup":
+            self._profile.disable()
+
+    def stop(self) -> None:
+        if self.finished_at is None:
+            self._profile.disable()
+            self.finished_at = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+
+        with self._timer.stage(name):
+            yield
+
+    def save(self, directory: str = DEFAULT_PROFILE_DIR) -> str:
+        """Writes <path>.pstats and <path>.phases.txt and returns the path prefix"""
+        profile_dir = Path(directory).expanduser()
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        prefix = str(profile_dir / f"torque-{self.mode}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}")
+
+        self._profile.dump_stats(f"{prefix}.pstats")
+        with open(f"{prefix}.phases.txt", "w") as phases_file:
+            phases_file.write(self.format_phases() + "\n")
+        return prefix
+
+    def format_phases(self) -> str:
+        total = (self.finished_at or time.perf_counter()) - self.started_at
+        phases = self._timer.items()
+        other = max(0.0, total - sum(spent for _, spent in phases))
+
+        lines = ["Time spent per phase:"]
+        for name, spent in phases + [("other", other)]:
+            lines.append(f"  {name:<13} {spent:8.3f} sec")
+        lines.append(f"  {'total':<13} {total:8.3f} sec")
+        return "\n".join(lines)
+
+    def format_summary(self, limit: int = SUMMARY_TOP_FUNCTIONS) -> str:
+        import pstats
+
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.sort_stats("cumulative").print_stats(limit)
+        return f"{self.format_phases()}\n\nTop {limit} functions by cumulative time:\n{stream.getvalue().strip()}"
+
+
+# process wide profiler, started with the --profiler option
+profiler = Profiler()
@@ -0,0 +1,69 @@
+import email.utils
+import random
+import time
+
+from requests import ConnectionError, ConnectTimeout, Response, Timeout
+
+from torque.constants import DEFAULT_BACKOFF_BASE, DEFAULT_BACKOFF_MAX, DEFAULT_MAX_RETRIES
+
+
+class RetryPolicy(object):
+    """Decides whether a failed request can be safely retried and how long to wait before the next attempt"""
+
+    RETRY_STATUSES = (429, 502, 503, 504)
+    IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE")
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def should_retry(self, method: str, attempt: int, status_code: int = None, error: Exception = None) -> bool:
+        if attempt >= self.max_retries:
+            return False
+
+        idempotent = method in self.IDEMPOTENT_METHODS
+
+        if error is not None:
+            # a connect timeout means the request never reached the server, so even POST is safe to resend
+            if isinstance(error, ConnectTimeout):
+                return True
+            return idempotent and isinstance(error, (ConnectionError, Timeout))
+
+        # 429 means the server rejected the request without processing it
+        if status_code == 429:
+            return True
+
+        return idempotent and status_code in self.RETRY_STATUSES
+
+    def get_delay(self, attempt: int, response: Response = None) -> float:
+        if response is not None:
+            retry_after = self.parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+
+        # exponential backoff with "full jitter"
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    @staticmethod
+    def parse_retry_after(value: str):
+        """Retry-After is either a number of seconds or an HTTP-date"""
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        return max(0.0, retry_date.timestamp() - time.time())
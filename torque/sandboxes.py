@@ -1,7 +1,11 @@
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
 from urllib.parse import urlparse
 
 from .base import Resource, ResourceManager
+from .constants import DEFAULT_END_JOBS, DEFAULT_PAGE_SIZE, DEFAULT_PREFETCH_PAGES
+from .paging import PrefetchingPager
 
 
 class Sandbox(Resource):
@@ -40,15 +44,49 @@ class Sandbox(Resource):
         return self.json_serialize()
 
 
+class SandboxEndResult(object):
+    def __init__(self, sandbox_id: str, latency: float, error: str = None):
+        self.sandbox_id = sandbox_id
+        self.latency = latency
+        self.error = error
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    def json_serialize(self) -> dict:
+        return {
+            "id": self.sandbox_id,
+            "success": self.success,
+            "latency": round(self.latency, 3),
+            "error": self.error,
+        }
+
+    def table_serialize(self) -> dict:
+        return {
+            "id": self.sandbox_id,
+            "result": "Ended" if self.success else "Failed",
+            "latency": f"{self.latency:.2f} sec",
+            "error": self.error or "",
+        }
+
+
 class SandboxesManager(ResourceManager):
     resource_obj = Sandbox
     SANDBOXES_PATH = "sandbox"
     SPECIFIC_SANDBOX_PATH = "sandboxes"
 
+    def __init__(self, *args, **kwargs):
+        super(SandboxesManager, self).__init__(*args, **kwargs)
+        self._ui_links = {}
+
     def get_sandbox_url(self, sandbox_id: str) -> str:
         return self._get_full_url(f"{self.SPECIFIC_SANDBOX_PATH}/{sandbox_id}")
 
     def get_sandbox_ui_link(self, sandbox_id: str) -> str:
+        if sandbox_id in self._ui_links:
+            return self._ui_links[sandbox_id]
+
         url = urlparse(self.get_sandbox_url(sandbox_id))
         space = url.path.split("/")[3]
         if self.client.account:
@@ -56,10 +94,14 @@ class SandboxesManager(ResourceManager):
         else:
             ui_url = f"https://[YOUR_ACCOUNT].{url.hostname}/{space}/{self.SPECIFIC_SANDBOX_PATH}/{sandbox_id}"
 
+        self._ui_links[sandbox_id] = ui_url
         return ui_url
 
-    def get(self, sandbox_id: str) -> Sandbox:
+    def get(self, sandbox_id: str, refresh: bool = False) -> Sandbox:
+        """Gets sandbox, a result fetched shortly before is reused unless refresh is set"""
         url = f"{self.SANDBOXES_PATH}/{sandbox_id}"
+        if refresh:
+            self.memo.invalidate(self._get_full_url(url))
         sb_json = self._get(url)
 
         return self.resource_obj.json_deserialize(self, sb_json)
@@ -77,6 +119,29 @@ class SandboxesManager(ResourceManager):
 
         return [self.resource_obj.json_deserialize(self, obj) for obj in list_json]
 
+    def list_page(self, offset: int, count: int, filter_opt: str = "my") -> List[Sandbox]:
+        filter_params = {"count": count, "skip": offset, "filter": filter_opt}
+        list_json = self._list(path=self.SANDBOXES_PATH, filter_params=filter_params)
+
+        return [self.resource_obj.json_deserialize(self, obj) for obj in list_json]
+
+    def paginate(
+        self,
+        filter_opt: str = "my",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = DEFAULT_PREFETCH_PAGES,
+    ) -> Iterator[Sandbox]:
+        """Walks the full sandbox history page by page, fetching the next pages in the background"""
+        pager = PrefetchingPager(
+            lambda offset, count: self.list_page(offset, count, filter_opt), page_size=page_size, prefetch=prefetch
+        )
+        return iter(pager)
+
+    def iter_sandboxes(self, count: int = 25, filter_opt: str = "my") -> Iterator[Sandbox]:
+        filter_params = {"count": count, "filter": filter_opt}
+        for obj in self._iter_list(path=self.SANDBOXES_PATH, filter_params=filter_params):
+            yield self.resource_obj.json_deserialize(self, obj)
+
     def start(
         self,
         sandbox_name: str,
@@ -112,13 +177,31 @@ class SandboxesManager(ResourceManager):
         sandbox_id = result_json["id"]
         return sandbox_id
 
-    def end(self, sandbox_id: str):
+    def end(self, sandbox_id: str, verify: bool = True):
+        """Ends sandbox, verify checks that it exists first to report a clear error (one more request)"""
         url = f"{self.SANDBOXES_PATH}/{sandbox_id}"
 
-        try:
-            self.get(sandbox_id)
+        if verify:
+            try:
+                self.get(sandbox_id)
 
-        except Exception as e:
-            raise NotImplementedError(f"Unable to end sandbox with ID: {sandbox_id}. Details: {e}")
+            except Exception as e:
+                raise NotImplementedError(f"Unable to end sandbox with ID: {sandbox_id}. Details: {e}")
 
         self._delete(url)
+
+    def end_many(
+        self, sandbox_ids: List[str], jobs: int = DEFAULT_END_JOBS, verify: bool = True
+    ) -> Iterator[SandboxEndResult]:
+        """Ends sandboxes on up to jobs threads sharing the client, yields their results in sandbox_ids order"""
+
+        def end(sandbox_id: str) -> SandboxEndResult:
+            started_at = time.perf_counter()
+            try:
+                self.end(sandbox_id, verify=verify)
+            except Exception as e:
+                return SandboxEndResult(sandbox_id, time.perf_counter() - started_at, str(e) or e.__class__.__name__)
+            return SandboxEndResult(sandbox_id, time.perf_counter() - started_at)
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            yield from executor.map(end, sandbox_ids)
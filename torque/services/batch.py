@@ -0,0 +1,155 @@
+import io
+import logging
+import re
+import shlex
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Tuple
+
+# actions working on the local git repo (temp branches), they run one at a time
+REPO_ACTIONS = ["start", "validate"]
+
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def parse_script(text: str) -> List[Tuple[int, List[str]]]:
+    """Returns (line number, argv) of every command in a script
+
+    A script has one command per line, blank lines and lines starting with # are skipped. It can also be a YAML list
+    of commands, each one a string or a list of arguments, then the line number is the position in the list.
+    A leading 'torque' is dropped, so lines of existing shell scripts can be used as they are.
+    """
+    lines = [line.strip() for line in text.splitlines()]
+    content = [line for line in lines if line and not line.startswith("#")]
+
+    if content and content[0].startswith("- "):
+        import yaml
+
+        items = yaml.safe_load(text) or []
+        if not isinstance(items, list):
+            raise ValueError("YAML batch file must be a list of commands")
+        entries = [(number, item) for number, item in enumerate(items, start=1)]
+    else:
+        entries = [(number, line) for number, line in enumerate(lines, start=1) if line and not line.startswith("#")]
+
+    commands = []
+    for number, item in entries:
+        argv = [str(arg) for arg in item] if isinstance(item, list) else shlex.split(str(item))
+        if argv and argv[0] == "torque":
+            argv = argv[1:]
+        if argv:
+            commands.append((number, argv))
+    return commands
+
+
+class ThreadOutput(io.TextIOBase):
+    """Replaces sys.stdout/sys.stderr while a batch runs, every job thread writes to its own buffer
+
+    Threads without a buffer (e.g. a spinner) write to fallback, so the results stream stays clean.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self) -> None:
+        self._local.buffer = io.StringIO()
+
+    def release(self) -> str:
+        buffer = self._local.__dict__.pop("buffer", None)
+        return _ANSI_ESCAPE.sub("", buffer.getvalue()) if buffer else ""
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._fallback).write(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, "buffer", None) is None:
+            self._fallback.flush()
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def isatty(self) -> bool:
+        return False
+
+
+class BatchRunner(object):
+    """Runs the commands of a script with a shared client and repo cache, up to jobs commands at a time"""
+
+    def __init__(self, commands: dict, client, repo_cache, jobs: int = 1):
+        self.commands = commands
+        self.client = client
+        self.repo_cache = repo_cache
+        self.jobs = jobs
+        self._repo_lock = threading.Lock()
+        self._stdout = None
+        self._stderr = None
+
+    def run(self, script: List[Tuple[int, List[str]]]) -> Iterator[dict]:
+        """Yields the result of every command in script order, as soon as it and the commands before it finished
+
+        sys.stdout and sys.stderr are captured until the generator is exhausted, results have to be written to the
+        streams taken before.
+        """
+        stdout, stderr = sys.stdout, sys.stderr
+        self._stdout, self._stderr = ThreadOutput(stderr), ThreadOutput(stderr)
+        handlers = self._redirect_log_handlers(stderr, self._stderr)
+        sys.stdout, sys.stderr = self._stdout, self._stderr
+        try:
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                futures = [executor.submit(self.run_command, number, argv) for number, argv in script]
+                for future in futures:
+                    yield future.result()
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+            for handler in handlers:
+                handler.stream = stderr
+
+    def run_command(self, number: int, argv: List[str]) -> dict:
+        self._stdout.capture()
+        self._stderr.capture()
+        started_at = time.monotonic()
+        try:
+            exit_code = self._execute(argv)
+        except Exception:
+            sys.stderr.write(traceback.format_exc())
+            exit_code = 1
+
+        return {
+            "line": number,
+            "command": " ".join(shlex.quote(arg) for arg in argv),
+            "success": exit_code == 0,
+            "exit_code": exit_code,
+            "duration": round(time.monotonic() - started_at, 3),
+            "stdout": self._stdout.release(),
+            "stderr": self._stderr.release(),
+        }
+
+    def _execute(self, argv: List[str]) -> int:
+        from torque import shell
+
+        if argv[0] not in self.commands:
+            sys.stderr.write(f"Invalid or unknown command '{argv[0]}'\n")
+            return 1
+
+        if len(argv) > 1 and argv[1] in REPO_ACTIONS:
+            with self._repo_lock:
+                return shell.run_command(argv, client=self.client, repo_cache=self.repo_cache)
+        return shell.run_command(argv, client=self.client, repo_cache=self.repo_cache)
+
+    @staticmethod
+    def _redirect_log_handlers(stream, capture: ThreadOutput) -> list:
+        """Logged errors of a command belong to its result, log handlers keep the stream they were created with"""
+        handlers = [
+            handler
+            for handler in logging.getLogger().handlers
+            if isinstance(handler, logging.StreamHandler) and handler.stream is stream
+        ]
+        for handler in handlers:
+            handler.stream = capture
+        return handlers
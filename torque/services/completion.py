@@ -0,0 +1,123 @@
+import logging
+import re
+import threading
+from typing import Dict, List
+
+from torque.parsers.docopt_cache import grammar_cache
+
+logger = logging.getLogger(__name__)
+
+# seconds between refreshes of sandbox ids and blueprint names
+COMPLETION_REFRESH_INTERVAL = 30
+COMPLETION_SANDBOXES_COUNT = 100
+# actions whose first argument is a sandbox id or a blueprint name
+SANDBOX_ID_ACTIONS = ["status", "get"]
+BLUEPRINT_NAME_ACTIONS = ["start", "validate"]
+# actions taking any number of sandbox ids
+MULTIPLE_SANDBOX_IDS_ACTIONS = ["end"]
+ACTION_PATTERN = re.compile(r"^[a-z][a-z_-]*$")
+
+
+class CompletionCache(object):
+    """Sandbox ids and blueprint names for tab completion, refreshed by a background thread
+
+    Completion never waits for the API, it uses whatever was fetched last.
+    """
+
+    def __init__(self, client, interval: float = COMPLETION_REFRESH_INTERVAL):
+        self.client = client
+        self.interval = interval
+        self.sandbox_ids = []
+        self.blueprint_names = []
+        self._refresh_requested = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._refresh_requested.set()
+
+    def request_refresh(self) -> None:
+        """Refreshes right away instead of at the next interval, e.g. after a sandbox was started or ended"""
+        self._refresh_requested.set()
+
+    def refresh(self) -> None:
+        from torque.models.blueprints import BlueprintsManager
+        from torque.sandboxes import SandboxesManager
+
+        try:
+            sandboxes = SandboxesManager(self.client).list(count=COMPLETION_SANDBOXES_COUNT)
+            self.sandbox_ids = [sandbox.sandbox_id for sandbox in sandboxes]
+            self.blueprint_names = [blueprint.name for blueprint in BlueprintsManager(self.client).list()]
+        except Exception as e:
+            logger.debug(f"Unable to refresh completions. Details: {e}")
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self.refresh()
+            self._refresh_requested.wait(self.interval)
+            self._refresh_requested.clear()
+
+
+class ReplCompleter(object):
+    """readline completer of command names, their actions and sandbox ids or blueprint names"""
+
+    def __init__(self, commands: Dict[str, type], cache: CompletionCache, builtins: List[str] = None):
+        self.commands = commands
+        self.cache = cache
+        self.builtins = builtins or []
+        self._matches = []
+
+    def get_actions(self, command_name: str) -> List[str]:
+        """Action names from the usage text of the command, e.g. start, status and list for sb"""
+        command_class = self.commands.get(command_name)
+        if command_class is None:
+            return []
+
+        actions = set()
+        # usage lines look like 'torque (sb | sandbox) start <blueprint_name> [options]', the action is the word
+        # after the command names
+        for line in grammar_cache.get(command_class.__doc__).usage.splitlines():
+            words = line.split()
+            if len(words) < 2 or words[0] != "torque":
+                continue
+            position = 1
+            if words[position].startswith("("):
+                while position < len(words) - 1 and not words[position].endswith(")"):
+                    position += 1
+            position += 1
+            if position < len(words) and ACTION_PATTERN.match(words[position]):
+                actions.add(words[position])
+        return sorted(actions)
+
+    def get_completions(self, line: str, text: str) -> List[str]:
+        words = line.split()
+        if text:
+            # the word being completed is not finished yet
+            words = words[:-1]
+
+        if not words:
+            candidates = list(self.commands) + self.builtins
+        elif len(words) == 1:
+            candidates = self.get_actions(words[0])
+        elif len(words) >= 2 and words[1] in MULTIPLE_SANDBOX_IDS_ACTIONS:
+            candidates = [sandbox_id for sandbox_id in self.cache.sandbox_ids if sandbox_id not in words[2:]]
+        elif len(words) == 2 and words[1] in SANDBOX_ID_ACTIONS:
+            candidates = self.cache.sandbox_ids
+        elif len(words) == 2 and words[1] in BLUEPRINT_NAME_ACTIONS:
+            candidates = self.cache.blueprint_names
+        else:
+            candidates = []
+
+        return sorted(candidate for candidate in candidates if candidate.startswith(text))
+
+    def complete(self, text: str, state: int):
+        if state == 0:
+            import readline
+
+            self._matches = [f"{match} " for match in self.get_completions(readline.get_line_buffer(), text)]
+        return self._matches[state] if state < len(self._matches) else None
@@ -16,6 +16,13 @@ class TorqueConnectionProvider:
         self._args_parser = args_parser
 
     def get_connection(self) -> TorqueConnection:
+        try:
+            return self.load_connection()
+        except ConfigError as e:
+            raise DocoptExit(f"Unable to read Torque credentials. Reason: {e}")
+
+    def load_connection(self) -> TorqueConnection:
+        """Same as get_connection but raises ConfigError, for callers which are not the CLI"""
         # first try to get them as options or from env variable
         token = self._args_parser.token
         space = self._args_parser.space
@@ -27,13 +34,10 @@ class TorqueConnectionProvider:
             profile = self._args_parser.profile
             config_file = self._args_parser.get_config_path()
             logger.debug("Trying to obtain unset values from configuration file")
-            try:
-                torque_conn = TorqueConfigProvider(config_file).load_connection(profile)
-                token = token or torque_conn[TorqueConfigKeys.TOKEN]
-                space = space or torque_conn[TorqueConfigKeys.SPACE]
-                if TorqueConfigKeys.ACCOUNT in torque_conn:
-                    account = torque_conn[TorqueConfigKeys.ACCOUNT]
-            except ConfigError as e:
-                raise DocoptExit(f"Unable to read Torque credentials. Reason: {e}")
-
-        return TorqueConnection(token=token, space=space, account=account)
+            torque_conn = TorqueConfigProvider(config_file).load_connection(profile)
+            token = token or torque_conn[TorqueConfigKeys.TOKEN]
+            space = space or torque_conn[TorqueConfigKeys.SPACE]
+            if TorqueConfigKeys.ACCOUNT in torque_conn:
+                account = torque_conn[TorqueConfigKeys.ACCOUNT]
+
+        return TorqueConnection(token=token, space=space, account=account, pool_size=self._args_parser.pool_size)
@@ -2,7 +2,6 @@ import json
 import sys
 from typing import Any
 
-import tabulate
 from colorama import Style
 
 from torque.parsers.global_input_parser import GlobalInputParser
@@ -62,6 +61,8 @@ class OutputFormatter:
         return json.dumps(output, default=lambda x: x.json_serialize(), indent=True)
 
     def format_table(self, output: list) -> str:
+        import tabulate
+
         result_table = []
         for line in output:
             result_table.append(line.table_serialize() if callable(getattr(line, "json_serialize", None)) else line)
@@ -69,6 +70,8 @@ class OutputFormatter:
         return tabulate.tabulate(result_table, headers="keys")
 
     def format_object_default(self, output: Any) -> str:
+        import tabulate
+
         result_table = []
         for (k, v) in output.table_serialize().items():
             result_table.append([k, v])
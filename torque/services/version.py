@@ -1,43 +1,112 @@
+import json
 import logging
+import os
+import subprocess
+import sys
+import threading
+import time
 import traceback
+from pathlib import Path
 from typing import Dict, List
 
-import requests
-import semantic_version
-
 from torque.commands.base import BaseCommand
 
 logger = logging.getLogger(__name__)
 
+PYPI_PROJECT_URL = "https://pypi.org/pypi/torque-cli/json"
+VERSION_CACHE_PATH = "~/.torque/version.json"
+# PyPI is asked for the latest version at most once a day
+VERSION_CACHE_TTL = 24 * 60 * 60
+# hard limit of the background refresh
+VERSION_CHECK_TIMEOUT = 10
+
 
 class VersionCheckService:
-    def __init__(self, current_version):
+    """Tells the user about new releases without delaying commands
+
+    The latest version is read from a cache file, a stale cache is refreshed by a detached process whose result is
+    shown by the next command.
+    """
+
+    def __init__(self, current_version, cache_path: str = VERSION_CACHE_PATH, ttl: float = VERSION_CACHE_TTL):
         self.current_version = current_version
+        self.cache_path = Path(cache_path).expanduser()
+        self.ttl = ttl
 
     def check_for_new_version_safely(self):
         try:
-            # get latest version from pypi
-            response = requests.get("https://pypi.org/pypi/torque-cli/json")
-            pypi_project_info = response.json()
-            latest_release_info = pypi_project_info["info"]
-            latest_version = latest_release_info["version"]
-
-            try:
-                if semantic_version.Version(latest_version) > semantic_version.Version(self.current_version):
+            cached = self._read_cache()
+            latest_version = cached.get("latest_version")
+            if latest_version and latest_version != self.current_version:
+                if self._parse_version(latest_version) > self._parse_version(self.current_version):
                     self._show_new_version_message(latest_version)
-            except ValueError:
-                # we will get ValueError here if its a pre-release version
-                # in this case iterate all available releases to check latest version that is not pre-release
-                latest_version = self._find_latest_release(pypi_project_info)
 
-                if semantic_version.Version(latest_version) > semantic_version.Version(self.current_version):
-                    # latest version is bigger then current version so print nice message to user
-                    self._show_new_version_message(latest_version)
+            if time.time() - cached.get("checked_at", 0) > self.ttl:
+                # mark the cache as checked first, concurrent commands do not start more refreshes
+                self._write_cache(latest_version)
+                self._start_refresh()
 
         except Exception:
             logger.debug("Error checking latest version")
             logger.debug(traceback.format_exc())
 
+    def refresh_cache(self) -> None:
+        self._write_cache(self.get_latest_version())
+
+    def get_latest_version(self) -> str:
+        from torque.session import TorqueSession
+
+        # get latest version from pypi
+        with TorqueSession(pool_size=1) as session:
+            response = session.get(PYPI_PROJECT_URL, timeout=VERSION_CHECK_TIMEOUT)
+            response.raise_for_status()
+            pypi_project_info = response.json()
+        latest_version = pypi_project_info["info"]["version"]
+
+        try:
+            self._parse_version(latest_version)
+        except ValueError:
+            # we will get ValueError here if its a pre-release version
+            # in this case iterate all available releases to check latest version that is not pre-release
+            latest_version = self._find_latest_release(pypi_project_info)
+
+        return latest_version
+
+    def _start_refresh(self) -> None:
+        if os.name == "posix":
+            detach = {"start_new_session": True}
+        else:
+            detach = {"creationflags": subprocess.DETACHED_PROCESS}
+
+        subprocess.Popen(
+            [sys.executable, "-m", "torque.services.version", str(self.cache_path), self.current_version],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **detach,
+        )
+
+    def _read_cache(self) -> dict:
+        try:
+            with open(self.cache_path) as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, latest_version: str) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as cache_file:
+            json.dump({"latest_version": latest_version, "checked_at": time.time()}, cache_file)
+        os.replace(tmp_path, self.cache_path)
+
+    @staticmethod
+    def _parse_version(version: str):
+        import semantic_version
+
+        return semantic_version.Version(version)
+
     def _find_latest_release(self, pypi_project_info: Dict) -> str:
         """ Find latest not pre-release version """
         releases_info_dict = pypi_project_info["releases"]
@@ -51,7 +120,7 @@ class VersionCheckService:
                 continue
 
             try:
-                if semantic_version.Version(version) > semantic_version.Version(latest_version):
+                if self._parse_version(version) > self._parse_version(latest_version):
                     # current version in loop in bigger then latest_version
                     latest_version = version
             except ValueError:
@@ -71,3 +140,11 @@ Run 'pip install --upgrade torque-cli' to get the latest version
 ================================================================
 """
         BaseCommand([]).message(message)
+
+
+if __name__ == "__main__":
+    # detached cache refresh: python -m torque.services.version <cache_path> <current_version>
+    watchdog = threading.Timer(VERSION_CHECK_TIMEOUT, os._exit, args=(1,))
+    watchdog.daemon = True
+    watchdog.start()
+    VersionCheckService(sys.argv[2], cache_path=sys.argv[1]).refresh_cache()
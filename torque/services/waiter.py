@@ -7,6 +7,9 @@ from torque.branch.branch_context import ContextBranch
 from torque.branch.branch_utils import can_temp_branch_be_deleted, logger
 from torque.commands.base import BaseCommand
 from torque.constants import DEFAULT_TIMEOUT, FINAL_SB_STATUSES
+from torque.deadline import deadline
+from torque.exceptions import DeadlineExceededError
+from torque.profiler import profiler
 from torque.sandboxes import SandboxesManager
 
 
@@ -37,8 +40,9 @@ class Waiter(object):
             sandbox_start_wait_output(command, sandbox_id, context_branch.temp_branch_exists)
 
             spinner_class = NullSpinner if command.global_input_parser.output_json else yaspin
+            spinner = spinner_class(text="Starting...", color="yellow")
 
-            with spinner_class(text="Starting...", color="yellow") as spinner:
+            with deadline.stage("wait"), profiler.phase("wait"), spinner:
                 while (datetime.datetime.now() - start_time).seconds < timeout * 60:
                     if status in FINAL_SB_STATUSES:
                         spinner.green.ok("✔")
@@ -49,15 +53,19 @@ class Waiter(object):
                             spinner.green.ok("✔")
                             break
 
-                    time.sleep(5)
+                    time.sleep(deadline.cap(5, "wait"))
+                    # the budget may run out during the sleep, report it under wait rather than the next request
+                    deadline.check("wait")
                     spinner.text = f"[{int((datetime.datetime.now() - start_time).total_seconds())} sec]"
-                    sandbox = sb_manager.get(sandbox_id)
+                    sandbox = sb_manager.get(sandbox_id, refresh=True)
                     status = getattr(sandbox, "sandbox_status")
                 else:
                     logger.error(f"Timeout Reached - Sandbox {sandbox_id} was not active after {timeout} minutes")
                     return True
             return False
 
+        except DeadlineExceededError:
+            raise
         except Exception as e:
             logger.error(f"There was an issue with waiting for sandbox deployment -> {str(e)}")
 
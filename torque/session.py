@@ -1,12 +1,85 @@
+import threading
+import time
+
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util import make_headers
+
+from torque.constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_POOL_SIZE, DEFAULT_READ_TIMEOUT
+
+# time spent opening a new connection (DNS + TCP + TLS) by the last request made in the current thread
+connect_timings = threading.local()
+
+
+def reset_connect_time() -> None:
+    connect_timings.last = 0.0
+
+
+def get_connect_time() -> float:
+    return getattr(connect_timings, "last", 0.0)
+
+
+class TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super(TimedHTTPConnection, self).connect()
+        finally:
+            connect_timings.last = time.perf_counter() - start
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super(TimedHTTPSConnection, self).connect()
+        finally:
+            connect_timings.last = time.perf_counter() - start
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TorqueHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter which measures how long it takes to open new connections"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(TorqueHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
 
 
 class TorqueSession(Session):
-    def __init__(self):
-        """Creates new Torque Session"""
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ):
+        """Creates new Torque Session backed by a pool of keep-alive connections"""
         super(TorqueSession, self).__init__()
 
-        self.headers.update({"Accept": "application/json", "Accept-Charset": "utf-8"})
+        self.headers.update({"Accept": "application/json", "Accept-Charset": "utf-8", "Connection": "keep-alive"})
+        # gzip and deflate are always supported, brotli is added when the brotli package is installed
+        self.headers.update({"Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"]})
+        self.timeout = (connect_timeout, read_timeout)
+
+        # pool_block makes pool_size a hard cap on open sockets per host: extra threads wait for a free
+        # connection instead of opening throwaway ones
+        adapter = TorqueHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super(TorqueSession, self).request(method, url, **kwargs)
 
     def init_bearer_auth(self, token: str) -> None:
         """
@@ -1,6 +1,7 @@
 """
 Usage: torque [--space=<space>] [--token=<token>] [--account=<account>] [--profile=<profile>] [--help] [--debug]
-               [--disable-version-check] <command> [<args>...]
+               [--disable-version-check] [--pool-size=<size>] [--timings] [--deadline=<seconds>]
+               [--profiler=<mode>] [--profiler-summary] <command> [<args>...]
 
 Options:
   -h --help                 Show this screen.
@@ -20,40 +21,119 @@ Options:
 
   --disable-version-check   Do not check whether a new version of torque is available for download.
 
+  --pool-size=<size>        Maximum number of keep-alive connections the CLI keeps open to Torque
+                            (default is 10). Can also be set with the TORQUE_POOL_SIZE environment variable.
+
+  --timings                 Print a latency breakdown of all HTTP calls made by the command to stderr on exit.
+
+  --deadline=<seconds>      End-to-end time budget of the command. Git operations, every HTTP request and waiting
+                            for a sandbox get the time that is left, the command fails once it is spent.
+
+  --profiler=<mode>         Profile the command and write a cProfile pstats file and a per-phase time breakdown
+                            to ~/.torque/profiles. Mode is cpu (whole run) or startup (until the command starts).
+
+  --profiler-summary        Print the per-phase time breakdown and the slowest functions to stderr on exit.
+                            Profiles in cpu mode unless --profiler is given.
+
 Commands:
     bp, blueprint       validate torque blueprints
     sb, sandbox         start sandbox, end sandbox and get its status
     configure           set, list and remove connection profiles to torque
+    daemon              start, stop and check a background agent which keeps connections warm between commands
+    shell               run commands from an interactive prompt with completion of sandbox ids and blueprint names
+    batch               run the commands of a file in one process, some of them at the same time
 """
+import atexit
+import importlib
 import logging
+import os
 import sys
 
-import pkg_resources
 from colorama import init
-from docopt import DocoptExit, docopt
+from docopt import DocoptExit
 
-from torque.commands import bp, configure, sb
+from torque import daemon, timings
+from torque.deadline import deadline
+from torque.exceptions import DeadlineExceededError
 from torque.models.connection import TorqueConnection
+from torque.parsers.docopt_cache import docopt
 from torque.parsers.global_input_parser import GlobalInputParser
+from torque.profiler import profiler
 from torque.services.connection import TorqueConnectionProvider
-from torque.services.version import VersionCheckService
 
 logger = logging.getLogger(__name__)
 
+# command classes are imported on first use, a command only loads the modules (git, requests...) it needs
 commands_table = {
-    "bp": bp.BlueprintsCommand,
-    "blueprint": bp.BlueprintsCommand,
-    "sb": sb.SandboxesCommand,
-    "sandbox": sb.SandboxesCommand,
-    "configure": configure.ConfigureCommand,
+    "bp": "torque.commands.bp.BlueprintsCommand",
+    "blueprint": "torque.commands.bp.BlueprintsCommand",
+    "sb": "torque.commands.sb.SandboxesCommand",
+    "sandbox": "torque.commands.sb.SandboxesCommand",
+    "configure": "torque.commands.configure.ConfigureCommand",
+    "daemon": "torque.commands.daemon.DaemonCommand",
+    "shell": "torque.commands.repl.ReplCommand",
+    "batch": "torque.commands.batch.BatchCommand",
 }
 
 
+# commands which run other commands in their process (shell, batch, daemon), they can't be run by one of them
+RUNNER_COMMANDS = ["shell", "batch", "daemon"]
+# commands which don't talk to Torque and get no client
+LOCAL_COMMANDS = ["configure"]
+
+
+def load_command(command_name: str) -> type:
+    module_name, class_name = commands_table[command_name].rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def load_runnable_commands() -> dict:
+    """Command classes by name which the shell, a batch or the daemon can run"""
+    return {name: load_command(name) for name in commands_table if name not in RUNNER_COMMANDS}
+
+
+def run_command(argv: list, connection: TorqueConnection = None, client=None, repo_cache=None) -> int:
+    """Runs a command in the current process with a shared client and repo cache, returns its exit code
+
+    Usage errors and help are written to stderr and stdout instead of exiting, other errors are raised.
+    """
+    try:
+        command_class = load_command(argv[0])
+        if argv[0] in LOCAL_COMMANDS:
+            command = command_class(argv)
+        else:
+            command = command_class(argv, connection, client=client, repo_cache=repo_cache)
+        return 0 if command.execute() else 1
+    except SystemExit as e:
+        return get_exit_code(e)
+
+
+def get_exit_code(e: SystemExit) -> int:
+    # docopt exits with the usage as message and shows help with exit code 0
+    if isinstance(e.code, str):
+        sys.stderr.write(f"{e.code}\n")
+        return 1
+    return e.code or 0
+
+
+def get_version() -> str:
+    try:
+        from importlib.metadata import version
+    except ImportError:
+        # python < 3.8, pkg_resources is much slower to import
+        import pkg_resources
+
+        return pkg_resources.get_distribution("torque-cli").version
+
+    return version("torque-cli")
+
+
 class BootstrapHelper:
     @staticmethod
     def is_help_message_requested(input_parser: GlobalInputParser) -> bool:
         if not input_parser.command_args:
-            return True
+            # 'torque shell' takes no arguments
+            return not BootstrapHelper.is_repl_mode(input_parser)
 
         return "--help" in input_parser.command_args or "-h" in input_parser.command_args
 
@@ -79,42 +159,113 @@ class BootstrapHelper:
     def is_config_mode(input_parser: GlobalInputParser) -> bool:
         return input_parser.command == "configure"
 
+    @staticmethod
+    def is_daemon_mode(input_parser: GlobalInputParser) -> bool:
+        return input_parser.command == "daemon"
+
+    @staticmethod
+    def is_repl_mode(input_parser: GlobalInputParser) -> bool:
+        return input_parser.command == "shell"
+
     @staticmethod
     def should_get_connection_params(input_parser: GlobalInputParser) -> bool:
-        return not BootstrapHelper.is_help_message_requested(input_parser) and not BootstrapHelper.is_config_mode(
-            input_parser
+        return not (
+            BootstrapHelper.is_help_message_requested(input_parser)
+            or BootstrapHelper.is_config_mode(input_parser)
+            or BootstrapHelper.is_daemon_mode(input_parser)
         )
 
 
 def main():
     # Colorama init for colored output
     init()
-    version = pkg_resources.get_distribution("torque-cli").version
+    version = get_version()
     args = docopt(__doc__, options_first=True, version=version)
     input_parser = GlobalInputParser(args)
 
+    if input_parser.profiler:
+        profiler.start(input_parser.profiler)
+        atexit.register(save_profile, input_parser.profiler_summary)
+
+    if input_parser.deadline:
+        deadline.start(input_parser.deadline)
+
     # Check for new version
     if not input_parser.disable_version_check:
-        VersionCheckService(version).check_for_new_version_safely()
+        with profiler.phase("version check"):
+            from torque.services.version import VersionCheckService
+
+            VersionCheckService(version).check_for_new_version_safely()
 
     level = logging.DEBUG if input_parser.debug else logging.WARNING
     logging.basicConfig(format="%(levelname)s - %(message)s", level=level)
 
+    if daemon.should_forward(input_parser) and os.path.exists(daemon.get_socket_path()):
+        exit_code = daemon.DaemonClient().run(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    if input_parser.timings:
+        timings.recorder.enable()
+        atexit.register(print_timings)
+
     # Validate command
     BootstrapHelper.validate_command(input_parser.command)
 
     # Take auth parameters
-    conn = BootstrapHelper.get_connection_params(input_parser)
+    with profiler.phase("config"):
+        conn = BootstrapHelper.get_connection_params(input_parser)
 
     argv = [input_parser.command] + input_parser.command_args
 
-    command_class = commands_table[input_parser.command]
+    with profiler.phase("imports"):
+        command_class = load_command(input_parser.command)
     command = command_class(argv, conn)
-    result = command.execute()
+    if command.should_warm_up():
+        # overlap the TLS handshake with the git work the command starts with
+        command.client.warm_up()
+
+    if profiler.enabled:
+        profiler.startup_finished()
+
+    try:
+        result = command.execute()
+    except DeadlineExceededError as e:
+        logger.error(str(e))
+        result = False
+
+    if deadline.exceeded_stage:
+        sys.stderr.write(f"{deadline.format_report()}\n")
+        result = False
+
+    if command.manager:
+        logger.debug(f"Request memo stats: {command.manager.memo.stats}")
+
+    if command.manager and command.manager.cache:
+        logger.debug(f"Response cache stats: {command.manager.cache.stats}")
+
+    if command.manager and command.manager.client.hedging_policy:
+        logger.debug(f"Hedged requests stats: {command.manager.client.hedging_policy.stats}")
 
     exit(result)
 
 
+def print_timings() -> None:
+    sys.stderr.write(f"\n{timings.recorder.format_summary()}\n")
+
+
+def save_profile(print_summary: bool) -> None:
+    profiler.stop()
+    try:
+        path = profiler.save()
+        sys.stderr.write(f"\nProfile written to {path}.pstats and {path}.phases.txt\n")
+    except OSError as e:
+        sys.stderr.write(f"\nUnable to write profile: {e}\n")
+
+    if print_summary:
+        sys.stderr.write(f"\n{profiler.format_summary()}\n")
+
+
 def exit(run_result) -> None:
     if not run_result:
         sys.exit(1)
@@ -0,0 +1,80 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Incrementally decodes a top-level JSON array and yields its elements one at a time
+
+    Only the not yet consumed part of the document is kept in memory, so peak memory is bound by the size of a
+    single element rather than the size of the whole body.
+    """
+    decoder = json.JSONDecoder()
+    utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    started = False
+    expect_separator = False
+    after_separator = False
+    chunks = iter(chunks)
+    eof = False
+
+    while True:
+        pos = _skip_whitespace(buffer, 0)
+
+        if not started and pos < len(buffer):
+            if buffer[pos] != "[":
+                raise ValueError("Expected JSON array")
+            started = True
+            pos = _skip_whitespace(buffer, pos + 1)
+
+        while started and pos < len(buffer):
+            if buffer[pos] == "]" and not after_separator:
+                return
+
+            if expect_separator:
+                if buffer[pos] != ",":
+                    raise ValueError(f"Expected ',' or ']' but got '{buffer[pos]}'")
+                pos = _skip_whitespace(buffer, pos + 1)
+                expect_separator = False
+                after_separator = True
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise ValueError("Malformed JSON array")
+                # element is not complete yet
+                break
+
+            # a number split between chunks (e.g. "1." + "5") decodes successfully, so an element is only
+            # complete once the following delimiter has been received
+            if not eof and (end == len(buffer) or buffer[end] not in _DELIMITERS):
+                break
+
+            yield item
+            expect_separator = True
+            after_separator = False
+            pos = _skip_whitespace(buffer, end)
+
+        buffer = buffer[pos:]
+
+        if eof:
+            raise ValueError("Unexpected end of JSON array")
+
+        try:
+            buffer += utf8_decoder.decode(next(chunks))
+        except StopIteration:
+            buffer += utf8_decoder.decode(b"", final=True)
+            eof = True
+
+
+def _skip_whitespace(buffer: str, pos: int) -> int:
+    while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+        pos += 1
+    return pos
@@ -0,0 +1,150 @@
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, List
+from urllib.parse import urlparse
+
+_ENDPOINT_PATTERNS = [
+    (re.compile(r"/accounts/[^/]+/"), "/accounts/{account}/"),
+    (re.compile(r"/spaces/[^/]+/"), "/spaces/{space}/"),
+    (re.compile(r"/(sandbox|sandboxes)/[^/]+"), r"/\1/{sandbox_id}"),
+    (re.compile(r"/catalog/[^/]+"), "/catalog/{blueprint_name}"),
+]
+
+
+def endpoint_template(url: str) -> str:
+    """Replaces identifiers in the URL path with placeholders so calls to the same endpoint can be grouped"""
+    path = urlparse(url).path
+    for pattern, replacement in _ENDPOINT_PATTERNS:
+        path = pattern.sub(replacement, path)
+    return path
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class RequestTiming(object):
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        status: int,
+        size: int,
+        connect_time: float,
+        ttfb: float,
+        total_time: float,
+    ):
+        self.method = method
+        self.endpoint = endpoint
+        self.status = status
+        self.size = size
+        self.connect_time = connect_time
+        self.ttfb = ttfb
+        self.total_time = total_time
+
+
+class StageTimer(object):
+    """Time spent per stage of a run
+
+    Time is attributed to the innermost running stage of a thread, so a stage running inside another one (e.g. HTTP
+    calls made while waiting) is not counted twice.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.totals = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def stage(self, name: str):
+        stack = self._local.__dict__.setdefault("stack", [])
+        now = self.clock()
+        if stack:
+            self._add(stack[-1][0], now - stack[-1][1])
+        stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = self.clock()
+            _, entered_at = stack.pop()
+            self._add(name, now - entered_at)
+            if stack:
+                stack[-1][1] = now
+
+    def items(self) -> list:
+        with self._lock:
+            return list(self.totals.items())
+
+    def _add(self, stage: str, spent: float) -> None:
+        with self._lock:
+            self.totals[stage] = self.totals.get(stage, 0.0) + spent
+
+
+class TimingsRecorder(object):
+    """Collects per-request latency breakdown of HTTP calls made through TorqueClient"""
+
+    def __init__(self):
+        self.enabled = False
+        self.records: List[RequestTiming] = []
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def record(self, timing: RequestTiming) -> None:
+        with self._lock:
+            self.records.append(timing)
+
+    def summary(self) -> List[OrderedDict]:
+        groups = OrderedDict()
+        with self._lock:
+            for timing in self.records:
+                groups.setdefault((timing.method, timing.endpoint), []).append(timing)
+
+        result = []
+        for (method, endpoint), timings in groups.items():
+            statuses = OrderedDict()
+            for timing in timings:
+                statuses[timing.status] = statuses.get(timing.status, 0) + 1
+
+            total_times = [t.total_time for t in timings]
+            ttfbs = [t.ttfb for t in timings]
+            item = OrderedDict()
+            item["method"] = method
+            item["endpoint"] = endpoint
+            item["calls"] = len(timings)
+            item["status"] = ", ".join(f"{status or 'error'}x{count}" for status, count in statuses.items())
+            item["bytes"] = sum(t.size for t in timings)
+            item["connect"] = round(sum(t.connect_time for t in timings), 3)
+            item["ttfb_p50"] = round(percentile(ttfbs, 50), 3)
+            item["ttfb_p95"] = round(percentile(ttfbs, 95), 3)
+            item["total_p50"] = round(percentile(total_times, 50), 3)
+            item["total_p95"] = round(percentile(total_times, 95), 3)
+            result.append(item)
+
+        return result
+
+    def format_summary(self) -> str:
+        import tabulate
+
+        summary = self.summary()
+        if not summary:
+            return "No HTTP requests were made"
+
+        total = sum(t.total_time for t in self.records)
+        table = tabulate.tabulate(summary, headers="keys")
+        return f"{table}\n\n{len(self.records)} requests, {total:.3f} sec in total (times in seconds)"
+
+
+# process wide recorder, enabled with the --timings option
+recorder = TimingsRecorder()
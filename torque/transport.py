@@ -0,0 +1,180 @@
+import datetime
+import os
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from torque.constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_POOL_SIZE, DEFAULT_READ_TIMEOUT
+from torque.session import TorqueSession
+
+
+def _import_httpx():
+    """httpx is optional and slow to import, it is only loaded once the HTTP/2 transport is used"""
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("HTTP/2 transport requires httpx, install it with 'pip install torque-cli[http2]'")
+    return httpx
+
+
+class Transport(object):
+    """Interface of the HTTP backends TorqueClient sends requests through
+
+    Backends return requests.Response objects and raise requests exceptions, so retries, streaming and error
+    handling in the client do not depend on the backend. TorqueSession is the default requests based backend.
+    """
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        raise NotImplementedError
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def init_bearer_auth(self, token: str) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class Http2Transport(Transport):
+    """httpx based backend multiplexing concurrent requests over a single HTTP/2 connection
+
+    HTTP/2 is negotiated with ALPN for https urls, http1=False forces HTTP/2 with prior knowledge.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        http1: bool = True,
+    ):
+        httpx = _import_httpx()
+        self.headers = {"Accept": "application/json", "Accept-Charset": "utf-8"}
+        self._client = httpx.Client(
+            http1=http1,
+            http2=True,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+
+    def init_bearer_auth(self, token: str) -> None:
+        self.headers["Authorization"] = f"Bearer {token}"
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict = None,
+        data: bytes = None,
+        json: dict = None,
+        headers: dict = None,
+        stream: bool = False,
+        timeout=None,
+    ) -> requests.Response:
+        httpx = _import_httpx()
+        request_headers = dict(self.headers)
+        request_headers.update(headers or {})
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+        request = self._client.build_request(
+            method,
+            url,
+            params=params,
+            content=data,
+            json=json,
+            headers=request_headers,
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+        )
+
+        start = time.perf_counter()
+        try:
+            response = self._client.send(request, stream=True)
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(str(e))
+        except httpx.TimeoutException as e:
+            raise requests.ReadTimeout(str(e))
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e))
+
+        return self._convert_response(response, stream, time.perf_counter() - start)
+
+    def close(self) -> None:
+        self._client.close()
+
+    @staticmethod
+    def _convert_response(response, stream: bool, elapsed: float) -> requests.Response:
+        httpx = _import_httpx()
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.headers = CaseInsensitiveDict(response.headers)
+        result.url = str(response.url)
+        result.encoding = response.encoding
+        result.elapsed = datetime.timedelta(seconds=elapsed)
+        result.raw = _RawStream(response)
+        if not stream:
+            try:
+                result._content = response.read()
+                result._content_consumed = True
+            except httpx.TransportError as e:
+                raise requests.ConnectionError(str(e))
+            finally:
+                response.close()
+        return result
+
+
+class _RawStream(object):
+    """Exposes an httpx response body the way requests.Response.iter_content reads urllib3 responses"""
+
+    def __init__(self, response):
+        self._response = response
+
+    def stream(self, chunk_size: int, decode_content: bool = True):
+        httpx = _import_httpx()
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e))
+
+    def tell(self) -> int:
+        return self._response.num_bytes_downloaded
+
+    def close(self) -> None:
+        self._response.close()
+
+
+TRANSPORTS = {"requests": TorqueSession, "http2": Http2Transport}
+
+
+def create_transport(name: str = None, pool_size: int = DEFAULT_POOL_SIZE):
+    """Creates the HTTP backend selected by name or the TORQUE_TRANSPORT environment variable
+
+    TORQUE_REPLAY=path answers requests from a recorded cassette instead, TORQUE_RECORD=path records all traffic of
+    the selected backend to a cassette.
+    """
+    from torque.cassette import RecordingTransport, ReplayTransport
+
+    if os.environ.get("TORQUE_REPLAY"):
+        return ReplayTransport(os.environ["TORQUE_REPLAY"], speed=os.environ.get("TORQUE_REPLAY_SPEED", "recorded"))
+
+    name = name or os.environ.get("TORQUE_TRANSPORT") or "requests"
+    if name not in TRANSPORTS:
+        raise ValueError(f"Unknown transport '{name}', supported transports are: {', '.join(TRANSPORTS)}")
+
+    transport = TRANSPORTS[name](pool_size=pool_size)
+    if os.environ.get("TORQUE_RECORD"):
+        return RecordingTransport(transport, os.environ["TORQUE_RECORD"])
+    return transport
@@ -135,6 +135,34 @@ class BlueprintRepo(Repo):
         return not (self.is_dirty() or self.untracked_files or not self.is_current_branch_synced())
 
 
+class BlueprintRepoCache(object):
+    """Keeps opened blueprint repos by working directory, a repo is opened again once its blueprints dir changes"""
+
+    def __init__(self):
+        self._repos = {}
+
+    def get(self, path: str) -> BlueprintRepo:
+        cached = self._repos.get(path)
+        if cached is not None:
+            repo, mtime = cached
+            if self._get_blueprints_mtime(repo) == mtime:
+                return repo
+
+        repo = BlueprintRepo(path)
+        self._repos[path] = (repo, self._get_blueprints_mtime(repo))
+        return repo
+
+    def __len__(self) -> int:
+        return len(self._repos)
+
+    @staticmethod
+    def _get_blueprints_mtime(repo: BlueprintRepo) -> float:
+        try:
+            return os.stat(os.path.join(repo.working_dir, repo.bp_dir)).st_mtime
+        except OSError:
+            return None
+
+
 def parse_comma_separated_string(params_string: str = None) -> dict:
     res = {}
 
@@ -1,7 +1,5 @@
 from collections import OrderedDict
 
-import tabulate
-
 from torque.constants import TorqueConfigKeys
 from torque.view.view_helper import mask_token
 
@@ -11,6 +9,8 @@ class ConfigureListView:
         self.config = config
 
     def render(self):
+        import tabulate
+
         if not self.config:
             return "Config file is empty. Use 'torque configure set' to configure Torque CLI."
 